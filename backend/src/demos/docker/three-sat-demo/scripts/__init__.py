@@ -3,29 +3,59 @@ SAT Solver Demo Module
 
 This module provides a demonstration of SAT solving algorithms,
 specifically focusing on the DPLL (Davis-Putnam-Logemann-Loveland) algorithm
-for solving Boolean satisfiability problems.
+and conflict-driven clause learning (CDCL) for solving Boolean satisfiability
+problems.
+
+Submodules are imported on first attribute access, so `python -m
+scripts.entrypoint` only loads what the requested solve needs.
 """
 
-from .utils import Formula, RandomFormulaGenerator, FormulaError
-from .stats import (
-    SolverStatistics, 
-    DPLLStatistics, 
-    StatisticsAnalyzer,
-    create_solver_statistics
-)
-from .solver import DPLLSolver, RandomSATSolver, ExhaustiveSATSolver
-
-__all__ = [
-    'Formula',
-    'RandomFormulaGenerator',
-    'FormulaError',
-    'DPLLSolver',
-    'RandomSATSolver',
-    'ExhaustiveSATSolver',
-    'SolverStatistics',
-    'DPLLStatistics',
-    'StatisticsAnalyzer',
-    'create_solver_statistics'
-]
-
-__version__ = '1.0.0'
\ No newline at end of file
+from importlib import import_module
+
+_EXPORTS = {
+    'Formula': '.utils',
+    'PackedFormula': '.utils',
+    'RandomFormulaGenerator': '.utils',
+    'FormulaError': '.utils',
+    'FormulaPreprocessor': '.utils',
+    'DPLLSolver': '.solver',
+    'CDCLSolver': '.solver',
+    'RandomSATSolver': '.solver',
+    'ExhaustiveSATSolver': '.solver',
+    'BranchingHeuristic': '.branching',
+    'PortfolioSolver': '.portfolio',
+    'CubeAndConquerSolver': '.cubes',
+    'SolveBudget': '.budget',
+    'SolveStatus': '.budget',
+    'CancellationToken': '.budget',
+    'AsyncSolverPool': '.aio',
+    'SolveResult': '.aio',
+    'solve_async': '.aio',
+    'solve_many_async': '.aio',
+    'SolverStatistics': '.stats',
+    'DPLLStatistics': '.stats',
+    'CDCLStatistics': '.stats',
+    'StatisticsAnalyzer': '.stats',
+    'create_solver_statistics': '.stats',
+    'ResultCache': '.cache',
+    'read_dimacs': '.dimacs',
+    'write_dimacs': '.dimacs',
+    'PhaseTransitionSweep': '.sweep',
+}
+
+__all__ = list(_EXPORTS)
+
+__version__ = '1.0.0'
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
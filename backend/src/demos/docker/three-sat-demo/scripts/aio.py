@@ -0,0 +1,346 @@
+"""
+asyncio facade: await solves that run in a process pool.
+
+An AsyncSolverPool bounds how many solves run at once with a semaphore, so
+callers beyond that wait without blocking the event loop. solve_many keeps
+at most `max_pending` solves in flight and reads its input only as they
+finish, so a long or endless stream of formulas is never queued all at once.
+
+Each running solve owns a slot in a flag array shared with the workers.
+Cancelling the awaiting task sets its flag; the solver's budget token reads
+the flag, so the search stops at its next check, frees the worker and
+releases the slot. A timeout becomes the budget's timeout, and a solve that
+runs out of it returns status UNKNOWN rather than raising.
+
+    async with AsyncSolverPool(max_workers=4) as pool:
+        result = await pool.solve(formula, "cdcl", timeout=2.0)
+        async for index, result in pool.solve_many(formulas, timeout=1.0):
+            ...
+
+`solve_async` and `solve_many_async` use a shared pool created on first use.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+)
+
+from .budget import CancellationToken, SolveBudget, SolveStatus
+from .solver import SOLVERS
+from .utils import Formula, FormulaError, PackedFormula
+
+Formulas = Union[
+    Iterable[Union[Formula, PackedFormula]], AsyncIterable[Union[Formula, PackedFormula]]
+]
+
+
+@dataclass
+class SolveResult:
+    """Outcome of one solve, as it comes back from the worker"""
+
+    status: SolveStatus
+    assignment: Optional[Dict[int, bool]]
+    stop_reason: Optional[str] = None
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    steps: List[dict] = field(default_factory=list)
+    time_ms: float = 0.0
+
+    @property
+    def satisfiable(self) -> bool:
+        return self.status is SolveStatus.SAT
+
+
+# Cancellation flags shared with this worker process, one per pool slot
+_FLAGS = None
+
+
+def _init_worker(flags) -> None:
+    global _FLAGS
+    _FLAGS = flags
+
+
+class _SlotToken(CancellationToken):
+    """Token of a solve in a worker process; the pool cancels it through the slot's flag"""
+
+    def __init__(self, slot: int):
+        super().__init__()
+        self._slot = slot
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or _FLAGS[self._slot] != 0
+
+
+def _solve(
+    formula: Union[Formula, PackedFormula],
+    solver_name: str,
+    options: Dict[str, Any],
+    budget: SolveBudget,
+) -> SolveResult:
+    """Solve one formula and verify any model before it is reported"""
+    try:
+        solver = SOLVERS[solver_name](budget=budget, **options)
+    except TypeError as e:
+        raise ValueError(f"Invalid solver options: {str(e)}")
+    start = time.perf_counter()
+    assignment = solver.solve(formula)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if assignment is not None and not formula.is_satisfied_by(assignment):
+        raise FormulaError("Solver returned an assignment that does not satisfy the formula")
+    return SolveResult(
+        status=solver.status,
+        assignment=assignment,
+        stop_reason=solver.stop_reason,
+        statistics=solver.get_statistics(),
+        steps=solver.get_solving_steps(),
+        time_ms=elapsed_ms,
+    )
+
+
+def _solve_in_process(
+    formula: Union[Formula, PackedFormula],
+    solver_name: str,
+    options: Dict[str, Any],
+    limits: Dict[str, Any],
+    slot: int,
+) -> SolveResult:
+    """Pool task: solve under the slot's cancellation flag"""
+    return _solve(formula, solver_name, options, SolveBudget(token=_SlotToken(slot), **limits))
+
+
+async def _iterate(formulas: Formulas) -> AsyncIterator[Union[Formula, PackedFormula]]:
+    """Iterate a plain or an async iterable of formulas"""
+    if hasattr(formulas, "__aiter__"):
+        async for formula in formulas:
+            yield formula
+    else:
+        for formula in formulas:
+            yield formula
+
+
+class AsyncSolverPool:
+    """Run solves in worker processes from asyncio with bounded concurrency"""
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 max_concurrency: Optional[int] = None):
+        if max_workers is not None and max_workers < 0:
+            raise ValueError("max_workers must be non-negative")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        self.max_workers = max_workers
+        # 0 workers solves on threads in this process, which suits small instances
+        workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.max_concurrency = max_concurrency or max(workers, 1)
+        self._executor: Optional[Executor] = None
+        self._flags = None
+        self._tokens: List[CancellationToken] = [
+            CancellationToken() for _ in range(self.max_concurrency)
+        ]
+        self._free = list(range(self.max_concurrency))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncSolverPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop running solves and shut the workers down"""
+        self._closed = True
+        for slot in range(self.max_concurrency):
+            self._cancel(slot)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _bind(self) -> asyncio.Semaphore:
+        """The semaphore of the running loop; one is made per loop the pool is used from"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if len(self._free) < self.max_concurrency:
+                raise RuntimeError("Pool is still solving on another event loop")
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _start(self) -> Executor:
+        """Create the executor on first use"""
+        if self._closed:
+            raise RuntimeError("Pool is closed")
+        if self._executor is None:
+            if self.max_workers == 0:
+                self._executor = ThreadPoolExecutor(self.max_concurrency)
+            else:
+                import multiprocessing
+
+                context = multiprocessing.get_context()
+                self._flags = context.RawArray("b", self.max_concurrency)
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers, mp_context=context,
+                    initializer=_init_worker, initargs=(self._flags,),
+                )
+        return self._executor
+
+    def _cancel(self, slot: int) -> None:
+        if self._flags is not None:
+            self._flags[slot] = 1
+        self._tokens[slot].cancel()
+
+    def _submit(self, formula: Union[Formula, PackedFormula], solver_name: str,
+                options: Dict[str, Any], limits: Dict[str, Any], slot: int) -> Future:
+        """Hand a solve to the executor under a fresh cancellation flag for the slot"""
+        executor = self._start()
+        if self._flags is not None:
+            self._flags[slot] = 0
+            return executor.submit(_solve_in_process, formula, solver_name, options, limits, slot)
+        self._tokens[slot] = CancellationToken()
+        budget = SolveBudget(token=self._tokens[slot], **limits)
+        return executor.submit(_solve, formula, solver_name, options, budget)
+
+    def _release(self, slot: int, semaphore: asyncio.Semaphore) -> None:
+        self._free.append(slot)
+        semaphore.release()
+
+    async def solve(
+        self,
+        formula: Union[Formula, PackedFormula],
+        solver: str = "dpll",
+        *,
+        timeout: Optional[float] = None,
+        budget: Optional[SolveBudget] = None,
+        **options: Any,
+    ) -> SolveResult:
+        """
+        Solve one formula in the pool, waiting for a free slot first. The
+        timeout bounds the solve itself; wrap the call in asyncio.wait_for to
+        bound the wait as well, since cancelling stops the solve too.
+        """
+        solver_name = str(solver).lower()
+        if solver_name not in SOLVERS:
+            raise ValueError(f"Solver must be one of: {', '.join(SOLVERS)}")
+        if budget is not None and budget.token is not None:
+            raise ValueError("Pool solves are cancelled by cancelling the awaiting task, not a token")
+        limits = budget.limits() if budget is not None else {}
+        if timeout is not None:
+            limits["timeout"] = timeout
+        # Invalid limits fail here rather than in a worker
+        SolveBudget(**limits)
+
+        semaphore = self._bind()
+        await semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        slot = self._free.pop()
+        try:
+            future = self._submit(formula, solver_name, options, limits, slot)
+        except BaseException:
+            self._release(slot, semaphore)
+            raise
+
+        def release(_: Future) -> None:
+            # The slot is reused only once the worker is done with it
+            try:
+                loop.call_soon_threadsafe(self._release, slot, semaphore)
+            except RuntimeError:
+                pass  # The loop is gone, and the semaphore with it
+
+        future.add_done_callback(release)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            self._cancel(slot)
+            raise
+
+    async def solve_many(
+        self,
+        formulas: Formulas,
+        solver: str = "dpll",
+        *,
+        timeout: Optional[float] = None,
+        budget: Optional[SolveBudget] = None,
+        max_pending: Optional[int] = None,
+        **options: Any,
+    ) -> AsyncIterator[Tuple[int, SolveResult]]:
+        """
+        Yield (index, result) pairs as solves finish. At most `max_pending`
+        solves are in flight, twice the concurrency by default; closing the
+        iterator early cancels the rest.
+        """
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be positive")
+        limit = max_pending or 2 * self.max_concurrency
+
+        async def indexed(index: int, formula) -> Tuple[int, SolveResult]:
+            return index, await self.solve(
+                formula, solver, timeout=timeout, budget=budget, **options
+            )
+
+        source = _iterate(formulas)
+        pending = set()
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        formula = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(indexed(index, formula)))
+                    index += 1
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+_DEFAULT_POOL: Optional[AsyncSolverPool] = None
+
+
+def _default_pool() -> AsyncSolverPool:
+    global _DEFAULT_POOL
+    if _DEFAULT_POOL is None:
+        _DEFAULT_POOL = AsyncSolverPool()
+    return _DEFAULT_POOL
+
+
+async def solve_async(
+    formula: Union[Formula, PackedFormula],
+    solver: str = "dpll",
+    *,
+    timeout: Optional[float] = None,
+    budget: Optional[SolveBudget] = None,
+    **options: Any,
+) -> SolveResult:
+    """Solve one formula in the shared pool"""
+    return await _default_pool().solve(
+        formula, solver, timeout=timeout, budget=budget, **options
+    )
+
+
+async def solve_many_async(
+    formulas: Formulas,
+    solver: str = "dpll",
+    *,
+    timeout: Optional[float] = None,
+    budget: Optional[SolveBudget] = None,
+    max_pending: Optional[int] = None,
+    **options: Any,
+) -> AsyncIterator[Tuple[int, SolveResult]]:
+    """Solve a stream of formulas in the shared pool, yielding (index, result) as they finish"""
+    async for item in _default_pool().solve_many(
+        formulas, solver, timeout=timeout, budget=budget, max_pending=max_pending, **options
+    ):
+        yield item
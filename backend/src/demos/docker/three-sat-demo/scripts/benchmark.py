@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmarks for the solvers, the simplifier and the generator.
+
+Each case runs over a grid of variable counts and clause ratios on fixed
+seeds and records time, peak memory and search steps. Times are the median
+of repeated runs, with their spread. Reports are JSON, and a stored report
+can serve as the baseline for a regression check:
+
+    python -m scripts.benchmark --output baseline.json
+    python -m scripts.benchmark --compare baseline.json --threshold 0.15
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .solver import DPLLSolver, ExhaustiveSATSolver, RandomSATSolver
+from .utils import Formula, FormulaSimplifier, RandomFormulaGenerator
+
+DEFAULT_VARIABLES = (10, 20, 40)
+DEFAULT_RATIOS = (3.0, 4.26, 5.0)
+DEFAULT_SEEDS = (0, 1, 2, 3, 4)
+QUICK_VARIABLES = (10, 20)
+QUICK_SEEDS = (0, 1)
+
+# Exhaustive search tries up to 2^n assignments; larger n is skipped
+EXHAUSTIVE_MAX_VARIABLES = 16
+
+# Metrics compared against a baseline; steps are deterministic for fixed seeds
+COMPARED_METRICS = ("time_ms", "peak_kib", "steps")
+
+# Timing differences within this many median absolute deviations of the
+# baseline and current runs are treated as noise
+NOISE_MADS = 3.0
+
+
+def _formula(n: int, ratio: float, seed: int) -> Formula:
+    return RandomFormulaGenerator().generate(n, int(n * ratio), seed)
+
+
+def _bench_generator(n: int, ratio: float, seed: int) -> Tuple[Callable[[], Any], Callable[[Any], Optional[int]]]:
+    return (lambda: _formula(n, ratio, seed)), (lambda formula: None)
+
+
+def _bench_simplifier(n: int, ratio: float, seed: int) -> Tuple[Callable[[], Any], Callable[[Any], Optional[int]]]:
+    formula = _formula(n, ratio, seed)
+    rng = random.Random(seed)
+    assignment = {var: rng.random() < 0.5 for var in rng.sample(range(1, n + 1), n // 2)}
+    return (
+        lambda: FormulaSimplifier.simplify_formula(formula, assignment),
+        lambda simplified: len(simplified.clauses),
+    )
+
+
+def _bench_solver(factory: Callable[[], Any], cost: Callable[[Any], int]):
+    def bench(n: int, ratio: float, seed: int):
+        formula = _formula(n, ratio, seed)
+        solver = factory()
+        return (lambda: solver.solve(formula)), (lambda result: cost(solver))
+    return bench
+
+
+CASES: Dict[str, Callable[[int, float, int], Tuple[Callable[[], Any], Callable[[Any], Optional[int]]]]] = {
+    "generator": _bench_generator,
+    "simplifier": _bench_simplifier,
+    "dpll": _bench_solver(
+        lambda: DPLLSolver(debug=False),
+        lambda solver: len(solver.stats.stats["variable_frequencies"].value),
+    ),
+    "dpll_debug": _bench_solver(
+        lambda: DPLLSolver(debug=True),
+        lambda solver: solver.get_statistics()["total_steps"],
+    ),
+    **{
+        f"dpll_{name}": _bench_solver(
+            lambda name=name: DPLLSolver(debug=False, heuristic=name),
+            lambda solver: len(solver.stats.stats["variable_frequencies"].value),
+        )
+        for name in ("vsids", "moms", "jeroslow_wang", "dlis")
+    },
+    "dpll_preprocess": _bench_solver(
+        lambda: DPLLSolver(debug=False, preprocess=True),
+        lambda solver: len(solver.stats.stats["variable_frequencies"].value),
+    ),
+    "random": _bench_solver(
+        lambda: RandomSATSolver(debug=False, seed=0, max_tries=10, max_flips=2000),
+        lambda solver: solver.stats.stats["total_flips"].value,
+    ),
+    "exhaustive": _bench_solver(
+        lambda: ExhaustiveSATSolver(debug=False),
+        lambda solver: solver.stats.stats["assignments_tested"].value,
+    ),
+}
+
+
+def _time_run(case: str, n: int, ratio: float, seed: int) -> Tuple[float, Optional[int]]:
+    """Milliseconds and steps of one untraced run"""
+    run, count_steps = CASES[case](n, ratio, seed)
+    gc.collect()
+    start = time.perf_counter()
+    result = run()
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, count_steps(result)
+
+
+def _peak_kib(case: str, n: int, ratio: float, seed: int) -> float:
+    """Peak traced allocation of one run"""
+    run, _ = CASES[case](n, ratio, seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def _median(values: Sequence[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def run_benchmarks(
+    cases: Sequence[str] = tuple(CASES),
+    variables: Sequence[int] = DEFAULT_VARIABLES,
+    ratios: Sequence[float] = DEFAULT_RATIOS,
+    seeds: Sequence[int] = DEFAULT_SEEDS,
+    repeat: int = 5,
+) -> Dict[str, Any]:
+    """
+    Run every case over the grid. Each cell sums time and steps over the
+    seeds; its time is the median of the `repeat` totals, and time_mad_ms
+    their median absolute deviation.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be positive")
+    cells = []
+    for case in cases:
+        if case not in CASES:
+            raise ValueError(f"Unknown benchmark case {case!r}; choose from {', '.join(CASES)}")
+        for n in variables:
+            if case == "exhaustive" and n > EXHAUSTIVE_MAX_VARIABLES:
+                continue
+            cells.extend((case, n, ratio) for ratio in ratios)
+
+    # Each round times the whole grid once, so drift over the session shows
+    # up in the spread rather than in whichever cell happened to run then
+    totals: Dict[Tuple[str, int, float], List[float]] = {cell: [] for cell in cells}
+    steps: Dict[Tuple[str, int, float], List[Optional[int]]] = {}
+    for _ in range(repeat):
+        for cell in cells:
+            runs = [_time_run(*cell, seed) for seed in seeds]
+            totals[cell].append(sum(elapsed for elapsed, _ in runs))
+            steps[cell] = [count for _, count in runs]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for case, n, ratio in cells:
+        cell_totals = totals[case, n, ratio]
+        cell_steps = steps[case, n, ratio]
+        time_ms = _median(cell_totals)
+        results[f"{case}[n={n},ratio={ratio:g}]"] = {
+            "time_ms": time_ms,
+            "time_mad_ms": _median([abs(total - time_ms) for total in cell_totals]),
+            "peak_kib": max(_peak_kib(case, n, ratio, seed) for seed in seeds),
+            "steps": None if None in cell_steps else sum(cell_steps),
+        }
+
+    return {
+        "python": sys.version.split()[0],
+        "grid": {
+            "cases": list(cases),
+            "variables": list(variables),
+            "ratios": list(ratios),
+            "seeds": list(seeds),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+    noise_mads: float = NOISE_MADS,
+) -> List[str]:
+    """
+    Describe every metric that grew by more than `threshold` over the
+    baseline. A time must also grow by more than `noise_mads` times the
+    summed spread of the two runs.
+    """
+    regressions = []
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            floor = 0.0
+            if metric == "time_ms":
+                spread = previous.get("time_mad_ms", 0.0) + current.get("time_mad_ms", 0.0)
+                floor = noise_mads * spread
+            if new > old * (1 + threshold) and new - old > floor:
+                change = (new - old) / old * 100 if old else float("inf")
+                regressions.append(f"{name} {metric}: {old:.3f} -> {new:.3f} (+{change:.1f}%)")
+    return regressions
+
+
+def main() -> None:
+    """Print or save a benchmark report and optionally check it against a baseline"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--variables", type=int, nargs="+", default=None)
+    parser.add_argument("--ratios", type=float, nargs="+", default=list(DEFAULT_RATIOS))
+    parser.add_argument("--seeds", type=int, nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="smaller grid for CI")
+    parser.add_argument("--output", help="write the report to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed relative growth per metric (default 0.1)")
+    parser.add_argument("--noise-mads", type=float, default=NOISE_MADS,
+                        help="ignore timing differences within this many deviations of the runs")
+    args = parser.parse_args()
+
+    variables = args.variables or (QUICK_VARIABLES if args.quick else DEFAULT_VARIABLES)
+    seeds = args.seeds or (QUICK_SEEDS if args.quick else DEFAULT_SEEDS)
+    report = run_benchmarks(args.cases, variables, args.ratios, seeds, args.repeat)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        report["baseline"] = args.compare
+        report["threshold"] = args.threshold
+        report["regressions"] = compare(
+            report, baseline, args.threshold, args.noise_mads
+        )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    if report.get("regressions"):
+        for regression in report["regressions"]:
+            print(f"regression: {regression}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+Branching heuristics for the DPLL solver.
+
+A heuristic picks the next decision literal. It is attached to the solver's
+trail state when a solve starts and kept current by events from the solver,
+so choosing never rescans the formula:
+
+- resize(index, old, new): an unsatisfied clause now has `new` unassigned
+  literals instead of `old`, with 0 meaning satisfied. Only sent to
+  heuristics with `tracks_sizes` set, since it fires on every assignment.
+- conflict(index): a clause just lost its last unassigned literal.
+- backtracked(unassigned, touched): literals taken off the trail, and every
+  variable whose occurrence counts grew as their clauses were restored.
+
+The solver's per-variable counts of positive and negative occurrences in
+unsatisfied clauses are shared with the heuristic and always current.
+"""
+import heapq
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, Union
+
+PHASES = ("positive", "negative", "heuristic", "saved")
+
+
+class BranchingHeuristic:
+    """Base class: choose a variable, then a value for it by the phase policy"""
+
+    name = ""
+    default_phase = "positive"
+    tracks_sizes = False
+
+    def __init__(self, phase: Optional[str] = None):
+        phase = phase or self.default_phase
+        if phase not in PHASES:
+            raise ValueError(f"Phase must be one of: {', '.join(PHASES)}")
+        self.phase = phase
+
+    def attach(
+        self,
+        num_variables: int,
+        clauses: Sequence[Sequence[int]],
+        values: List[Optional[bool]],
+        positive: List[int],
+        negative: List[int],
+    ) -> None:
+        """Bind to the trail state of a new solve and reset all scores"""
+        self._num_vars = num_variables
+        self._clauses = clauses
+        self._values = values
+        self._positive = positive
+        self._negative = negative
+        self._saved: List[bool] = [True] * (num_variables + 1)
+
+    def resize(self, index: int, old: int, new: int) -> None:
+        """An unsatisfied clause changed size; 0 means satisfied"""
+
+    def conflict(self, index: int) -> None:
+        """A clause became empty under the current assignment"""
+
+    def backtracked(self, unassigned: Sequence[int], touched: Iterable[int]) -> None:
+        """Literals were taken off the trail; `touched` variables gained occurrences"""
+        saved = self._saved
+        for lit in unassigned:
+            saved[abs(lit)] = lit > 0
+
+    def choose(self) -> int:
+        """The decision literal: a free variable with the value to try first"""
+        var = self.select()
+        if self.phase == "positive":
+            return var
+        if self.phase == "negative":
+            return -var
+        if self.phase == "saved":
+            return var if self._saved[var] else -var
+        return var if self.prefers_positive(var) else -var
+
+    def select(self) -> int:
+        """A free variable that occurs in the residual formula"""
+        raise NotImplementedError
+
+    def prefers_positive(self, var: int) -> bool:
+        """Phase for the "heuristic" policy: the polarity with more occurrences"""
+        return self._positive[var] >= self._negative[var]
+
+
+class _HeapHeuristic(BranchingHeuristic):
+    """
+    Scores kept in a lazy max-heap. Entries are upper bounds on the score of a
+    free variable, and scores only grow while the trail is undone, so stale
+    entries are refreshed on pop and freed variables are pushed on backtrack.
+    """
+
+    def attach(self, num_variables, clauses, values, positive, negative) -> None:
+        super().attach(num_variables, clauses, values, positive, negative)
+        self._reset_scores()
+        self._heap: List[Tuple[float, int]] = [
+            (-self.score(var), var) for var in range(1, num_variables + 1)
+        ]
+        heapq.heapify(self._heap)
+
+    def _reset_scores(self) -> None:
+        """Initialize any scores of the heuristic before the heap is built"""
+
+    def score(self, var: int) -> float:
+        raise NotImplementedError
+
+    def backtracked(self, unassigned: Sequence[int], touched: Iterable[int]) -> None:
+        super().backtracked(unassigned, touched)
+        values = self._values
+        heap = self._heap
+        if len(heap) > 4 * self._num_vars + 64:
+            heap.clear()
+            touched = range(1, self._num_vars + 1)
+        for var in touched:
+            if values[var] is None:
+                heapq.heappush(heap, (-self.score(var), var))
+
+    def select(self) -> int:
+        heap = self._heap
+        values = self._values
+        positive = self._positive
+        negative = self._negative
+        while heap:
+            neg_score, var = heapq.heappop(heap)
+            # Variables with no occurrences left come back with the clauses that hold them
+            if values[var] is not None or not (positive[var] or negative[var]):
+                continue
+            score = self.score(var)
+            if -neg_score == score:
+                return var
+            heapq.heappush(heap, (-score, var))
+        raise RuntimeError("No free variable occurs in the residual formula")
+
+
+class MostFrequentHeuristic(_HeapHeuristic):
+    """The variable with the most occurrences in unsatisfied clauses (DLCS)"""
+
+    name = "frequency"
+
+    def score(self, var: int) -> float:
+        return self._positive[var] + self._negative[var]
+
+
+class DLISHeuristic(_HeapHeuristic):
+    """Dynamic largest individual sum: the literal in the most unsatisfied clauses"""
+
+    name = "dlis"
+    default_phase = "heuristic"
+
+    def score(self, var: int) -> float:
+        return max(self._positive[var], self._negative[var])
+
+
+class VSIDSHeuristic(_HeapHeuristic):
+    """
+    Variable state independent decaying sum. Variables of each falsified
+    clause are bumped and older bumps decay geometrically; activities start
+    at the occurrence counts so the first decisions are informed.
+    """
+
+    name = "vsids"
+    default_phase = "saved"
+
+    def __init__(self, phase: Optional[str] = None, decay: float = 0.95):
+        super().__init__(phase)
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("VSIDS decay must be in (0, 1]")
+        self.decay = decay
+
+    def _reset_scores(self) -> None:
+        self._activity = [
+            float(self._positive[var] + self._negative[var])
+            for var in range(self._num_vars + 1)
+        ]
+        self._increment = 1.0
+
+    def score(self, var: int) -> float:
+        return self._activity[var]
+
+    def conflict(self, index: int) -> None:
+        # Every variable of an empty clause is assigned, so no entry goes stale
+        activity = self._activity
+        for lit in self._clauses[index]:
+            activity[abs(lit)] += self._increment
+        self._increment /= self.decay
+        if self._increment > 1e100:
+            self._activity = [a * 1e-100 for a in activity]
+            self._increment *= 1e-100
+            self._heap = [
+                (-self._activity[var], var)
+                for var in range(1, self._num_vars + 1) if self._values[var] is None
+            ]
+            heapq.heapify(self._heap)
+
+
+class _SizedHeuristic(BranchingHeuristic):
+    """
+    Heuristics scoring literals by the current size of their clauses.
+
+    Scores move both ways as clauses shrink, grow back or are satisfied.
+    Variables whose score grew are queued by resize and pushed into a lazy
+    max-heap at the next decision, so older entries are upper bounds and are
+    refreshed on pop as in _HeapHeuristic. Entries of assigned variables are
+    dropped: undoing an assignment resizes every unsatisfied clause of the
+    variable, which queues it again.
+    """
+
+    tracks_sizes = True
+
+    def attach(self, num_variables, clauses, values, positive, negative) -> None:
+        super().attach(num_variables, clauses, values, positive, negative)
+        self._reset_scores()
+        for index, lits in enumerate(clauses):
+            if lits:
+                self.resize(index, 0, len(lits))
+
+    def _reset_scores(self) -> None:
+        raise NotImplementedError
+
+    def _select_from(
+        self,
+        heap: List[Tuple[float, int]],
+        queued: Set[int],
+        score: Callable[[int], float],
+        candidates: Callable[[], Iterable[int]],
+        limit: int,
+    ) -> Optional[int]:
+        """Push the queued variables, then pop the free one with the highest positive score"""
+        values = self._values
+        if len(heap) + len(queued) > limit:
+            # Too many stale entries: rebuild from the current scores
+            heap[:] = [(-score(var), var) for var in candidates() if values[var] is None]
+            heapq.heapify(heap)
+        else:
+            for var in queued:
+                if values[var] is None:
+                    heapq.heappush(heap, (-score(var), var))
+        queued.clear()
+        while heap:
+            neg_score, var = heapq.heappop(heap)
+            if values[var] is not None:
+                continue
+            current = score(var)
+            # Variables scoring zero are queued again when a clause holding them grows
+            if current <= 0:
+                continue
+            if -neg_score == current:
+                return var
+            heapq.heappush(heap, (-current, var))
+        return None
+
+    def score(self, var: int) -> float:
+        raise NotImplementedError
+
+
+class JeroslowWangHeuristic(_SizedHeuristic):
+    """Two-sided Jeroslow-Wang: each clause of size s weighs 2^-s for its literals"""
+
+    name = "jeroslow_wang"
+    default_phase = "heuristic"
+
+    def _reset_scores(self) -> None:
+        self._weight_pos = [0.0] * (self._num_vars + 1)
+        self._weight_neg = [0.0] * (self._num_vars + 1)
+        self._heap: List[Tuple[float, int]] = []
+        self._queued: Set[int] = set()
+
+    def resize(self, index: int, old: int, new: int) -> None:
+        # Powers of two add and subtract exactly, so scores never drift
+        delta = (2.0 ** -new if new else 0.0) - (2.0 ** -old if old else 0.0)
+        weight_pos, weight_neg = self._weight_pos, self._weight_neg
+        if delta > 0:
+            queue = self._queued.add
+            for lit in self._clauses[index]:
+                if lit > 0:
+                    weight_pos[lit] += delta
+                    queue(lit)
+                else:
+                    weight_neg[-lit] += delta
+                    queue(-lit)
+        else:
+            for lit in self._clauses[index]:
+                if lit > 0:
+                    weight_pos[lit] += delta
+                else:
+                    weight_neg[-lit] += delta
+
+    def select(self) -> int:
+        var = self._select_from(
+            self._heap, self._queued, self.score,
+            lambda: range(1, self._num_vars + 1), 4 * self._num_vars + 64,
+        )
+        if var is None:
+            raise RuntimeError("No free variable occurs in the residual formula")
+        return var
+
+    def score(self, var: int) -> float:
+        return self._weight_pos[var] + self._weight_neg[var]
+
+    def prefers_positive(self, var: int) -> bool:
+        return self._weight_pos[var] >= self._weight_neg[var]
+
+
+class MOMSHeuristic(_SizedHeuristic):
+    """
+    Maximum occurrences in clauses of minimum size: over the shortest
+    unsatisfied clauses with two or more free literals, maximize
+    (f(x) + f(¬x)) * 2^k + f(x) * f(¬x).
+    """
+
+    name = "moms"
+    default_phase = "heuristic"
+
+    def __init__(self, phase: Optional[str] = None, k: int = 10):
+        super().__init__(phase)
+        self.k = k
+
+    def _reset_scores(self) -> None:
+        # Tables exist only for the sizes that currently occur and only hold
+        # the variables of those clauses, so their counts may drop to zero.
+        # Unit clauses are propagated before any decision, so sizes below two
+        # are not tracked.
+        self._size_count: Dict[int, int] = {}
+        self._size_pos: Dict[int, Dict[int, int]] = {}
+        self._size_neg: Dict[int, Dict[int, int]] = {}
+        self._heaps: Dict[int, List[Tuple[float, int]]] = {}
+        self._queued: Dict[int, Set[int]] = {}
+        self._size = 2
+
+    def resize(self, index: int, old: int, new: int) -> None:
+        lits = self._clauses[index]
+        if old >= 2:
+            count = self._size_count[old] - 1
+            if count:
+                self._size_count[old] = count
+                pos, neg = self._size_pos[old], self._size_neg[old]
+                for lit in lits:
+                    if lit > 0:
+                        pos[lit] -= 1
+                    else:
+                        neg[-lit] -= 1
+            else:
+                for tables in (self._size_count, self._size_pos, self._size_neg,
+                               self._heaps, self._queued):
+                    del tables[old]
+        if new >= 2:
+            if new in self._size_count:
+                self._size_count[new] += 1
+            else:
+                self._size_count[new] = 1
+                self._size_pos[new], self._size_neg[new] = {}, {}
+                self._heaps[new], self._queued[new] = [], set()
+            pos, neg = self._size_pos[new], self._size_neg[new]
+            queue = self._queued[new].add
+            for lit in lits:
+                if lit > 0:
+                    pos[lit] = pos.get(lit, 0) + 1
+                    queue(lit)
+                else:
+                    neg[-lit] = neg.get(-lit, 0) + 1
+                    queue(-lit)
+
+    def select(self) -> int:
+        # Binary clauses first; few distinct sizes occur at once, so the minimum is cheap
+        if self._size_count:
+            size = self._size = min(self._size_count)
+            pos, neg = self._size_pos[size], self._size_neg[size]
+            var = self._select_from(
+                self._heaps[size], self._queued[size], self.score,
+                lambda: pos.keys() | neg.keys(), 4 * (len(pos) + len(neg)) + 64,
+            )
+            if var is not None:
+                return var
+        raise RuntimeError("No free variable occurs in the residual formula")
+
+    def score(self, var: int) -> float:
+        pos = self._size_pos[self._size].get(var, 0)
+        neg = self._size_neg[self._size].get(var, 0)
+        return ((pos + neg) << self.k) + pos * neg
+
+    def prefers_positive(self, var: int) -> bool:
+        return self._size_pos[self._size].get(var, 0) >= self._size_neg[self._size].get(var, 0)
+
+
+HEURISTICS: Dict[str, Type[BranchingHeuristic]] = {
+    heuristic.name: heuristic
+    for heuristic in (
+        MostFrequentHeuristic,
+        VSIDSHeuristic,
+        MOMSHeuristic,
+        JeroslowWangHeuristic,
+        DLISHeuristic,
+    )
+}
+
+
+def create_heuristic(
+    heuristic: Union[str, BranchingHeuristic] = "frequency", phase: Optional[str] = None
+) -> BranchingHeuristic:
+    """Instantiate a heuristic by name, or pass an instance through unchanged"""
+    if isinstance(heuristic, BranchingHeuristic):
+        if phase is not None:
+            raise ValueError("Set the phase on the heuristic instance instead")
+        return heuristic
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Heuristic must be one of: {', '.join(HEURISTICS)}")
+    return HEURISTICS[heuristic](phase)
@@ -0,0 +1,177 @@
+"""
+Solve budgets and cooperative cancellation.
+
+A SolveBudget bounds one solve by wall-clock time, by counts of decisions,
+backtracks and flips, and by a CancellationToken that another thread may
+set. Solvers charge a BudgetMeter as they search. When a limit is reached
+the meter raises BudgetExhausted, and the solver stops with status UNKNOWN,
+keeping the statistics and steps gathered so far.
+
+    token = CancellationToken()
+    solver = DPLLSolver(budget=SolveBudget(timeout=2.0, token=token))
+    solver.solve(formula)
+    solver.status, solver.stop_reason    # SolveStatus.UNKNOWN, "timeout"
+"""
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class SolveStatus(Enum):
+    """Outcome of a solve; UNKNOWN when it stopped without an answer"""
+
+    SAT = "sat"
+    UNSAT = "unsat"
+    UNKNOWN = "unknown"
+
+
+class CancellationToken:
+    """Thread-safe flag that stops every solve whose budget carries it"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+# Stop reason -> how the final step of a stopped solve describes it
+STOP_REASONS = {
+    "timeout": "time limit reached",
+    "decisions": "decision limit reached",
+    "backtracks": "backtrack limit reached",
+    "flips": "flip limit reached",
+    "cancelled": "cancelled",
+    "max_tries": "local search gave up",
+    "no_answer": "no member reached an answer",
+}
+
+
+class BudgetExhausted(Exception):
+    """Raised inside a solver when its budget runs out"""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Solve stopped: {STOP_REASONS.get(reason, reason)}")
+        self.reason = reason
+
+    @property
+    def description(self) -> str:
+        return STOP_REASONS.get(self.reason, self.reason)
+
+
+@dataclass(frozen=True)
+class SolveBudget:
+    """Limits for one solve; None means unlimited"""
+
+    timeout: Optional[float] = None
+    max_decisions: Optional[int] = None
+    max_backtracks: Optional[int] = None
+    max_flips: Optional[int] = None
+    token: Optional[CancellationToken] = None
+
+    def __post_init__(self):
+        if self.timeout is not None and (
+            isinstance(self.timeout, bool) or not isinstance(self.timeout, (int, float))
+            or self.timeout <= 0
+        ):
+            raise ValueError("Budget timeout must be a positive number of seconds")
+        for name in ("max_decisions", "max_backtracks", "max_flips"):
+            value = getattr(self, name)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < 0
+            ):
+                raise ValueError(f"Budget {name} must be a non-negative integer")
+        if self.token is not None and not isinstance(self.token, CancellationToken):
+            raise ValueError("Budget token must be a CancellationToken")
+
+    def limits(self) -> Dict[str, Any]:
+        """The set limits as plain values, without the token"""
+        limits = {
+            "timeout": self.timeout,
+            "max_decisions": self.max_decisions,
+            "max_backtracks": self.max_backtracks,
+            "max_flips": self.max_flips,
+        }
+        return {name: value for name, value in limits.items() if value is not None}
+
+
+class BudgetMeter:
+    """Charges one solve against a budget, raising BudgetExhausted once it runs out"""
+
+    # Search events between reads of the clock and the token
+    CHECK_INTERVAL = 64
+
+    def __init__(self, budget: Optional[SolveBudget] = None):
+        budget = budget or SolveBudget()
+        self.budget = budget
+        self._deadline = (
+            time.monotonic() + budget.timeout if budget.timeout is not None else None
+        )
+        self._timed = self._deadline is not None or budget.token is not None
+        self._countdown = self.CHECK_INTERVAL
+        self.decisions = 0
+        self.backtracks = 0
+        self.flips = 0
+
+    def remaining_time(self) -> Optional[float]:
+        if self._deadline is None:
+            return None
+        return self._deadline - time.monotonic()
+
+    def handoff(self, keep_token: bool = False) -> SolveBudget:
+        """
+        Limits for work this solve hands on: the time left and the count
+        limits. A token cannot cross processes, so unless `keep_token` is set
+        it stays with the caller, which watches it.
+        """
+        remaining_time = self.remaining_time()
+        return SolveBudget(
+            timeout=None if remaining_time is None else max(remaining_time, 1e-3),
+            max_decisions=self.budget.max_decisions,
+            max_backtracks=self.budget.max_backtracks,
+            max_flips=self.budget.max_flips,
+            token=self.budget.token if keep_token else None,
+        )
+
+    def check(self) -> None:
+        """Stop now if the solve was cancelled or its time is up"""
+        token = self.budget.token
+        if token is not None and token.cancelled:
+            raise BudgetExhausted("cancelled")
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise BudgetExhausted("timeout")
+
+    def tick(self) -> None:
+        """One unit of search work; the clock is read every CHECK_INTERVAL ticks"""
+        if self._timed:
+            self._countdown -= 1
+            if self._countdown <= 0:
+                self._countdown = self.CHECK_INTERVAL
+                self.check()
+
+    def decision(self) -> None:
+        self.decisions += 1
+        limit = self.budget.max_decisions
+        if limit is not None and self.decisions > limit:
+            raise BudgetExhausted("decisions")
+        self.tick()
+
+    def backtrack(self) -> None:
+        self.backtracks += 1
+        limit = self.budget.max_backtracks
+        if limit is not None and self.backtracks > limit:
+            raise BudgetExhausted("backtracks")
+        self.tick()
+
+    def flip(self) -> None:
+        self.flips += 1
+        limit = self.budget.max_flips
+        if limit is not None and self.flips > limit:
+            raise BudgetExhausted("flips")
+        self.tick()
@@ -0,0 +1,181 @@
+"""
+Solve-result cache keyed by the canonical hash of a formula.
+
+Results are kept as their JSON text in a bounded in-memory LRU and, when a
+directory is given, in one file per key on disk. The disk tier is evicted
+oldest-first once its total size passes `max_bytes`; reading an entry
+refreshes its modification time, so eviction is least-recently-used there
+too.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .utils import Formula, PackedFormula
+
+# Environment variable naming the on-disk cache directory for the CLI
+CACHE_DIR_ENV = "THREE_SAT_CACHE_DIR"
+
+
+def cache_key(
+    formula: Union[Formula, PackedFormula], solver_name: str, options: Optional[Dict[str, Any]] = None
+) -> str:
+    """Key for a solve: the canonical formula hash plus everything that shapes the result"""
+    payload = json.dumps(
+        [formula.canonical_hash(), solver_name, options or {}], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Two-tier LRU cache of JSON-serializable solve results"""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        directory: Optional[Union[str, Path]] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a fresh copy of the cached result, or None"""
+        text = self._memory.get(key)
+        if text is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return json.loads(text)
+
+        text = self._read(key)
+        if text is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.disk_hits += 1
+        self._remember(key, text)
+        return json.loads(text)
+
+    def put(self, key: str, result: dict) -> None:
+        """Store a result in memory and, if configured, on disk"""
+        text = json.dumps(result, ensure_ascii=False)
+        self._remember(key, text)
+        if self.directory is not None:
+            self._write(key, text)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        self._memory.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters plus the current size of each tier"""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+            "disk_bytes": sum(size for _, size, _ in self._disk_entries()),
+        }
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or (
+            self.directory is not None and self._path(key).exists()
+        )
+
+    # Memory tier
+
+    def _remember(self, key: str, text: str) -> None:
+        """Insert into the LRU, evicting the least recently used entries"""
+        if self.max_entries == 0:
+            return
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # Disk tier
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[str]:
+        """Read an entry from disk and mark it as recently used"""
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            return None
+        return text
+
+    def _write(self, key: str, text: str) -> None:
+        """Write atomically, then evict until the store fits in max_bytes"""
+        import tempfile
+
+        data = text.encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        # The disk tier is best-effort; on failure the result is still in memory
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _disk_entries(self):
+        """(path, size, mtime) for every stored entry"""
+        if self.directory is None:
+            return []
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used files while the store exceeds max_bytes"""
+        entries = self._disk_entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Cold-start report and regression guard for the solver container.
+
+Every `docker run` pays for interpreter start, package import and the first
+solve in a fresh process, so this measures exactly that, in fresh
+subprocesses, and compares the medians against a budget:
+
+    python -m scripts.coldstart                 # print a JSON report
+    python -m scripts.coldstart --check         # also exit 1 when over budget
+"""
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Default budgets, in milliseconds, for one cold `python -m scripts.entrypoint`
+IMPORT_BUDGET_MS = 150.0
+FIRST_SOLVE_BUDGET_MS = 250.0
+
+# Modules the CLI path must not import; they are loaded on first use only
+LAZY_MODULES = ("numpy", "statistics", "multiprocessing")
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+_PROBE = """
+import time
+start = time.perf_counter()
+import json
+import sys
+from scripts.entrypoint import SOLVERS, format_output, generate_formula, solve_formula
+imported = time.perf_counter()
+formula = generate_formula({n}, {ratio}, 0)
+solver = SOLVERS[{solver!r}](debug=True)
+json.dumps(format_output(formula, solve_formula(formula, solver), solver), ensure_ascii=False)
+solved = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "first_solve_ms": (solved - imported) * 1000,
+    "loaded": [name for name in {lazy!r} if name in sys.modules],
+}}))
+"""
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter from the package root"""
+    return subprocess.run(
+        [sys.executable] + args,
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _timed(args: List[str]) -> float:
+    """Wall-clock milliseconds for one fresh interpreter run"""
+    start = time.perf_counter()
+    _run(args)
+    return (time.perf_counter() - start) * 1000
+
+
+def heaviest_imports(limit: int = 10) -> List[Dict[str, Any]]:
+    """Modules with the largest self import time when loading the entrypoint"""
+    result = _run(["-X", "importtime", "-c", "import scripts.entrypoint"])
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            modules.append(
+                {
+                    "module": match.group(4),
+                    "self_ms": int(match.group(1)) / 1000,
+                    "cumulative_ms": int(match.group(2)) / 1000,
+                }
+            )
+    return sorted(modules, key=lambda m: m["self_ms"], reverse=True)[:limit]
+
+
+def measure(repeat: int = 5, n: int = 5, ratio: float = 4.2, solver: str = "dpll") -> Dict[str, Any]:
+    """Collect median cold-start timings over `repeat` fresh processes"""
+    probe = _PROBE.format(n=n, ratio=ratio, solver=solver, lazy=LAZY_MODULES)
+    interpreter, end_to_end, imports, solves = [], [], [], []
+    loaded: List[str] = []
+    for _ in range(repeat):
+        interpreter.append(_timed(["-c", "pass"]))
+        end_to_end.append(_timed(["-m", "scripts.entrypoint", str(n), str(ratio), solver]))
+        sample = json.loads(_run(["-c", probe]).stdout)
+        imports.append(sample["import_ms"])
+        solves.append(sample["first_solve_ms"])
+        loaded = sorted(set(loaded) | set(sample["loaded"]))
+
+    return {
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "interpreter_ms": statistics.median(interpreter),
+        "import_ms": statistics.median(imports),
+        "first_solve_ms": statistics.median(solves),
+        "end_to_end_ms": statistics.median(end_to_end),
+        "eagerly_loaded": loaded,
+        "heaviest_imports": heaviest_imports(),
+    }
+
+
+def check(report: Dict[str, Any], import_budget_ms: float, solve_budget_ms: float) -> List[str]:
+    """Return budget violations for a report"""
+    failures = []
+    if report["import_ms"] > import_budget_ms:
+        failures.append(
+            f"import took {report['import_ms']:.1f} ms, budget is {import_budget_ms:.1f} ms"
+        )
+    if report["first_solve_ms"] > solve_budget_ms:
+        failures.append(
+            f"first solve took {report['first_solve_ms']:.1f} ms, budget is {solve_budget_ms:.1f} ms"
+        )
+    for name in report["eagerly_loaded"]:
+        failures.append(f"{name} was imported by the entrypoint but should load lazily")
+    return failures
+
+
+def main() -> None:
+    """Print the cold-start report and optionally enforce the budget"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--solver", default="dpll")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--solve-budget-ms", type=float, default=FIRST_SOLVE_BUDGET_MS)
+    parser.add_argument("--check", action="store_true", help="exit 1 when over budget")
+    args = parser.parse_args()
+
+    report = measure(repeat=args.repeat, solver=args.solver)
+    report["failures"] = check(report, args.import_budget_ms, args.solve_budget_ms)
+    print(json.dumps(report, indent=2))
+    if args.check and report["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,593 @@
+"""
+Cube-and-conquer: split a formula into cubes by lookahead and solve the
+cubes with DPLL in parallel worker processes.
+
+A cube is a partial assignment. The lookahead splitter builds a tree of
+`depth` decisions: at each node it tries both values of the most frequent
+free variables with unit propagation, splits on the one whose two branches
+shorten the most clauses, and keeps failed literals as forced assignments.
+Branches refuted by propagation never become cubes.
+
+Workers pull cubes from a shared queue, so fast cubes balance themselves.
+Once another worker sits idle, a worker whose cube has run for `split_after`
+seconds (doubled per generation of splitting) abandons it and puts its two
+lookahead halves back on the queue. The first satisfiable cube ends the run;
+statistics of every cube are merged into one DPLLStatistics.
+
+With debug on, the split and the outcome of every cube are logged as steps.
+Cube searches themselves log nothing, so max_depth is the deepest cube's
+literals plus the deepest node of its search.
+
+Under a budget the time limit and token bound the whole run, while count
+limits bound each cube's search. A cube that stops early leaves the run
+without a proof, so unless another cube is satisfiable its status is UNKNOWN.
+"""
+import math
+import os
+import queue
+import signal
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .branching import create_heuristic
+from .budget import STOP_REASONS, BudgetExhausted, BudgetMeter, SolveBudget, SolveStatus
+from .solver import DPLLSolver, SATSolver, _literal_str
+from .stats import SolverStatistics, StaticState, create_solver_statistics
+from .utils import Formula, FormulaError, FormulaPreprocessor, PackedFormula
+
+# Each worker should see this many initial cubes, so the queue balances load
+CUBES_PER_WORKER = 4
+
+# How often the coordinator checks for workers that died
+POLL_INTERVAL = 0.05
+
+Cube = List[int]
+
+
+class Lookahead:
+    """Unit propagation over a packed formula, for choosing splits and refuting cubes"""
+
+    def __init__(self, formula: PackedFormula, candidates: int = 20):
+        self.num_vars = formula.num_variables
+        self.candidates = candidates
+        self.clauses: List[List[int]] = list(formula)
+        # Indexed by literal; negative literals land in the upper half of the list
+        self._occurrences: List[List[int]] = [[] for _ in range(2 * self.num_vars + 1)]
+        for index, clause in enumerate(self.clauses):
+            for lit in clause:
+                self._occurrences[lit].append(index)
+        self.values: List[Optional[bool]] = [None] * (self.num_vars + 1)
+        self.has_empty_clause = any(not clause for clause in self.clauses)
+
+    def propagate(self, lits: Sequence[int]) -> Optional[Tuple[List[int], int]]:
+        """
+        Assign `lits` and everything they imply. Returns the literals assigned
+        and the number of clauses shortened without being satisfied, or None
+        on a conflict, in which case nothing stays assigned.
+        """
+        values = self.values
+        clauses = self.clauses
+        trail: List[int] = []
+        shortened = 0
+        pending = list(lits)
+        while pending:
+            lit = pending.pop()
+            value = values[abs(lit)]
+            if value is not None:
+                if value != (lit > 0):
+                    self.undo(trail)
+                    return None
+                continue
+            values[abs(lit)] = lit > 0
+            trail.append(lit)
+            for index in self._occurrences[-lit]:
+                free, unassigned = 0, 0
+                for other in clauses[index]:
+                    other_value = values[abs(other)]
+                    if other_value is None:
+                        free, unassigned = other, unassigned + 1
+                    elif other_value == (other > 0):
+                        break
+                else:
+                    if unassigned == 0:
+                        self.undo(trail)
+                        return None
+                    if unassigned == 1:
+                        pending.append(free)
+                    else:
+                        shortened += 1
+        return trail, shortened
+
+    def undo(self, trail: Sequence[int]) -> None:
+        values = self.values
+        for lit in trail:
+            values[abs(lit)] = None
+
+    def _frequencies(self) -> Optional[Dict[int, int]]:
+        """Occurrences of free variables in unsatisfied clauses; None once all are satisfied"""
+        values = self.values
+        counts: Dict[int, int] = {}
+        unsatisfied = False
+        for clause in self.clauses:
+            free = []
+            for lit in clause:
+                value = values[abs(lit)]
+                if value is None:
+                    free.append(abs(lit))
+                elif value == (lit > 0):
+                    break
+            else:
+                unsatisfied = True
+                for var in free:
+                    counts[var] = counts.get(var, 0) + 1
+        return counts if unsatisfied else None
+
+    def choose(self) -> Optional[Tuple[int, List[int]]]:
+        """
+        The variable to split on and the failed-literal consequences assigned
+        while looking ahead. The variable is 0 when every clause is satisfied;
+        None means the current assignment is refuted.
+        """
+        forced: List[int] = []
+        while True:
+            counts = self._frequencies()
+            if counts is None:
+                return 0, forced
+            if not counts:
+                # Only clauses without free literals are left unsatisfied
+                self.undo(forced)
+                return None
+            candidates = sorted(counts, key=counts.__getitem__, reverse=True)[: self.candidates]
+            best_var, best_score = 0, -1
+            for var in candidates:
+                if self.values[var] is not None:
+                    continue
+                reductions = []
+                for lit in (var, -var):
+                    result = self.propagate([lit])
+                    if result is not None:
+                        self.undo(result[0])
+                    reductions.append(result)
+                positive, negative = reductions
+                if positive is None or negative is None:
+                    # A failed literal: the other value is implied
+                    implied = self.propagate([-var if positive is None else var])
+                    if implied is None:
+                        self.undo(forced)
+                        return None
+                    forced.extend(implied[0])
+                    continue
+                score = (positive[1] + 1) * (negative[1] + 1)
+                if score > best_score:
+                    best_var, best_score = var, score
+            if best_var:
+                return best_var, forced
+
+    def model(self) -> Dict[int, bool]:
+        """The current assignment, completed with True"""
+        return {
+            var: True if value is None else value
+            for var, value in enumerate(self.values) if var
+        }
+
+    def split(self, cube: Cube, depth: int) -> Tuple[List[Cube], Optional[Dict[int, bool]], int]:
+        """
+        Extend `cube` by up to `depth` lookahead decisions. Returns the leaf
+        cubes, a model if lookahead alone satisfied the formula, and the
+        number of branches refuted on the way.
+        """
+        cubes: List[Cube] = []
+        refuted = 0
+
+        def visit(prefix: Cube, remaining: int) -> Optional[Dict[int, bool]]:
+            nonlocal refuted
+            if remaining == 0:
+                cubes.append(prefix)
+                return None
+            chosen = self.choose()
+            if chosen is None:
+                refuted += 1
+                return None
+            var, forced = chosen
+            try:
+                if var == 0:
+                    return self.model()
+                for lit in (var, -var):
+                    result = self.propagate([lit])
+                    if result is None:
+                        refuted += 1
+                        continue
+                    try:
+                        model = visit(prefix + forced + [lit], remaining - 1)
+                    finally:
+                        self.undo(result[0])
+                    if model is not None:
+                        return model
+            finally:
+                self.undo(forced)
+            return None
+
+        start = None if self.has_empty_clause else self.propagate(cube)
+        if start is None:
+            return [], None, 1
+        try:
+            model = visit(list(cube), depth)
+        finally:
+            self.undo(start[0])
+        return cubes, model, refuted
+
+
+def _with_units(formula: PackedFormula, cube: Cube) -> PackedFormula:
+    """The formula with the cube's literals appended as unit clauses"""
+    literals = formula.literals + array("i", cube)
+    offsets = formula.offsets + array("i", range(len(formula.literals) + 1, len(literals) + 1))
+    return PackedFormula._trusted(literals, offsets, formula.num_variables)
+
+
+def _cube_outcome(model: Optional[Dict[int, bool]], stop_reason: Optional[str]) -> Tuple[str, bool]:
+    """How a solved cube is described in the step log, and whether that is a success"""
+    if model is not None:
+        return "satisfiable", True
+    if stop_reason is not None:
+        return f"stopped, {STOP_REASONS[stop_reason]}", False
+    return "refuted", False
+
+
+class _Cancelled(Exception):
+    """Raised in a worker whose cube is no longer needed"""
+
+
+class _Split(Exception):
+    """Raised in a worker whose cube ran long while the queue was empty"""
+
+
+# Per-process state of a worker, read by its signal handlers
+_WORKER: Dict[str, Any] = {"solving": False, "idle": None}
+
+
+def _on_terminate(signum, frame):
+    if _WORKER["solving"]:
+        raise _Cancelled()
+
+
+def _on_alarm(signum, frame):
+    if _WORKER["solving"] and _WORKER["idle"].value > 0:
+        raise _Split()
+
+
+def _conquer(
+    formula: PackedFormula,
+    options: Dict[str, Any],
+    candidates: int,
+    split_after: float,
+    budget: SolveBudget,
+    tasks,
+    results,
+    idle,
+    stop,
+) -> None:
+    """Worker process body: solve cubes from `tasks` until told to stop"""
+    meter = BudgetMeter(budget)
+    _WORKER["idle"] = idle
+    signal.signal(signal.SIGTERM, _on_terminate)
+    signal.signal(signal.SIGALRM, _on_alarm)
+    lookahead: Optional[Lookahead] = None
+    while not stop.is_set():
+        with idle.get_lock():
+            idle.value += 1
+        task = tasks.get()
+        with idle.get_lock():
+            idle.value -= 1
+        if task is None or stop.is_set():
+            break
+        cube_id, cube, generation = task
+        solver = DPLLSolver(debug=False, budget=meter.handoff(), **options)
+        delay = split_after * (2 ** generation)
+        try:
+            _WORKER["solving"] = True
+            signal.setitimer(signal.ITIMER_REAL, delay, delay)
+            model = solver.solve(_with_units(formula, cube))
+            _WORKER["solving"] = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            results.put(("solved", cube_id, (model, solver.stop_reason), solver.stats))
+        except _Split:
+            _WORKER["solving"] = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            if lookahead is None:
+                lookahead = Lookahead(formula, candidates)
+            children, model, refuted = lookahead.split(cube, 1)
+            results.put(("split", cube_id, (children, model, refuted, generation + 1), solver.stats))
+        except _Cancelled:
+            _WORKER["solving"] = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            results.put(("cancelled", cube_id, None, solver.stats))
+            break
+
+
+class CubeAndConquerSolver(SATSolver):
+    """Lookahead cube splitting with the cubes solved by DPLL across processes"""
+
+    def __init__(self, debug: bool = False, workers: Optional[int] = None,
+                 depth: Optional[int] = None, candidates: int = 20,
+                 split_after: float = 0.5, heuristic: str = "frequency",
+                 phase: Optional[str] = None, cancel_grace: float = 1.0,
+                 preprocess: Union[bool, FormulaPreprocessor] = False,
+                 budget: Optional[SolveBudget] = None):
+        super().__init__(debug, preprocess, budget)
+        if workers is not None and workers < 0:
+            raise ValueError("workers must be non-negative")
+        if depth is not None and depth < 0:
+            raise ValueError("depth must be non-negative")
+        if candidates < 1:
+            raise ValueError("candidates must be positive")
+        if split_after <= 0:
+            raise ValueError("split_after must be positive")
+        if not isinstance(heuristic, str):
+            raise ValueError("Cube workers build their own heuristic; pass its name")
+        branching = create_heuristic(heuristic, phase)
+        self.stats = create_solver_statistics("dpll")
+        self.stats.heuristic = branching.name
+        self.stats.phase = branching.phase
+        self.workers = workers
+        self.depth = depth
+        self.candidates = candidates
+        self.split_after = split_after
+        self.cancel_grace = cancel_grace
+        self._options = {"heuristic": heuristic, "phase": phase}
+        self._cubes: Dict[str, int] = {}
+        # Cubes handed to workers, by id, so their outcomes can be logged
+        self._submitted: Dict[int, Cube] = {}
+        self._step_counter = 0
+
+    def get_solving_steps(self) -> List[dict]:
+        """Get the solution steps from statistics"""
+        return self.stats.stats["solution_steps"].value.to_list()
+
+    def get_statistics(self) -> dict:
+        """Merged DPLL statistics of all cubes, plus how the cubes were made and solved"""
+        return self._with_preprocessing({
+            "total_steps": self._step_counter,
+            "max_depth": self.stats.stats["max_decision_depth"].value,
+            "unit_propagations": self.stats.stats["unit_propagations"].value,
+            "pure_literals": self.stats.stats["pure_literals"].value,
+            "backtracks": self.stats.stats["backtracks"].value,
+            "two_clause_rules": self.stats.stats["two_clause_rules"].value,
+            "equivalent_literals": self.stats.stats["equivalent_literals"].value,
+            "two_sat_solves": self.stats.stats["two_sat_solves"].value,
+            "heuristic": self.stats.heuristic,
+            "phase": self.stats.phase,
+            "cubes": dict(self._cubes),
+            "truncated_steps": self.stats.truncated_steps()
+        })
+
+    def _log_step(self, action_type: str, description: str,
+                  assignments: Optional[Dict[int, bool]] = None, success: bool = True,
+                  depth: int = 0):
+        """Log a solution step; the formula state is the searched formula"""
+        if self.debug:
+            self._step_counter += 1
+            self._steps.record(
+                self._step_counter, depth, action_type, description, success,
+                assignments=assignments
+            )
+
+    def _record_cube(self, cube_id: int, cube: Cube, stats: SolverStatistics,
+                     outcome: str, success: bool = True) -> None:
+        """Fold in a cube's statistics and log how it ended"""
+        self.stats.merge(stats)
+        depth = len(cube) + max(stats.stats["decision_depths"].value, default=0)
+        max_depth = self.stats.stats["max_decision_depth"]
+        max_depth.value = max(max_depth.value, depth)
+        if self.debug:
+            shown = " ∧ ".join(_literal_str(lit) for lit in cube) or "empty cube"
+            self._log_step(
+                "cube", f"Cube {cube_id} ({shown}): {outcome}",
+                {abs(lit): lit > 0 for lit in cube}, success, len(cube)
+            )
+
+    def solve(self, formula: Formula) -> Optional[Dict[int, bool]]:
+        """Split into cubes, solve them until one is satisfiable or all are refuted"""
+        self.stats.reset()
+        self._step_counter = 0
+        meter = self._start_budget()
+        self.stats.start_timer()
+        try:
+            searched = self._preprocess(formula).pack()
+            self._steps = self.stats.stats["solution_steps"].value
+            self._steps.bind(StaticState(str(searched) if self.debug else ""))
+
+            workers = (os.cpu_count() or 1) if self.workers is None else self.workers
+            depth = self.depth
+            if depth is None:
+                depth = math.ceil(math.log2(CUBES_PER_WORKER * max(workers, 1)))
+            self._log_step("start", f"Starting cube-and-conquer with {workers} workers")
+            lookahead = Lookahead(searched, self.candidates)
+            cubes, model, refuted = lookahead.split([], depth)
+            if model is not None:
+                self._log_step("split", "Lookahead found a satisfying assignment", model)
+            else:
+                self._log_step(
+                    "split",
+                    f"Lookahead split into {len(cubes)} cubes at depth {depth}, "
+                    f"{refuted} branches refuted",
+                    success=bool(cubes)
+                )
+            self._cubes = {
+                "workers": workers,
+                "depth": depth,
+                "generated": len(cubes),
+                "refuted": refuted,
+                "solved": 0,
+                "split": 0,
+                "cancelled": 0,
+            }
+            stop_reason: Optional[str] = None
+            if model is None and cubes:
+                try:
+                    meter.check()
+                except BudgetExhausted as e:
+                    stop_reason = e.reason
+                else:
+                    if workers == 0:
+                        model, stop_reason = self._conquer_sequentially(searched, cubes)
+                    else:
+                        model, stop_reason = self._conquer_in_parallel(searched, cubes, workers)
+        finally:
+            self.stats.stop_timer()
+        if model is not None and not searched.is_satisfied_by(model):
+            raise FormulaError("Cube solver returned an assignment that does not satisfy the formula")
+        # Per-cube outcomes were merged in; the run itself is one solve
+        self.stats.successful_solves.value = int(model is not None)
+        self.stats.failed_solves.value = int(model is None)
+        if model is not None:
+            self.status = SolveStatus.SAT
+        elif stop_reason is not None:
+            self.status, self.stop_reason = SolveStatus.UNKNOWN, stop_reason
+        else:
+            self.status = SolveStatus.UNSAT
+        result = self._reconstruct(model)
+        if result is not None:
+            self._log_step("complete", "Found satisfying assignment", result)
+        elif stop_reason is not None:
+            self._log_step("stopped", f"Search stopped: {STOP_REASONS[stop_reason]}", success=False)
+        else:
+            self._log_step("complete", "Formula is unsatisfiable", {}, success=False)
+        return result
+
+    def _conquer_sequentially(
+        self, formula: PackedFormula, cubes: List[Cube]
+    ) -> Tuple[Optional[Dict[int, bool]], Optional[str]]:
+        """Solve the cubes one after another in this process; returns the model and any stop reason"""
+        stop_reason: Optional[str] = None
+        for cube_id, cube in enumerate(cubes):
+            # In process, so the cube's solver watches the token itself
+            budget = self._meter.handoff(keep_token=True)
+            solver = DPLLSolver(debug=False, budget=budget, **self._options)
+            model = solver.solve(_with_units(formula, cube))
+            self._cubes["solved"] += 1
+            self._record_cube(cube_id, cube, solver.stats, *_cube_outcome(model, solver.stop_reason))
+            if model is not None:
+                return model, None
+            if solver.stop_reason is not None:
+                stop_reason = solver.stop_reason
+                if stop_reason in ("timeout", "cancelled"):
+                    break
+        return None, stop_reason
+
+    def _conquer_in_parallel(
+        self, formula: PackedFormula, cubes: List[Cube], workers: int
+    ) -> Tuple[Optional[Dict[int, bool]], Optional[str]]:
+        """
+        Feed cubes to worker processes, re-queueing halves of cubes they split.
+        Returns the model and, when a cube or the run stopped early, why.
+        """
+        import multiprocessing
+
+        context = multiprocessing.get_context()
+        tasks = context.Queue()
+        results = context.Queue()
+        idle = context.Value("i", 0)
+        stop = context.Event()
+        processes = [
+            context.Process(
+                target=_conquer,
+                args=(formula, self._options, self.candidates, self.split_after,
+                      self._meter.handoff(), tasks, results, idle, stop),
+                daemon=True,
+            )
+            for _ in range(workers)
+        ]
+
+        next_id = 0
+        outstanding = set()
+        self._submitted = {}
+
+        def submit(cube: Cube, generation: int) -> None:
+            nonlocal next_id
+            tasks.put((next_id, cube, generation))
+            outstanding.add(next_id)
+            self._submitted[next_id] = cube
+            next_id += 1
+
+        for cube in cubes:
+            submit(cube, 0)
+        model: Optional[Dict[int, bool]] = None
+        stop_reason: Optional[str] = None
+        try:
+            for process in processes:
+                process.start()
+            while outstanding and model is None:
+                try:
+                    self._meter.check()
+                except BudgetExhausted as e:
+                    stop_reason = e.reason
+                    break
+                # Liveness is read before draining: a worker that exited has flushed its results
+                dead = [process for process in processes if not process.is_alive()]
+                try:
+                    kind, cube_id, payload, stats = results.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    if dead:
+                        raise FormulaError(
+                            f"Cube worker exited with code {dead[0].exitcode}"
+                        )
+                    continue
+                outstanding.discard(cube_id)
+                cube = self._submitted[cube_id]
+                if kind == "solved":
+                    self._cubes["solved"] += 1
+                    model, cube_stop_reason = payload
+                    stop_reason = stop_reason or cube_stop_reason
+                    self._record_cube(cube_id, cube, stats, *_cube_outcome(model, cube_stop_reason))
+                elif kind == "split":
+                    children, model, refuted, generation = payload
+                    self._cubes["split"] += 1
+                    self._cubes["generated"] += len(children)
+                    self._cubes["refuted"] += refuted
+                    self._record_cube(
+                        cube_id, cube, stats,
+                        f"ran long, split into {len(children)} cubes, {refuted} refuted"
+                    )
+                    for child in children:
+                        submit(child, generation)
+        finally:
+            self._stop(processes, tasks, results, stop)
+        return model, stop_reason
+
+    def _stop(self, processes, tasks, results, stop) -> None:
+        """Interrupt running cubes, collect their partial statistics and reap the workers"""
+        stop.set()
+        for process in processes:
+            tasks.put(None)
+            if process.is_alive():
+                process.terminate()
+        deadline = time.perf_counter() + self.cancel_grace
+        running = True
+        while running:
+            # Drain once more after the last worker exits; its results are flushed by then
+            running = time.perf_counter() < deadline and any(
+                process.is_alive() for process in processes
+            )
+            try:
+                while True:
+                    kind, cube_id, payload, stats = results.get(
+                        timeout=POLL_INTERVAL if running else 0
+                    )
+                    self._cubes[kind] += 1
+                    if kind == "solved":
+                        outcome, success = _cube_outcome(*payload)
+                    elif kind == "split":
+                        outcome, success = "abandoned while splitting", False
+                    else:
+                        outcome, success = "cancelled", False
+                    self._record_cube(cube_id, self._submitted[cube_id], stats, outcome, success)
+            except queue.Empty:
+                pass
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+            process.join()
+        for channel in (tasks, results):
+            channel.cancel_join_thread()
+            channel.close()
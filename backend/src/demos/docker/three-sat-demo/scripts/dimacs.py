@@ -0,0 +1,159 @@
+"""
+Reading and writing formulas in the DIMACS CNF format.
+
+The reader consumes its input one line at a time and appends literals
+straight into the buffers of a PackedFormula, so the text of an instance is
+never held in memory. Clauses may span lines or share one, comment lines are
+skipped anywhere, and the `%` line that ends SATLIB files stops the read.
+Paths ending in .gz, .bz2 or .xz are decompressed on the fly, and "-" reads
+standard input.
+
+    p cnf 3 2
+    1 -2 0
+    2 3 -1 0
+"""
+import sys
+from array import array
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Union
+
+from .utils import Formula, FormulaError, PackedFormula
+
+Source = Union[str, Path, IO]
+
+# Stream openers by file suffix; the modules are imported only when needed
+_COMPRESSED = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"}
+
+# Literals are stored as signed 32-bit integers
+MAX_VARIABLES = 2 ** 31 - 1
+
+
+def _open(path: Union[str, Path], mode: str, **kwargs) -> IO:
+    """Open a path, transparently compressing or decompressing by suffix"""
+    module_name = _COMPRESSED.get(Path(path).suffix.lower())
+    if module_name is None:
+        return open(path, mode, **kwargs)
+    from importlib import import_module
+
+    return import_module(module_name).open(path, mode, **kwargs)
+
+
+def read_dimacs(source: Source) -> PackedFormula:
+    """
+    Parse a DIMACS CNF instance from a path, "-" for standard input, or an
+    open text or binary stream. Raises FormulaError on malformed input.
+    """
+    if isinstance(source, (str, Path)):
+        if str(source) == "-":
+            return _parse(sys.stdin.buffer)
+        try:
+            with _open(source, "rb") as handle:
+                return _parse(handle)
+        except OSError as e:
+            raise FormulaError(f"Cannot read DIMACS file {source}: {e.strerror or e}")
+    return _parse(source)
+
+
+def _parse(lines: Iterable[Union[str, bytes]]) -> PackedFormula:
+    """Build the packed buffers from DIMACS lines"""
+    literals = array("i")
+    offsets = array("i", [0])
+    num_variables = num_clauses = -1
+    line_number = 0
+    for line_number, line in enumerate(lines, 1):
+        tokens = line.split()
+        if not tokens:
+            continue
+        first = tokens[0][:1]
+        if first in (b"c", "c"):
+            continue
+        if first in (b"%", "%"):
+            break
+        if first in (b"p", "p"):
+            if num_variables >= 0:
+                raise FormulaError(f"Line {line_number}: duplicate problem line")
+            num_variables, num_clauses = _problem_line(tokens, line_number)
+            continue
+        if num_variables < 0:
+            raise FormulaError(f"Line {line_number}: clause before the problem line")
+        try:
+            values = [int(token) for token in tokens]
+        except ValueError:
+            raise FormulaError(f"Line {line_number}: literals must be integers")
+        # Nearly every line holds exactly one clause, which is copied in bulk
+        if values[-1] == 0 and 0 not in values[:-1]:
+            del values[-1]
+            if values and (max(values) > num_variables or -min(values) > num_variables):
+                _check_range(values, num_variables, line_number)
+            literals.extend(values)
+            offsets.append(len(literals))
+            continue
+        for value in values:
+            if value == 0:
+                offsets.append(len(literals))
+            else:
+                _check_range((value,), num_variables, line_number)
+                literals.append(value)
+
+    if num_variables < 0:
+        raise FormulaError("Missing DIMACS problem line 'p cnf <variables> <clauses>'")
+    # A final clause may omit its terminating 0
+    if len(literals) > offsets[-1]:
+        offsets.append(len(literals))
+    if len(offsets) - 1 != num_clauses:
+        raise FormulaError(
+            f"Problem line declares {num_clauses} clauses, found {len(offsets) - 1}"
+        )
+    return PackedFormula._trusted(literals, offsets, max(num_variables, 1))
+
+
+def _problem_line(tokens: List[Union[str, bytes]], line_number: int):
+    """Declared variable and clause counts of a 'p cnf' line"""
+    if len(tokens) != 4 or tokens[1] not in (b"cnf", "cnf"):
+        raise FormulaError(
+            f"Line {line_number}: expected 'p cnf <variables> <clauses>'"
+        )
+    try:
+        num_variables, num_clauses = int(tokens[2]), int(tokens[3])
+    except ValueError:
+        raise FormulaError(f"Line {line_number}: problem line counts must be integers")
+    if num_variables < 0 or num_clauses < 0:
+        raise FormulaError(f"Line {line_number}: problem line counts must be non-negative")
+    if num_variables > MAX_VARIABLES:
+        raise FormulaError(
+            f"Line {line_number}: {num_variables} variables exceed the supported {MAX_VARIABLES}"
+        )
+    return num_variables, num_clauses
+
+
+def _check_range(values: Iterable[int], num_variables: int, line_number: int) -> None:
+    for value in values:
+        if abs(value) > num_variables:
+            raise FormulaError(
+                f"Line {line_number}: variable {abs(value)} exceeds the declared {num_variables}"
+            )
+
+
+def dimacs_lines(formula: Union[Formula, PackedFormula], comments: Iterable[str] = ()) -> Iterator[str]:
+    """The DIMACS text of a formula, one newline-terminated line at a time"""
+    packed = formula.pack()
+    for comment in comments:
+        for text in str(comment).splitlines() or [""]:
+            yield f"c {text}\n" if text else "c\n"
+    yield f"p cnf {packed.num_variables} {len(packed)}\n"
+    for clause in packed:
+        yield " ".join(map(str, clause)) + " 0\n"
+
+
+def write_dimacs(
+    formula: Union[Formula, PackedFormula], destination: Source, comments: Iterable[str] = ()
+) -> None:
+    """Write a formula to a path, "-" for standard output, or an open text stream"""
+    if isinstance(destination, (str, Path)):
+        if str(destination) == "-":
+            sys.stdout.writelines(dimacs_lines(formula, comments))
+            return
+        with _open(destination, "wt", encoding="ascii") as handle:
+            handle.writelines(dimacs_lines(formula, comments))
+        return
+    destination.writelines(dimacs_lines(formula, comments))
@@ -1,44 +1,169 @@
 #!/usr/bin/env python3
 import json
+import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Hashable, Optional, TextIO, Tuple, Union
 
-from .utils import Formula, RandomFormulaGenerator, FormulaError
-from .solver import DPLLSolver
+from .utils import Formula, PackedFormula, RandomFormulaGenerator, FormulaError
+from .solver import SATSolver, SOLVERS as ALL_SOLVERS
+from .budget import SolveBudget, SolveStatus
+from .cache import CACHE_DIR_ENV, ResultCache, cache_key
+
+# Resolved on first use, so the single-solver CLI path never loads the others
+SOLVERS = ALL_SOLVERS.select("dpll", "cdcl", "portfolio", "cube")
+
+SERVE_FLAG = "--serve"
+STREAM_FLAG = "--stream"
+PREPROCESS_FLAG = "--preprocess"
+STEP_LOG_OPTION = "--step-log="
+SEED_OPTION = "--seed="
+HEURISTIC_OPTION = "--heuristic="
+PHASE_OPTION = "--phase="
+CNF_OPTION = "--cnf="
+
+# Budget options -> SolveBudget field and value type
+BUDGET_OPTIONS = {
+    "--timeout=": ("timeout", float),
+    "--max-decisions=": ("max_decisions", int),
+    "--max-backtracks=": ("max_backtracks", int),
+    "--max-flips=": ("max_flips", int),
+}
+
+_GENERATOR = RandomFormulaGenerator()
+
+def validate_parameters(n_variables: Any, clause_ratio: Any, solver_name: Any = "dpll") -> Dict[str, Any]:
+    """Validate demo parameters shared by the CLI and the worker protocol"""
+    if isinstance(n_variables, bool) or not isinstance(n_variables, int):
+        raise ValueError("Number of variables must be an integer")
+    if isinstance(clause_ratio, bool) or not isinstance(clause_ratio, (int, float)):
+        raise ValueError("Clause ratio must be a number")
+
+    # Validate ranges
+    if not (3 <= n_variables <= 5):
+        raise ValueError("Number of variables must be between 3 and 5")
+    if not (2.0 <= clause_ratio <= 5.0):
+        raise ValueError("Clause ratio must be between 2.0 and 5.0")
+
+    solver_name = str(solver_name).lower()
+    if solver_name not in SOLVERS:
+        raise ValueError(f"Solver must be one of: {', '.join(SOLVERS)}")
+
+    return {
+        "n_variables": n_variables,
+        "clause_ratio": float(clause_ratio),
+        "solver": solver_name
+    }
+
+def create_budget(limits: Any) -> SolveBudget:
+    """Build a solve budget from a JSON object of limits"""
+    if not isinstance(limits, dict):
+        raise ValueError("Budget must be a JSON object")
+    try:
+        return SolveBudget(**limits)
+    except TypeError as e:
+        raise ValueError(f"Invalid budget: {str(e)}")
 
 def parse_arguments() -> Dict[str, Any]:
     """Parse and validate command line arguments"""
-    if len(sys.argv) != 3:
-        raise ValueError("Expected 2 arguments: number of variables and clause ratio")
-    
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    argv = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    step_log: Dict[str, Any] = {}
+    seed = None
+    cnf = None
+    solver_options: Dict[str, Any] = {}
+    budget: Dict[str, Any] = {}
+    for option in options:
+        prefix = next((prefix for prefix in BUDGET_OPTIONS if option.startswith(prefix)), None)
+        if prefix is not None:
+            name, convert = BUDGET_OPTIONS[prefix]
+            try:
+                budget[name] = convert(option[len(prefix):])
+            except ValueError:
+                kind = "an integer" if convert is int else "a number"
+                raise ValueError(f"Invalid input: {prefix[:-1]} must be {kind}")
+        elif option.startswith(STEP_LOG_OPTION):
+            step_log = {"level": option[len(STEP_LOG_OPTION):]}
+        elif option.startswith(SEED_OPTION):
+            try:
+                seed = int(option[len(SEED_OPTION):])
+            except ValueError:
+                raise ValueError("Invalid input: Seed must be an integer")
+        elif option.startswith(HEURISTIC_OPTION):
+            solver_options["heuristic"] = option[len(HEURISTIC_OPTION):]
+        elif option.startswith(PHASE_OPTION):
+            solver_options["phase"] = option[len(PHASE_OPTION):]
+        elif option.startswith(CNF_OPTION):
+            cnf = option[len(CNF_OPTION):]
+            if not cnf:
+                raise ValueError("Invalid input: --cnf needs a file path, or - for stdin")
+        elif option not in (STREAM_FLAG, PREPROCESS_FLAG):
+            raise ValueError(f"Invalid input: Unknown option {option}")
+
+    if cnf is not None:
+        # Instances from files are not bound by the demo size limits
+        if len(argv) > 1:
+            raise ValueError("Expected at most 1 argument with --cnf: optional solver")
+        solver_name = (argv[0] if argv else "dpll").lower()
+        if solver_name not in SOLVERS:
+            raise ValueError(f"Invalid input: Solver must be one of: {', '.join(SOLVERS)}")
+        args = {"cnf": cnf, "solver": solver_name}
+    else:
+        if len(argv) not in (2, 3):
+            raise ValueError(
+                "Expected 2 or 3 arguments: number of variables, clause ratio and optional solver"
+            )
+
+        try:
+            n_variables = int(argv[0])
+            clause_ratio = float(argv[1])
+            solver_name = argv[2] if len(argv) == 3 else "dpll"
+            args = validate_parameters(n_variables, clause_ratio, solver_name)
+        except ValueError as e:
+            raise ValueError(f"Invalid input: {str(e)}")
+        args["cnf"] = None
+    if solver_options and args["solver"] not in ("dpll", "cube"):
+        raise ValueError("Invalid input: Branching options only apply to the dpll and cube solvers")
+    args["stream"] = STREAM_FLAG in options
+    args["step_log"] = step_log
+    args["seed"] = seed
     try:
-        n_variables = int(sys.argv[1])
-        clause_ratio = float(sys.argv[2])
-        
-        # Validate ranges
-        if not (3 <= n_variables <= 5):
-            raise ValueError("Number of variables must be between 3 and 5")
-        if not (2.0 <= clause_ratio <= 5.0):
-            raise ValueError("Clause ratio must be between 2.0 and 5.0")
-            
-        return {
-            "n_variables": n_variables,
-            "clause_ratio": clause_ratio
-        }
+        create_budget(budget)
     except ValueError as e:
         raise ValueError(f"Invalid input: {str(e)}")
+    args["budget"] = budget
+    if PREPROCESS_FLAG in options:
+        solver_options["preprocess"] = True
+    # Step logs of large instances are only recorded when asked for
+    debug = cnf is None or bool(step_log) or args["stream"]
+    args["options"] = {"debug": debug, **solver_options}
+    return args
+
+def configure_step_log(solver: SATSolver, policy: Any) -> None:
+    """Apply a step-log policy (level, head, tail, sample_rate, seed) to a solver"""
+    if not isinstance(policy, dict):
+        raise ValueError("Step log policy must be a JSON object")
+    try:
+        solver.stats.configure_step_log(**policy)
+    except TypeError as e:
+        raise ValueError(f"Invalid step log policy: {str(e)}")
 
-def generate_formula(n_variables: int, clause_ratio: float) -> Formula:
-    """Generate a random 3-SAT formula"""
-    generator = RandomFormulaGenerator()
+def generate_formula(n_variables: int, clause_ratio: float, seed: Optional[int] = None) -> Formula:
+    """Generate a random 3-SAT formula; a seed makes the request reproducible"""
     n_clauses = int(n_variables * clause_ratio)
-    return generator.generate(n_variables, n_clauses)
+    return _GENERATOR.generate(n_variables, n_clauses, seed)
 
-def format_output(formula: Formula, solution: Optional[Dict[int, bool]], solver: DPLLSolver) -> dict:
-    """Format the solution into the expected output structure"""
-    # Ensure we have steps and statistics even if empty
-    solving_steps = solver.get_solving_steps() or []
-    solving_stats = solver.get_statistics() or {
+def solve_formula(formula: Union[Formula, PackedFormula], solver: SATSolver) -> Optional[Dict[int, bool]]:
+    """Solve a formula and verify any model before it is reported"""
+    solution = solver.solve(formula)
+
+    # Never report a model that does not satisfy the formula
+    if solution is not None and not formula.is_satisfied_by(solution):
+        raise FormulaError("Solver returned an assignment that does not satisfy the formula")
+    return solution
+
+def _solver_statistics(solver: SATSolver) -> dict:
+    """Solver statistics, falling back to zeros for every reported key"""
+    return solver.get_statistics() or {
         "total_steps": 0,
         "max_depth": 0,
         "unit_propagations": 0,
@@ -47,37 +172,224 @@ def format_output(formula: Formula, solution: Optional[Dict[int, bool]], solver:
         "two_clause_rules": 0
     }
 
+def _outcome(solver: SATSolver, solution: Optional[Dict[int, bool]]) -> Dict[str, Any]:
+    """
+    Outcome of the solve: sat, unsat, or unknown with the reason it stopped.
+    An unknown result is neither satisfiable nor unsatisfiable, so
+    `satisfiable` is None rather than False for it.
+    """
+    status = solver.status
+    if status is None:
+        status = SolveStatus.SAT if solution is not None else SolveStatus.UNSAT
     return {
-        "formula": str(formula),
-        "satisfiable": solution is not None,
+        "satisfiable": None if status is SolveStatus.UNKNOWN else status is SolveStatus.SAT,
+        "status": status.value,
+        "stop_reason": solver.stop_reason,
+    }
+
+def _describe(formula: Union[Formula, PackedFormula], source: Optional[str]) -> Dict[str, Any]:
+    """Formula text, or only the source name of an instance read from a file"""
+    if source is not None:
+        return {"source": source}
+    return {"formula": str(formula)}
+
+def format_output(
+    formula: Union[Formula, PackedFormula],
+    solution: Optional[Dict[int, bool]],
+    solver: SATSolver,
+    source: Optional[str] = None
+) -> dict:
+    """Format the solution into the expected output structure"""
+    # Ensure we have steps and statistics even if empty
+    solving_steps = solver.get_solving_steps() or []
+    solving_stats = _solver_statistics(solver)
+
+    return {
+        **_describe(formula, source),
+        **_outcome(solver, solution),
         "assignment": solution,
         "num_variables": formula.num_variables,
-        "num_clauses": len(formula.clauses),
+        "num_clauses": len(formula),
         "solving_process": {
             "steps": solving_steps,
             "statistics": solving_stats
         }
     }
 
+def stream_output(
+    formula: Union[Formula, PackedFormula],
+    solver: SATSolver,
+    output_stream: TextIO = sys.stdout,
+    source: Optional[str] = None
+) -> Optional[Dict[int, bool]]:
+    """
+    Solve while writing NDJSON: a header record, one record per step as it is
+    logged, then a result record with the statistics. Steps are not retained,
+    so memory does not grow with the length of the log.
+    """
+    def write(record: dict) -> None:
+        output_stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output_stream.flush()
+
+    write({
+        "type": "header",
+        **_describe(formula, source),
+        "num_variables": formula.num_variables,
+        "num_clauses": len(formula)
+    })
+    solver.stream_steps(lambda step: write({"type": "step", **step}))
+    try:
+        solution = solve_formula(formula, solver)
+    finally:
+        solver.stream_steps(None)
+
+    write({
+        "type": "result",
+        **_outcome(solver, solution),
+        "assignment": solution,
+        "statistics": _solver_statistics(solver)
+    })
+    return solution
+
+def cached_solve(
+    formula: Union[Formula, PackedFormula],
+    solver: SATSolver,
+    key: str,
+    cache: Optional[ResultCache],
+    source: Optional[str] = None
+) -> dict:
+    """Formatted result for a formula, served from the cache when possible"""
+    if cache is not None:
+        result = cache.get(key)
+        if result is not None:
+            # Keys ignore clause and literal order, but the logged steps only
+            # match the text they were solved from. A path is taken to name
+            # the same text it did when the result was cached.
+            description = _describe(formula, source)
+            if any(result.get(field) != value for field, value in description.items()):
+                result = {
+                    **description,
+                    **{field: value for field, value in result.items()
+                       if field not in ("formula", "source")},
+                }
+                result["solving_process"]["steps"] = []
+            return result
+    result = format_output(formula, solve_formula(formula, solver), solver, source)
+    # A stopped solve says nothing lasting about the formula
+    if cache is not None and result["status"] != SolveStatus.UNKNOWN.value:
+        cache.put(key, result)
+    return result
+
+def handle_request(
+    request: Any,
+    solvers: Dict[Tuple[Hashable, ...], SATSolver],
+    cache: Optional[ResultCache] = None
+) -> dict:
+    """Answer one worker request, reusing solver instances and cached results"""
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+
+    args = validate_parameters(
+        request.get("n"), request.get("ratio"), request.get("solver", "dpll")
+    )
+    seed = request.get("seed")
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+        raise ValueError("Seed must be an integer")
+    options = request.get("options") or {}
+    if not isinstance(options, dict):
+        raise ValueError("Options must be a JSON object")
+    options = {"debug": True, **options}
+
+    try:
+        key = (args["solver"],) + tuple(sorted(options.items()))
+        hash(key)
+    except TypeError:
+        raise ValueError("Option values must be scalars")
+    solver = solvers.get(key)
+    if solver is None:
+        try:
+            solver = SOLVERS[args["solver"]](**options)
+        except TypeError as e:
+            raise ValueError(f"Invalid solver options: {str(e)}")
+        solvers[key] = solver
+    step_log = request.get("step_log") or {}
+    configure_step_log(solver, step_log)
+    budget = request.get("budget") or {}
+    solver.budget = create_budget(budget)
+
+    formula = generate_formula(args["n_variables"], args["clause_ratio"], seed)
+    result_key = cache_key(
+        formula, args["solver"], {"options": options, "step_log": step_log, "budget": budget}
+    )
+    return cached_solve(formula, solver, result_key, cache)
+
+def serve(
+    input_stream: TextIO = sys.stdin,
+    output_stream: TextIO = sys.stdout,
+    cache: Optional[ResultCache] = None
+) -> None:
+    """Worker mode: read one JSON request per line and write one JSON result per line"""
+    solvers: Dict[Tuple[Hashable, ...], SATSolver] = {}
+    if cache is None:
+        cache = ResultCache(directory=os.environ.get(CACHE_DIR_ENV))
+    for line in input_stream:
+        if not line.strip():
+            continue
+
+        request: Any = None
+        try:
+            request = json.loads(line)
+            response = handle_request(request, solvers, cache)
+        except (ValueError, FormulaError) as e:
+            response = {"error": str(e)}
+        except Exception as e:
+            response = {"error": "An unexpected error occurred"}
+
+        # Echo the request id so callers can match pipelined responses
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        output_stream.write(json.dumps(response, ensure_ascii=False) + "\n")
+        output_stream.flush()
+
 def main() -> None:
     """Main entry point for the SAT solver demo"""
+    if sys.argv[1:] == [SERVE_FLAG]:
+        serve()
+        return
+
     try:
         # Parse arguments
         args = parse_arguments()
-        
-        # Generate formula
-        formula = generate_formula(args["n_variables"], args["clause_ratio"])
-        
-        # Solve formula using DPLL with debug enabled
-        solver = DPLLSolver(debug=True)  # Changed to True
-        solver.stats.start_timer()  # Start timing the solution
-        solution = solver.solve(formula)
-        solver.stats.stop_timer()   # Stop timing
-        
-        # Format and output result
-        result = format_output(formula, solution, solver)
+
+        # Read the instance, or generate a random formula
+        source = args["cnf"]
+        if source is not None:
+            from .dimacs import read_dimacs
+
+            formula = read_dimacs(source)
+            source = "<stdin>" if source == "-" else source
+        else:
+            formula = generate_formula(args["n_variables"], args["clause_ratio"], args["seed"])
+
+        # Solve formula using the requested solver
+        solver = SOLVERS[args["solver"]](budget=create_budget(args["budget"]), **args["options"])
+        configure_step_log(solver, args["step_log"])
+        if args["stream"]:
+            stream_output(formula, solver, source=source)
+            return
+
+        # Reuse results across runs when a cache directory is mounted
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+        cache = ResultCache(max_entries=0, directory=cache_dir) if cache_dir else None
+        key = cache_key(formula, args["solver"], {
+            "options": args["options"], "step_log": args["step_log"], "budget": args["budget"]
+        })
+
+        result = cached_solve(formula, solver, key, cache, source)
+
+        # Output result
         print(json.dumps(result, ensure_ascii=False))
-        
+
     except (ValueError, FormulaError) as e:
         error_response = {"error": str(e)}
         print(json.dumps(error_response, ensure_ascii=False), file=sys.stderr)
@@ -88,4 +400,4 @@ def main() -> None:
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
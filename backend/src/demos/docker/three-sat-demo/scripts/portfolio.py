@@ -0,0 +1,312 @@
+"""
+Portfolio solving: race several solver configurations on one formula.
+
+Every member runs in its own process. The first definitive answer wins, a
+verified model from any member or unsatisfiability from a complete solver,
+and the other members are cancelled. Cancellation is a SIGTERM that
+interrupts the member's search, so it still reports its partial statistics
+before exiting; a member that does not report within `cancel_grace` seconds
+is killed. Local search can only prove satisfiability, so when a random
+member gives up the race continues without it.
+
+A budget bounds the whole race: each member gets the time left and the
+count limits, and the parent cancels every member once the time is up or
+the budget's token is cancelled.
+
+    solver = PortfolioSolver([("cdcl", {}), ("dpll", {"heuristic": "vsids"}),
+                              ("random", {"seed": 1})])
+    model = solver.solve(formula)
+    solver.get_statistics()["winner"]
+"""
+import queue
+import signal
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .budget import BudgetExhausted, SolveBudget
+from .solver import COMPLETE_SOLVERS, SATSolver, SOLVERS as ALL_SOLVERS
+from .stats import create_solver_statistics
+from .utils import Formula, FormulaPreprocessor, PackedFormula
+
+# Members run one search each, so portfolios and cube solvers are left out
+SOLVERS = ALL_SOLVERS.select("dpll", "cdcl", "random", "exhaustive")
+
+# Diverse by default: two branching orders, clause learning and two walks
+DEFAULT_MEMBERS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ("cdcl", {}),
+    ("dpll", {}),
+    ("dpll", {"heuristic": "vsids"}),
+    ("random", {"seed": 0}),
+    ("random", {"seed": 1, "strategy": "probsat"}),
+)
+
+# How often the race checks for members that died without reporting
+POLL_INTERVAL = 0.05
+
+MemberSpec = Union[str, Tuple[str, Dict[str, Any]]]
+
+
+@dataclass
+class PortfolioMember:
+    """One configuration in the race"""
+
+    name: str
+    solver: str
+    options: Dict[str, Any]
+
+    @property
+    def complete(self) -> bool:
+        return self.solver in COMPLETE_SOLVERS
+
+
+class _Cancelled(Exception):
+    """Raised inside a member process when the race no longer needs it"""
+
+
+def _cancel(signum, frame):
+    raise _Cancelled()
+
+
+def _run_member(
+    index: int,
+    solver_name: str,
+    options: Dict[str, Any],
+    formula: Union[Formula, PackedFormula],
+    step_log: Dict[str, Any],
+    budget: SolveBudget,
+    results,
+) -> None:
+    """Process body: solve, then send one report whether finished or cancelled"""
+    start = time.perf_counter()
+    solver: Optional[SATSolver] = None
+    report: Dict[str, Any] = {
+        "assignment": None, "steps": None, "error": None, "stop_reason": None
+    }
+    try:
+        signal.signal(signal.SIGTERM, _cancel)
+        solver = SOLVERS[solver_name](budget=budget, **options)
+        if step_log:
+            solver.stats.configure_step_log(**step_log)
+        solution = solver.solve(formula)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        report["status"] = solver.status.value
+        report["stop_reason"] = solver.stop_reason
+        report["assignment"] = solution
+        report["steps"] = solver.get_solving_steps()
+    except _Cancelled:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        report["status"] = "cancelled"
+    except Exception as e:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        report["status"] = "error"
+        report["error"] = str(e) or type(e).__name__
+    report["time_ms"] = (time.perf_counter() - start) * 1000
+    report["statistics"] = solver.get_statistics() if solver is not None else None
+    results.put((index, report))
+
+
+class PortfolioSolver(SATSolver):
+    """Race solver configurations in separate processes; the first definitive answer wins"""
+
+    def __init__(self, members: Optional[Sequence[MemberSpec]] = None,
+                 debug: bool = False, cancel_grace: float = 1.0,
+                 preprocess: Union[bool, FormulaPreprocessor] = False,
+                 budget: Optional[SolveBudget] = None):
+        super().__init__(debug, preprocess, budget)
+        self.stats = create_solver_statistics("portfolio")
+        self.members = self._resolve_members(DEFAULT_MEMBERS if members is None else members)
+        if cancel_grace < 0:
+            raise ValueError("cancel_grace must be non-negative")
+        self.cancel_grace = cancel_grace
+        self._reports: List[Dict[str, Any]] = []
+        self._winner: Optional[int] = None
+        self._sink: Optional[Callable[[dict], None]] = None
+
+    def _resolve_members(self, specs: Sequence[MemberSpec]) -> List[PortfolioMember]:
+        """Validate member specs by constructing each solver once and name them uniquely"""
+        if not specs:
+            raise ValueError("A portfolio needs at least one member")
+        members: List[PortfolioMember] = []
+        names: Dict[str, int] = {}
+        for spec in specs:
+            solver_name, options = (spec, {}) if isinstance(spec, str) else spec
+            if solver_name not in SOLVERS:
+                raise ValueError(f"Portfolio solver must be one of: {', '.join(SOLVERS)}")
+            options = {"debug": self.debug, **options}
+            try:
+                SOLVERS[solver_name](**options)
+            except TypeError as e:
+                raise ValueError(f"Invalid options for {solver_name}: {str(e)}")
+
+            shown = ",".join(f"{key}={value}" for key, value in options.items() if key != "debug")
+            name = f"{solver_name}[{shown}]" if shown else solver_name
+            names[name] = names.get(name, 0) + 1
+            if names[name] > 1:
+                name = f"{name}#{names[name]}"
+            members.append(PortfolioMember(name, solver_name, options))
+        return members
+
+    def stream_steps(self, sink: Optional[Callable[[dict], None]]):
+        """Members log in their own processes, so the winner's steps are replayed to `sink`"""
+        self._sink = sink
+
+    def get_solving_steps(self) -> List[dict]:
+        """The winning member's steps"""
+        if self._winner is None or self._sink is not None:
+            return []
+        return self._reports[self._winner].get("steps") or []
+
+    def get_statistics(self) -> dict:
+        """The winner's statistics, plus the race outcome and every member's report"""
+        winner = self._reports[self._winner] if self._winner is not None else None
+        statistics = dict(winner["statistics"]) if winner is not None else {
+            "total_steps": 0,
+            "max_depth": 0,
+            "unit_propagations": 0,
+            "pure_literals": 0,
+            "backtracks": 0,
+            "two_clause_rules": 0,
+        }
+        statistics.pop("preprocessing", None)
+        statistics["winner"] = self.members[self._winner].name if winner is not None else None
+        statistics["members"] = [
+            {
+                "name": member.name,
+                "solver": member.solver,
+                "status": report.get("status"),
+                "time_ms": report.get("time_ms"),
+                "stop_reason": report.get("stop_reason"),
+                "error": report.get("error"),
+                "statistics": report.get("statistics"),
+            }
+            for member, report in zip(self.members, self._reports)
+        ]
+        statistics["members_cancelled"] = self.stats.stats["members_cancelled"].value
+        statistics["members_failed"] = self.stats.stats["members_failed"].value
+        return self._with_preprocessing(statistics)
+
+    def solve(self, formula: Formula) -> Optional[Dict[int, bool]]:
+        """Race the members and return the first definitive answer"""
+        self.stats.reset()
+        self._reports = [{"status": "pending"} for _ in self.members]
+        self._winner = None
+        meter = self._start_budget()
+        self.stats.start_timer()
+        try:
+            searched = self._preprocess(formula)
+
+            import multiprocessing
+
+            context = multiprocessing.get_context()
+            results = context.Queue()
+            processes = [
+                context.Process(
+                    target=_run_member,
+                    args=(index, member.solver, member.options, searched,
+                          self.stats.step_log_policy, meter.handoff(), results),
+                    daemon=True,
+                )
+                for index, member in enumerate(self.members)
+            ]
+            try:
+                for process in processes:
+                    process.start()
+                    self.stats.increment("members_started")
+                stopped = self._race(searched, processes, results)
+            finally:
+                for process in processes:
+                    if process.is_alive():
+                        process.kill()
+                    process.join()
+                results.close()
+                results.join_thread()
+        finally:
+            self.stats.stop_timer()
+
+        winner = self._reports[self._winner] if self._winner is not None else None
+        solution = winner["assignment"] if winner is not None else None
+        if winner is not None:
+            self._finish(solution)
+        else:
+            # Without a winner the race proved nothing
+            self._stopped(stopped or self._member_stop_reason())
+        if winner is not None and self._sink is not None:
+            for step in winner.get("steps") or []:
+                self._sink(step)
+        return self._reconstruct(solution)
+
+    def _member_stop_reason(self) -> str:
+        """Why a race ended without a winner: the members' shared stop reason, if any"""
+        reasons = {report.get("stop_reason") for report in self._reports}
+        return reasons.pop() if len(reasons) == 1 and None not in reasons else "no_answer"
+
+    def _race(self, formula: Union[Formula, PackedFormula], processes, results) -> Optional[str]:
+        """
+        Collect reports until every member has one, cancelling the rest once one
+        wins or the budget runs out. Returns the stop reason in the latter case.
+        """
+        waiting = set(range(len(processes)))
+        cancel_deadline: Optional[float] = None
+        stopped: Optional[str] = None
+        while waiting:
+            if cancel_deadline is not None and time.perf_counter() >= cancel_deadline:
+                break
+            # Liveness is read before draining: a member that exited has flushed its report
+            exited = {index for index in waiting if not processes[index].is_alive()}
+            reports = []
+            try:
+                reports.append(results.get(timeout=POLL_INTERVAL))
+                while True:
+                    reports.append(results.get_nowait())
+            except queue.Empty:
+                pass
+            for index, report in reports:
+                waiting.discard(index)
+                exited.discard(index)
+                self._record(formula, index, report)
+            for index in exited:
+                waiting.discard(index)
+                if cancel_deadline is not None:
+                    # Terminated before its SIGTERM handler was installed
+                    self._reports[index] = {"status": "cancelled", "statistics": None}
+                    self.stats.increment("members_cancelled")
+                    continue
+                self._reports[index] = {
+                    "status": "error",
+                    "error": f"exited with code {processes[index].exitcode}",
+                }
+                self.stats.increment("members_failed")
+
+            if cancel_deadline is None and self._winner is None:
+                try:
+                    self._meter.check()
+                except BudgetExhausted as e:
+                    stopped = e.reason
+            if cancel_deadline is None and (self._winner is not None or stopped):
+                for index in waiting:
+                    processes[index].terminate()
+                cancel_deadline = time.perf_counter() + self.cancel_grace
+
+        # Members that did not report within the grace period are killed
+        for index in waiting:
+            self._reports[index] = {"status": "cancelled", "statistics": None}
+            self.stats.increment("members_cancelled")
+        return stopped
+
+    def _record(self, formula: Union[Formula, PackedFormula], index: int, report: Dict[str, Any]) -> None:
+        """Store a member's report; the first sat or unsat answer becomes the winner"""
+        # A member's model is only trusted once it is checked here
+        if report["status"] == "sat" and not formula.is_satisfied_by(report["assignment"]):
+            report.update(
+                status="error",
+                assignment=None,
+                error="returned an assignment that does not satisfy the formula",
+            )
+        if report["status"] == "cancelled":
+            self.stats.increment("members_cancelled")
+        elif report["status"] == "error":
+            self.stats.increment("members_failed")
+        self._reports[index] = report
+        if self._winner is None and report["status"] in ("sat", "unsat"):
+            self._winner = index
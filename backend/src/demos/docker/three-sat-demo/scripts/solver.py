@@ -1,19 +1,88 @@
+import heapq
 import random
-from typing import Dict, List, Optional, Tuple
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Type, Union
+)
 
-from .stats import create_solver_statistics
-from .utils import Formula, FormulaSimplifier, Literal
+from .branching import BranchingHeuristic, create_heuristic
+from .budget import BudgetExhausted, BudgetMeter, SolveBudget, SolveStatus
+from .stats import StaticState, create_solver_statistics
+from .utils import Formula, FormulaPreprocessor, PackedFormula, require_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class SATSolver:
     """Base class for SAT solvers"""
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False,
+                 preprocess: Union[bool, FormulaPreprocessor] = False,
+                 budget: Optional[SolveBudget] = None):
         self.debug = debug
         self.stats = None
+        # True uses the default pipeline; an instance configures the passes
+        self.preprocessor = (
+            FormulaPreprocessor() if preprocess is True else preprocess or None
+        )
+        # Limits applied to every solve; None searches until an answer
+        self.budget = budget
+        # Outcome of the last solve, and why it stopped when UNKNOWN
+        self.status: Optional[SolveStatus] = None
+        self.stop_reason: Optional[str] = None
+        self._meter = BudgetMeter()
 
     def solve(self, formula: Formula) -> Optional[Dict[int, bool]]:
         """Solve the given formula"""
         raise NotImplementedError
 
+    def stream_steps(self, sink: Optional[Callable[[dict], None]]):
+        """Hand each step to `sink` as it is logged instead of keeping the log"""
+        self.stats.stats["solution_steps"].value.stream(sink, retain=sink is None)
+
+    def _start_budget(self) -> BudgetMeter:
+        """Clear the last outcome and start charging this solve against the budget"""
+        self.status = None
+        self.stop_reason = None
+        self._meter = BudgetMeter(self.budget)
+        return self._meter
+
+    def _finish(self, result: Optional[Dict[int, bool]], complete: bool = True) -> None:
+        """Record a finished search; an incomplete solver's None proves nothing"""
+        if result is not None:
+            self.status = SolveStatus.SAT
+            self.stats.successful_solves.value += 1
+            return
+        self.stats.failed_solves.value += 1
+        if complete:
+            self.status = SolveStatus.UNSAT
+        else:
+            self.status = SolveStatus.UNKNOWN
+            self.stop_reason = "max_tries"
+
+    def _stopped(self, reason: str) -> None:
+        """Record a search cut short by its budget"""
+        self.status = SolveStatus.UNKNOWN
+        self.stop_reason = reason
+        self.stats.failed_solves.value += 1
+
+    def _preprocess(self, formula: Union[Formula, PackedFormula]) -> Union[Formula, PackedFormula]:
+        """The formula to search: the input, shrunk first when preprocessing is on"""
+        if self.preprocessor is None:
+            return formula
+        return self.preprocessor.preprocess(formula)
+
+    def _reconstruct(self, result: Optional[Dict[int, bool]]) -> Optional[Dict[int, bool]]:
+        """Map a model of the searched formula back to the input formula"""
+        if self.preprocessor is None or result is None:
+            return result
+        return self.preprocessor.reconstruct(result)
+
+    def _with_preprocessing(self, statistics: dict) -> dict:
+        """Add the preprocessing report to a statistics dict when it ran"""
+        if self.preprocessor is not None:
+            statistics["preprocessing"] = dict(self.preprocessor.report)
+        return statistics
+
     def _complete_assignment(self, partial: Dict[int, bool], num_vars: int) -> Dict[int, bool]:
         """Complete a partial assignment by setting unassigned variables to True"""
         return {
@@ -21,38 +90,94 @@ class SATSolver:
             for var in range(1, num_vars + 1)
         }
 
+    def _trace_full_assignment(self, values) -> None:
+        """Replace the step log trail with values for variables 1..n"""
+        steps = self.stats.stats["solution_steps"].value
+        steps.undo(0)
+        for var, value in enumerate(values, start=1):
+            steps.assign(var if value else -var)
+
 class DPLLSolver(SATSolver):
     """DPLL-based SAT solver implementation with detailed logging"""
-    
-    def __init__(self, debug: bool = False):
-        super().__init__(debug)
+
+    # Phase name -> method timed when profiling is on. Assigning and undoing
+    # literals is the incremental form of simplify_formula.
+    PROFILED_PHASES = (
+        ("unit_clause_search", "_find_unit_clause"),
+        ("pure_literal", "_find_pure_literal"),
+        ("implication_graph", "_implication_graph"),
+        ("two_sat", "_solve_two_sat"),
+        ("two_clause_rule", "_apply_two_clause_rule"),
+        ("choose_variable", "_choose_next_variable"),
+        ("assign", "_assign"),
+        ("undo", "_undo"),
+        ("step_logging", "_log_step"),
+    )
+
+    # Failed-literal probing visits at most this many edges per graph edge
+    FAILED_LITERAL_BUDGET = 4
+
+    def __init__(self, debug: bool = False, profile: bool = False,
+                 heuristic: Union[str, BranchingHeuristic] = "frequency",
+                 phase: Optional[str] = None,
+                 preprocess: Union[bool, FormulaPreprocessor] = False,
+                 budget: Optional[SolveBudget] = None):
+        super().__init__(debug, preprocess, budget)
         self.stats = create_solver_statistics("dpll")
+        self.heuristic = create_heuristic(heuristic, phase)
+        self.stats.heuristic = self.heuristic.name
+        self.stats.phase = self.heuristic.phase
         self._current_depth = 0
         self._step_counter = 0
+        self.profile = profile
+        if profile:
+            # Shadow the phase methods with timed wrappers on this instance only
+            phases = self.stats.enable_profiling()
+            for name, method in self.PROFILED_PHASES:
+                setattr(self, method, phases.wrap(name, getattr(self, method)))
 
     def get_solving_steps(self) -> List[dict]:
         """Get the solution steps from statistics"""
-        return self.stats.stats["solution_steps"].value
+        return self.stats.stats["solution_steps"].value.to_list()
 
     def get_statistics(self) -> dict:
         """Get formatted statistics for output"""
-        return {
+        statistics = {
             "total_steps": self._step_counter,
             "max_depth": self.stats.stats["max_decision_depth"].value,
             "unit_propagations": self.stats.stats["unit_propagations"].value,
             "pure_literals": self.stats.stats["pure_literals"].value,
             "backtracks": self.stats.stats["backtracks"].value,
-            "two_clause_rules": self.stats.stats["two_clause_rules"].value
+            "two_clause_rules": self.stats.stats["two_clause_rules"].value,
+            "equivalent_literals": self.stats.stats["equivalent_literals"].value,
+            "two_sat_solves": self.stats.stats["two_sat_solves"].value,
+            "heuristic": self.stats.heuristic,
+            "phase": self.stats.phase,
+            "truncated_steps": self.stats.truncated_steps()
         }
+        if self.profile:
+            statistics["solving_time_ms"] = self.stats.solving_time_ms.value
+            statistics["phases"] = self.stats.profile.report()
+        return self._with_preprocessing(statistics)
 
-    def solve(self, formula: Formula) -> Optional[Dict[int, bool]]:
+    def solve(self, formula: Union[Formula, PackedFormula]) -> Optional[Dict[int, bool]]:
         """Solve using the DPLL algorithm"""
         self.stats.reset()  # Reset statistics
         self._step_counter = 0
         self._current_depth = 0
+        self._start_budget()
+
+        # Appenders for the statistics recorded at every search node
+        self._record_depth = self.stats.stats["decision_depths"].value.append
+        self._record_branch = self.stats.stats["variable_frequencies"].value.append
+        self._record_clause_size = self.stats.stats["clause_sizes"].value.append
         
         self.stats.start_timer()
         try:
+            original, formula = formula, self._preprocess(formula)
+            self._load(formula)
+            self._steps = self.stats.stats["solution_steps"].value
+            self._steps.bind(self._packed.render_residual)
             self._log_step(
                 "start",
                 "Starting DPLL solver",
@@ -60,22 +185,26 @@ class DPLLSolver(SATSolver):
                 {},
             )
             
-            result = self._dpll(formula, {})
-            
+            try:
+                result = self._reconstruct(self._dpll())
+            except BudgetExhausted as e:
+                self._stopped(e.reason)
+                self._log_step("stopped", f"Search stopped: {e.description}", success=False)
+                return None
+
+            self._finish(result)
             if result is not None:
-                self.stats.successful_solves.value += 1
                 self._log_step(
                     "complete",
                     "Found satisfying assignment",
-                    formula,
+                    original,
                     result,
                 )
             else:
-                self.stats.failed_solves.value += 1
                 self._log_step(
                     "complete",
                     "Formula is unsatisfiable",
-                    formula,
+                    original,
                     {},
                     success=False
                 )
@@ -83,21 +212,20 @@ class DPLLSolver(SATSolver):
         finally:
             self.stats.stop_timer()
 
-    def _log_step(self, action_type: str, description: str, formula: Formula, 
-                 assignments: Dict[int, bool], success: bool = True):
-        """Log a solution step with detailed information"""
+    def _log_step(self, action_type: str, description: str, formula: Optional[Formula] = None,
+                 assignments: Optional[Dict[int, bool]] = None, success: bool = True):
+        """Log a solution step; without a formula the current residual formula is used"""
         if self.debug:
             self._step_counter += 1
-            step = {
-                "step_number": self._step_counter,
-                "depth": self._current_depth,
-                "action_type": action_type,
-                "description": description,
-                "formula_state": str(formula),
-                "assignments": assignments.copy(),
-                "success": success
-            }
-            self.stats.stats["solution_steps"].value.append(step)
+            self._steps.record(
+                self._step_counter,
+                self._current_depth,
+                action_type,
+                description,
+                success,
+                assignments=assignments,
+                formula_state=str(formula) if formula is not None else None
+            )
             
             # Update max depth if needed
             self.stats.stats["max_decision_depth"].value = max(
@@ -105,325 +233,1312 @@ class DPLLSolver(SATSolver):
                 self._current_depth
             )
 
-    def _dpll(self, formula: Formula, assignments: Dict[int, bool]) -> Optional[Dict[int, bool]]:
-        """Core DPLL recursive implementation with detailed logging"""
-        self._current_depth += 1
-        self.stats.append("decision_depths", self._current_depth)
+    # Trail state: clauses are lists of signed ints and are never copied. Each
+    # clause keeps a count of true literals and of unassigned literals, updated
+    # in place on assignment and restored when the trail is undone. Active
+    # clauses with exactly two free literals are tracked as they appear and
+    # disappear; they are the edges of the binary implication graph.
+    #
+    # Per-variable counts of positive and negative occurrences in unsatisfied
+    # clauses change only when a clause is satisfied or restored, so unit
+    # clauses and pure literals are queued as they appear, and the branching
+    # heuristic is kept current by events; no step rescans the formula.
 
-        # Base cases
-        if not formula.clauses:
-            self._log_step(
-                "success",
-                "All clauses satisfied",
-                formula,
-                assignments
-            )
-            self._current_depth -= 1
-            return self._complete_assignment(assignments, formula.num_variables)
+    def _load(self, formula: Union[Formula, PackedFormula]) -> None:
+        """Initialize the clause state and assignment trail for a formula"""
+        self._num_vars = formula.num_variables
+        self._packed = formula.pack()
+        self._clauses: List[List[int]] = list(self._packed)
+        self._occurrences: List[List[Tuple[int, int]]] = [
+            [] for _ in range(self._num_vars + 1)
+        ]
+        for index, lits in enumerate(self._clauses):
+            for lit in lits:
+                self._occurrences[abs(lit)].append((index, lit))
+        self._true_count: List[int] = [0] * len(self._clauses)
+        self._free_count: List[int] = [len(lits) for lits in self._clauses]
+        self._active = len(self._clauses)
+        self._empty = sum(1 for lits in self._clauses if not lits)
+        self._binary = {index for index, lits in enumerate(self._clauses) if len(lits) == 2}
+        self._equivalent: Dict[int, int] = {}
+        # Variables already counted as merged, so a class found again deeper is not recounted
+        self._merged: Set[int] = set()
+        self._positive: List[int] = [0] * (self._num_vars + 1)
+        self._negative: List[int] = [0] * (self._num_vars + 1)
+        for lits in self._clauses:
+            for lit in lits:
+                if lit > 0:
+                    self._positive[lit] += 1
+                else:
+                    self._negative[-lit] += 1
+        # Queues are stacks popped from the end, so reverse to start in formula order
+        self._units: List[int] = [
+            index for index in reversed(range(len(self._clauses)))
+            if len(self._clauses[index]) == 1
+        ]
+        self._pure: List[int] = list(range(self._num_vars, 0, -1))
+        self._values: List[Optional[bool]] = [None] * (self._num_vars + 1)
+        self._trail: List[int] = []
+        self.heuristic.attach(
+            self._num_vars, self._clauses, self._values, self._positive, self._negative
+        )
 
-        if any(not clause.literals for clause in formula.clauses):
-            self._log_step(
-                "backtrack",
-                "Empty clause found - backtracking",
-                formula,
-                assignments,
-                success=False
+    def _assign(self, lit: int) -> None:
+        """Assign a literal and update the affected clause states"""
+        var = abs(lit)
+        self._values[var] = lit > 0
+        self._trail.append(lit)
+        true_count = self._true_count
+        free_count = self._free_count
+        binary = self._binary
+        positive = self._positive
+        negative = self._negative
+        pure = self._pure
+        resize = self.heuristic.resize if self.heuristic.tracks_sizes else None
+        for index, occurrence in self._occurrences[var]:
+            free_count[index] -= 1
+            if occurrence == lit:
+                true_count[index] += 1
+                if true_count[index] == 1:
+                    self._active -= 1
+                    binary.discard(index)
+                    if resize:
+                        resize(index, free_count[index] + 1, 0)
+                    # A count reaching zero may leave the other polarity pure
+                    for other in self._clauses[index]:
+                        if other > 0:
+                            positive[other] -= 1
+                            if not positive[other]:
+                                pure.append(other)
+                        else:
+                            negative[-other] -= 1
+                            if not negative[-other]:
+                                pure.append(-other)
+            elif true_count[index] == 0:
+                free = free_count[index]
+                if resize:
+                    resize(index, free + 1, free)
+                if free == 2:
+                    binary.add(index)
+                elif free == 1:
+                    binary.discard(index)
+                    self._units.append(index)
+                elif free == 0:
+                    self._empty += 1
+                    self.heuristic.conflict(index)
+        if self.debug:
+            self._steps.assign(
+                lit,
+                satisfied=[index for index, occurrence in self._occurrences[var]
+                           if occurrence == lit and true_count[index] == 1],
+                shortened=[index for index, occurrence in self._occurrences[var]
+                           if occurrence != lit and true_count[index] == 0]
             )
-            self.stats.increment("backtracks")
-            self._current_depth -= 1
-            return None
 
+    def _undo(self, mark: int) -> None:
+        """
+        Unassign literals from the trail until it has `mark` entries. Marks are
+        always branching nodes, where the inference rules had found no unit
+        clause or pure literal, so the queues are simply emptied.
+        """
+        if self.debug:
+            self._steps.undo(mark)
+        del self._units[:]
+        del self._pure[:]
+        true_count = self._true_count
+        free_count = self._free_count
+        binary = self._binary
+        positive = self._positive
+        negative = self._negative
+        resize = self.heuristic.resize if self.heuristic.tracks_sizes else None
+        unassigned = self._trail[mark:]
+        touched = set()
+        while len(self._trail) > mark:
+            lit = self._trail.pop()
+            var = abs(lit)
+            self._values[var] = None
+            touched.add(var)
+            for index, occurrence in reversed(self._occurrences[var]):
+                free_count[index] += 1
+                if occurrence == lit:
+                    if true_count[index] == 1:
+                        self._active += 1
+                        for other in self._clauses[index]:
+                            if other > 0:
+                                positive[other] += 1
+                            else:
+                                negative[-other] += 1
+                            touched.add(abs(other))
+                        if resize:
+                            resize(index, 0, free_count[index])
+                    true_count[index] -= 1
+                elif true_count[index] == 0:
+                    if free_count[index] == 1:
+                        self._empty -= 1
+                    if resize:
+                        resize(index, free_count[index] - 1, free_count[index])
+                if true_count[index] == 0 and free_count[index] == 2:
+                    binary.add(index)
+                else:
+                    binary.discard(index)
+        self.heuristic.backtracked(unassigned, touched)
+
+    def _assignments(self) -> Dict[int, bool]:
+        """Current partial assignment, in the order variables were assigned"""
+        return {abs(lit): lit > 0 for lit in self._trail}
+
+    def _free_literals(self, index: int) -> List[int]:
+        """Unassigned literals of a clause, in their original order"""
+        values = self._values
+        return [lit for lit in self._clauses[index] if values[abs(lit)] is None]
+
+    def _dpll(self) -> Optional[Dict[int, bool]]:
+        """Core DPLL search, driven by an explicit stack of branching nodes"""
+        # Each entry is [literal tried first, trail length before branching, values tried]
+        branches: List[List[int]] = []
+        meter = self._meter
+
+        while True:
+            meter.tick()
+            self._current_depth += 1
+            self._record_depth(self._current_depth)
+
+            # Base cases
+            if self._active == 0:
+                self._log_step(
+                    "success",
+                    "All clauses satisfied"
+                )
+                self._current_depth -= 1
+                result = self._complete_assignment(self._assignments(), self._num_vars)
+            elif self._empty:
+                self._log_step(
+                    "backtrack",
+                    "Empty clause found - backtracking",
+                    success=False
+                )
+                self.stats.increment("backtracks")
+                meter.backtrack()
+                self._current_depth -= 1
+                result = None
+            else:
+                if self._apply_inference_rules():
+                    continue
+
+                # Variable selection
+                meter.decision()
+                lit = self._choose_next_variable()
+                var = abs(lit)
+                self._record_branch(var)
+                self._log_step(
+                    "branching",
+                    f"Branching on variable x{var}"
+                )
+                self._log_step(
+                    "try_value",
+                    f"Trying x{var} = {lit > 0}"
+                )
+                branches.append([lit, len(self._trail), 1])
+                self._assign(lit)
+                continue
+
+            # Return the result to the closest branching node that can still try a value
+            while branches:
+                branch = branches[-1]
+                lit, mark, tried = branch
+                if result is None:
+                    self._undo(mark)
+                    if tried == 1:
+                        branch[2] = 2
+                        self._log_step(
+                            "try_value",
+                            f"Trying x{abs(lit)} = {lit < 0}"
+                        )
+                        self._assign(-lit)
+                        break
+                    self._log_step(
+                        "backtrack",
+                        f"Both values for x{abs(lit)} failed - backtracking",
+                        success=False
+                    )
+                    self.stats.increment("backtracks")
+                    meter.backtrack()
+                self._current_depth -= 1
+                branches.pop()
+            else:
+                return result
+
+    def _apply_inference_rules(self) -> bool:
+        """Apply unit propagation, pure literal or binary clause rules; return True if one fired"""
         # Unit propagation
-        unit_clause = next((clause for clause in formula.clauses if clause.is_unit()), None)
-        if unit_clause:
-            lit = unit_clause.literals[0]
+        unit_index = self._find_unit_clause()
+        if unit_index is not None:
+            unit_literals = self._free_literals(unit_index)
+            lit = unit_literals[0]
             self._log_step(
                 "unit_propagation",
-                f"Found unit clause {unit_clause}, setting {lit}",
-                formula,
-                assignments
+                f"Found unit clause {_clause_str(unit_literals)}, setting {_literal_str(lit)}"
             )
             
             self.stats.increment("unit_propagations")
-            new_assignments = assignments.copy()
-            new_assignments[lit.variable] = lit.is_positive
-
-            simplified = FormulaSimplifier.simplify_formula(formula, new_assignments)
-            self.stats.append("clause_sizes", len(simplified.clauses))
+            self._assign(lit)
+            self._record_clause_size(1 if self._empty else self._active)
+            return True
 
-            return self._dpll(simplified, new_assignments)
+        # Residual formula is 2-CNF: solve it outright from the implication graph
+        self._equivalent = {}
+        if self._binary and len(self._binary) == self._active:
+            _, component = self._implication_graph()
+            self._solve_two_sat(component)
+            return True
 
         # Pure literal elimination
-        pure_literal = self._find_pure_literal(formula)
-        if pure_literal:
+        pure_literal = self._find_pure_literal()
+        if pure_literal is not None:
             self._log_step(
                 "pure_literal",
-                f"Found pure literal {pure_literal}",
-                formula,
-                assignments
+                f"Found pure literal {_literal_str(pure_literal)}"
             )
             
             self.stats.increment("pure_literals")
-            new_assignments = assignments.copy()
-            new_assignments[pure_literal.variable] = pure_literal.is_positive
-
-            return self._dpll(
-                FormulaSimplifier.simplify_formula(formula, new_assignments),
-                new_assignments
-            )
+            self._assign(pure_literal)
+            return True
 
-        # Two-clause rule
-        two_clause_result = self._apply_two_clause_rule(formula)
+        # Two-clause rule: failed literals in the binary implication graph
+        if not self._binary:
+            return False
+        graph, component = self._implication_graph()
+        two_clause_result = self._apply_two_clause_rule(graph, component)
         if two_clause_result:
-            var, value = two_clause_result
-            self._log_step(
-                "two_clause",
-                f"Applied two-clause rule, setting x{var} = {value}",
-                formula,
-                assignments
-            )
+            lit, description = two_clause_result
+            self._log_step("two_clause", description)
             
             self.stats.increment("two_clause_rules")
-            new_assignments = assignments.copy()
-            new_assignments[var] = value
+            self._assign(lit)
+            return True
 
-            return self._dpll(
-                FormulaSimplifier.simplify_formula(formula, new_assignments),
-                new_assignments
+        self._equivalent = self._equivalence_classes(component)
+        merged = self._equivalent.keys() - self._merged
+        if merged:
+            self._merged |= merged
+            self.stats.increment("equivalent_literals", len(merged))
+        return False
+
+    def _find_unit_clause(self) -> Optional[int]:
+        """Pop queued clauses until one is unsatisfied with exactly one unassigned literal"""
+        units = self._units
+        true_count = self._true_count
+        free_count = self._free_count
+        while units:
+            index = units.pop()
+            if true_count[index] == 0 and free_count[index] == 1:
+                return index
+        return None
+
+    def _find_pure_literal(self) -> Optional[int]:
+        """Pop queued variables until one occurs in the residual formula with one polarity only"""
+        pure = self._pure
+        values = self._values
+        while pure:
+            var = pure.pop()
+            if values[var] is None:
+                if self._positive[var] and not self._negative[var]:
+                    return var
+                if self._negative[var] and not self._positive[var]:
+                    return -var
+        return None
+
+    def _implication_graph(self) -> Tuple[Dict[int, List[int]], Dict[int, int]]:
+        """
+        Implication graph of the residual binary clauses and its strongly
+        connected components. Each clause (a ∨ b) gives the edges ¬a → b and
+        ¬b → a, so building the graph is linear in the number of binary clauses.
+        """
+        graph: Dict[int, List[int]] = {}
+        for index in sorted(self._binary):
+            a, b = self._free_literals(index)
+            for lit in (a, -a, b, -b):
+                if lit not in graph:
+                    graph[lit] = []
+            graph[-a].append(b)
+            graph[-b].append(a)
+        return graph, _strongly_connected(graph)
+
+    def _solve_two_sat(self, component: Dict[int, int]) -> None:
+        """
+        Assign every variable of a residual 2-CNF formula in one step. A literal
+        is made true when its component comes later in topological order than
+        its complement's; if some x and ¬x share a component, no assignment
+        works and the one made here falsifies a clause, which backtracks.
+        """
+        lits = [
+            var if component[var] < component[-var] else -var
+            for var in sorted({abs(lit) for lit in component})
+        ]
+        conflict = next((var for var in map(abs, lits) if component[var] == component[-var]), None)
+        if conflict is None:
+            description = f"Residual formula is 2-CNF; solved it over {len(lits)} variables"
+        else:
+            description = (
+                f"Residual formula is 2-CNF and unsatisfiable: "
+                f"x{conflict} and ¬x{conflict} imply each other"
+            )
+        self._log_step("two_sat", description, success=conflict is None)
+        self.stats.increment("two_sat_solves")
+        for lit in lits:
+            self._assign(lit)
+
+    def _apply_two_clause_rule(
+        self, graph: Dict[int, List[int]], component: Dict[int, int]
+    ) -> Optional[Tuple[int, str]]:
+        """
+        Find a failed literal: one whose binary implications reach its own
+        complement, so the complement must hold. This covers the old
+        (a ∨ b) ∧ (a ∨ ¬b) pattern and any longer chain of implications.
+        """
+        # x and ¬x in one component: the formula is unsatisfiable here, and
+        # setting either value lets unit propagation find the empty clause
+        for lit in graph:
+            if component[lit] == component[-lit]:
+                return lit, (
+                    f"x{abs(lit)} and ¬x{abs(lit)} imply each other, "
+                    f"setting {_literal_str(lit)} to reach the conflict"
+                )
+
+        # Edges never go to a component numbered higher, so l can only reach
+        # ¬l when ¬l's component has the lower number; probing is pruned to
+        # components in between and stops after a linear amount of work
+        budget = self.FAILED_LITERAL_BUDGET * (len(graph) + 2 * len(self._binary))
+        for lit in graph:
+            target = component[-lit]
+            if component[lit] < target:
+                continue
+            seen = {lit}
+            frontier = [lit]
+            while frontier and budget > 0:
+                for succ in graph[frontier.pop()]:
+                    budget -= 1
+                    if succ == -lit:
+                        return -lit, (
+                            f"{_literal_str(lit)} implies its own negation through binary clauses, "
+                            f"setting {_literal_str(-lit)}"
+                        )
+                    if succ not in seen and component[succ] >= target:
+                        seen.add(succ)
+                        frontier.append(succ)
+            if budget <= 0:
+                break
+        return None
+
+    def _equivalence_classes(self, component: Dict[int, int]) -> Dict[int, int]:
+        """
+        Map each variable whose literals share a component with another
+        variable's to the equivalent literal of the smallest such variable, so
+        x ≡ equivalent[x]. Equivalent literals are set together by unit
+        propagation, so branching only needs one of them.
+        """
+        members: Dict[int, List[int]] = {}
+        for lit, ident in component.items():
+            members.setdefault(ident, []).append(lit)
+        equivalent = {}
+        for lits in members.values():
+            if len(lits) > 1:
+                representative = min(lits, key=abs)
+                for lit in lits:
+                    if lit != representative:
+                        equivalent[abs(lit)] = representative if lit > 0 else -representative
+        return equivalent
+
+    def _choose_next_variable(self) -> int:
+        """Decision literal from the branching heuristic, moved onto its class representative"""
+        lit = self.heuristic.choose()
+        representative = self._equivalent.get(abs(lit))
+        if representative is None:
+            return lit
+        return representative if lit > 0 else -representative
+
+
+class CDCLSolver(SATSolver):
+    """Conflict-driven clause-learning SAT solver with two-watched-literal propagation"""
+
+    def __init__(
+        self,
+        debug: bool = False,
+        var_decay: float = 0.95,
+        clause_decay: float = 0.999,
+        restart_base: int = 100,
+        learnt_ratio: float = 1 / 3,
+        preprocess: Union[bool, FormulaPreprocessor] = False,
+        budget: Optional[SolveBudget] = None,
+    ):
+        super().__init__(debug, preprocess, budget)
+        self.stats = create_solver_statistics("cdcl")
+        self.var_decay = var_decay
+        self.clause_decay = clause_decay
+        self.restart_base = restart_base
+        self.learnt_ratio = learnt_ratio
+        self._step_counter = 0
+        self._steps = self.stats.stats["solution_steps"].value
+        self._trail: List[int] = []
+        self._trail_lim: List[int] = []
+
+    def get_solving_steps(self) -> List[dict]:
+        """Get the solution steps from statistics"""
+        return self.stats.stats["solution_steps"].value.to_list()
+
+    def get_statistics(self) -> dict:
+        """Get formatted statistics for output"""
+        return self._with_preprocessing({
+            "total_steps": self._step_counter,
+            "max_depth": self.stats.stats["max_decision_depth"].value,
+            "unit_propagations": self.stats.stats["propagations"].value,
+            "pure_literals": 0,  # CDCL does not eliminate pure literals
+            "backtracks": self.stats.stats["backjumps"].value,
+            "two_clause_rules": 0,
+            "decisions": self.stats.stats["decisions"].value,
+            "conflicts": self.stats.stats["conflicts"].value,
+            "learned_clauses": self.stats.stats["learned_clauses"].value,
+            "deleted_clauses": self.stats.stats["deleted_clauses"].value,
+            "restarts": self.stats.stats["restarts"].value,
+            "truncated_steps": self.stats.truncated_steps(),
+        })
+
+    def solve(self, formula: Union[Formula, PackedFormula]) -> Optional[Dict[int, bool]]:
+        """Solve using conflict-driven clause learning"""
+        self.stats.reset()
+        self._step_counter = 0
+        self._start_budget()
+
+        self.stats.start_timer()
+        try:
+            formula = self._preprocess(formula)
+            formula_state = str(formula) if self.debug else ""
+            self._steps = self.stats.stats["solution_steps"].value
+            self._steps.bind(StaticState(formula_state))
+            self._trail = []
+            self._trail_lim = []
+            self._log_step("start", "Starting CDCL solver")
+
+            try:
+                result = self._reconstruct(self._search(formula))
+            except BudgetExhausted as e:
+                self._stopped(e.reason)
+                self._log_step("stopped", f"Search stopped: {e.description}", success=False)
+                return None
+
+            self._finish(result)
+            if result is not None:
+                self._log_step("complete", "Found satisfying assignment", result)
+            else:
+                self._log_step("complete", "Formula is unsatisfiable", {}, success=False)
+            return result
+        finally:
+            self.stats.stop_timer()
+
+    def _log_step(self, action_type: str, description: str,
+                  assignments: Optional[Dict[int, bool]] = None, success: bool = True):
+        """Log a solution step; the formula state is the input formula"""
+        if self.debug:
+            self._step_counter += 1
+            self._steps.record(
+                self._step_counter,
+                len(self._trail_lim),
+                action_type,
+                description,
+                success,
+                assignments=assignments
             )
 
-        # Variable selection
-        var = self._choose_next_variable(formula)
-        self.stats.append("variable_frequencies", var)
-        self._log_step(
-            "branching",
-            f"Branching on variable x{var}",
-            formula,
-            assignments
+    # Search state
+
+    def _initialize(self, formula: Union[Formula, PackedFormula]) -> bool:
+        """Build clause database and watches; return False on a trivial conflict"""
+        n = formula.num_variables
+        self._num_vars = n
+        self._assigns: List[int] = [0] * (n + 1)     # 1 true, -1 false, 0 unassigned
+        self._level: List[int] = [0] * (n + 1)
+        self._reason: List[int] = [-1] * (n + 1)
+        self._polarity: List[bool] = [False] * (n + 1)
+        self._activity: List[float] = [0.0] * (n + 1)
+        self._var_inc = 1.0
+        self._cla_inc = 1.0
+        self._seen: List[bool] = [False] * (n + 1)
+        self._trail = []
+        self._trail_lim = []
+        self._qhead = 0
+        self._clauses: List[Optional[List[int]]] = []
+        self._learnt_activity: Dict[int, float] = {}
+        self._watches: List[List[int]] = [[] for _ in range(2 * n + 1)]
+        self._heap: List[Tuple[float, int]] = [(-0.0, v) for v in range(1, n + 1)]
+
+        units: List[int] = []
+        for clause in formula.pack():
+            lits: List[int] = []
+            tautology = False
+            for lit in clause:
+                if -lit in lits:
+                    tautology = True
+                    break
+                if lit not in lits:
+                    lits.append(lit)
+            if tautology:
+                continue
+            if not lits:
+                return False
+            if len(lits) == 1:
+                units.append(lits[0])
+                continue
+            self._attach(lits)
+
+        self._num_original = len(self._clauses)
+        self._max_learnts = max(self._num_original * self.learnt_ratio, 10.0)
+
+        for lit in units:
+            value = self._lit_value(lit)
+            if value < 0:
+                return False
+            if value == 0:
+                self._enqueue(lit, -1)
+        return True
+
+    def _attach(self, lits: List[int], learnt: bool = False) -> int:
+        """Add a clause and watch its first two literals"""
+        index = len(self._clauses)
+        self._clauses.append(lits)
+        n = self._num_vars
+        self._watches[-lits[0] + n].append(index)
+        self._watches[-lits[1] + n].append(index)
+        if learnt:
+            self._learnt_activity[index] = self._cla_inc
+        return index
+
+    def _lit_value(self, lit: int) -> int:
+        """Value of a literal: 1 true, -1 false, 0 unassigned"""
+        value = self._assigns[abs(lit)]
+        return value if lit > 0 else -value
+
+    def _enqueue(self, lit: int, reason: int) -> None:
+        """Assign a literal at the current decision level"""
+        var = abs(lit)
+        self._assigns[var] = 1 if lit > 0 else -1
+        self._level[var] = len(self._trail_lim)
+        self._reason[var] = reason
+        self._trail.append(lit)
+        if self.debug:
+            self._steps.assign(lit)
+
+    def _propagate(self) -> int:
+        """Two-watched-literal unit propagation; return conflicting clause index or -1"""
+        assigns = self._assigns
+        clauses = self._clauses
+        watches = self._watches
+        n = self._num_vars
+        trail = self._trail
+
+        while self._qhead < len(trail):
+            true_lit = trail[self._qhead]
+            self._qhead += 1
+            false_lit = -true_lit
+            watch_list = watches[true_lit + n]   # clauses watching false_lit
+            kept: List[int] = []
+            i = 0
+            conflict = -1
+            while i < len(watch_list):
+                index = watch_list[i]
+                i += 1
+                lits = clauses[index]
+                if lits is None:
+                    continue
+                if lits[0] == false_lit:
+                    lits[0], lits[1] = lits[1], false_lit
+
+                first = lits[0]
+                first_value = assigns[abs(first)]
+                if (first_value if first > 0 else -first_value) > 0:
+                    kept.append(index)
+                    continue
+
+                for k in range(2, len(lits)):
+                    lit = lits[k]
+                    value = assigns[abs(lit)]
+                    if (value if lit > 0 else -value) >= 0:
+                        lits[1], lits[k] = lit, false_lit
+                        watches[-lit + n].append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if (first_value if first > 0 else -first_value) < 0:
+                        conflict = index
+                        kept.extend(watch_list[i:])
+                        break
+                    self._enqueue(first, index)
+                    self.stats.increment("propagations")
+                    if self.debug:
+                        self._log_step(
+                            "unit_propagation",
+                            f"Clause {self._clause_str(index)} implies {_literal_str(first)}"
+                        )
+
+            watches[true_lit + n] = kept
+            if conflict >= 0:
+                return conflict
+        return -1
+
+    def _analyze(self, conflict: int) -> Tuple[List[int], int]:
+        """1-UIP conflict analysis; return learned clause and backjump level"""
+        seen = self._seen
+        level = self._level
+        trail = self._trail
+        current_level = len(self._trail_lim)
+        learnt: List[int] = [0]
+        counter = 0
+        lit = 0
+        index = len(trail) - 1
+        clause_index = conflict
+
+        while True:
+            self._bump_clause(clause_index)
+            lits = self._clauses[clause_index]
+            for q in (lits if lit == 0 else lits[1:]):
+                var = abs(q)
+                if not seen[var] and level[var] > 0:
+                    self._bump_variable(var)
+                    seen[var] = True
+                    if level[var] >= current_level:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while not seen[abs(trail[index])]:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            clause_index = self._reason[abs(lit)]
+            seen[abs(lit)] = False
+            counter -= 1
+            if counter == 0:
+                break
+
+        learnt[0] = -lit
+        for q in learnt[1:]:
+            seen[abs(q)] = False
+
+        if len(learnt) == 1:
+            return learnt, 0
+        # Put the literal with the highest level second so it gets watched
+        best = max(range(1, len(learnt)), key=lambda k: level[abs(learnt[k])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, level[abs(learnt[1])]
+
+    def _backjump(self, target_level: int) -> None:
+        """Undo all assignments above the target decision level"""
+        if len(self._trail_lim) <= target_level:
+            return
+        start = self._trail_lim[target_level]
+        if self.debug:
+            self._steps.undo(start)
+        for lit in reversed(self._trail[start:]):
+            var = abs(lit)
+            self._polarity[var] = lit > 0
+            self._assigns[var] = 0
+            self._reason[var] = -1
+            heapq.heappush(self._heap, (-self._activity[var], var))
+        del self._trail[start:]
+        del self._trail_lim[target_level:]
+        self._qhead = len(self._trail)
+
+    def _bump_variable(self, var: int) -> None:
+        """Increase VSIDS activity of a variable involved in a conflict"""
+        self._activity[var] += self._var_inc
+        if self._activity[var] > 1e100:
+            self._activity = [a * 1e-100 for a in self._activity]
+            self._var_inc *= 1e-100
+            self._heap = [(-self._activity[v], v) for v in range(1, self._num_vars + 1)
+                          if self._assigns[v] == 0]
+            heapq.heapify(self._heap)
+        elif self._assigns[var] == 0:
+            heapq.heappush(self._heap, (-self._activity[var], var))
+
+    def _bump_clause(self, index: int) -> None:
+        """Increase activity of a learned clause used in conflict analysis"""
+        if index in self._learnt_activity:
+            self._learnt_activity[index] += self._cla_inc
+            if self._learnt_activity[index] > 1e20:
+                for key in self._learnt_activity:
+                    self._learnt_activity[key] *= 1e-20
+                self._cla_inc *= 1e-20
+
+    def _decay_activities(self) -> None:
+        """Apply VSIDS decay by growing the bump increments"""
+        self._var_inc /= self.var_decay
+        self._cla_inc /= self.clause_decay
+
+    def _pick_branch_variable(self) -> int:
+        """Pop the unassigned variable with the highest activity, or 0 if none remain"""
+        heap = self._heap
+        while heap:
+            neg_activity, var = heapq.heappop(heap)
+            if self._assigns[var] == 0 and -neg_activity == self._activity[var]:
+                return var
+        for var in range(1, self._num_vars + 1):
+            if self._assigns[var] == 0:
+                return var
+        return 0
+
+    def _reduce_db(self) -> None:
+        """Remove the less active half of the learned clauses"""
+        locked = {self._reason[abs(lit)] for lit in self._trail}
+        candidates = sorted(
+            (index for index in self._learnt_activity
+             if index not in locked and len(self._clauses[index]) > 2),
+            key=lambda index: self._learnt_activity[index]
         )
+        removed = candidates[:len(candidates) // 2]
+        for index in removed:
+            self._clauses[index] = None
+            del self._learnt_activity[index]
+        self.stats.stats["deleted_clauses"].value += len(removed)
+
+        n = self._num_vars
+        self._watches = [[] for _ in range(2 * n + 1)]
+        for index, lits in enumerate(self._clauses):
+            if lits is not None:
+                self._watches[-lits[0] + n].append(index)
+                self._watches[-lits[1] + n].append(index)
 
-        # Try assignments
-        for value in [True, False]:
+        if self.debug:
             self._log_step(
-                "try_value",
-                f"Trying x{var} = {value}",
-                formula,
-                assignments
+                "reduce",
+                f"Removed {len(removed)} inactive learned clauses"
             )
-            
-            new_assignments = assignments.copy()
-            new_assignments[var] = value
-            result = self._dpll(
-                FormulaSimplifier.simplify_formula(formula, new_assignments),
-                new_assignments
+
+    def _search(self, formula: Union[Formula, PackedFormula]) -> Optional[Dict[int, bool]]:
+        """Main CDCL loop"""
+        if not self._initialize(formula) or self._propagate() >= 0:
+            self.stats.increment("conflicts")
+            return None
+
+        restart_count = 0
+        conflicts_until_restart = self.restart_base * _luby(1)
+        meter = self._meter
+
+        while True:
+            meter.tick()
+            conflict = self._propagate()
+            if conflict >= 0:
+                self.stats.increment("conflicts")
+                if not self._trail_lim:
+                    self._log_step(
+                        "backtrack",
+                        f"Conflict in {self._clause_str(conflict)} at level 0",
+                        success=False
+                    )
+                    return None
+
+                learnt, backjump_level = self._analyze(conflict)
+                current_level = len(self._trail_lim)
+                self.stats.increment("backjumps")
+                meter.backtrack()
+                self.stats.append("backjump_distances", current_level - backjump_level)
+                self._backjump(backjump_level)
+
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], -1)
+                else:
+                    index = self._attach(learnt, learnt=True)
+                    self._enqueue(learnt[0], index)
+                self.stats.increment("learned_clauses")
+                self.stats.append("learned_clause_sizes", len(learnt))
+                self._decay_activities()
+
+                if self.debug:
+                    self._log_step(
+                        "backtrack",
+                        f"Conflict in {self._clause_str(conflict)}, learned "
+                        f"({' ∨ '.join(_literal_str(lit) for lit in learnt)}), "
+                        f"backjumping from level {current_level} to {backjump_level}",
+                        success=False
+                    )
+
+                conflicts_until_restart -= 1
+                continue
+
+            if conflicts_until_restart <= 0:
+                restart_count += 1
+                self.stats.increment("restarts")
+                conflicts_until_restart = self.restart_base * _luby(restart_count + 1)
+                self._backjump(0)
+                self._log_step("restart", "Restarting search")
+                continue
+
+            if len(self._learnt_activity) - len(self._trail) >= self._max_learnts:
+                self._reduce_db()
+                self._max_learnts *= 1.1
+
+            var = self._pick_branch_variable()
+            if var == 0:
+                return self._complete_assignment(
+                    {abs(lit): lit > 0 for lit in self._trail}, self._num_vars
+                )
+
+            self.stats.increment("decisions")
+            meter.decision()
+            self._trail_lim.append(len(self._trail))
+            self.stats.stats["max_decision_depth"].value = max(
+                self.stats.stats["max_decision_depth"].value, len(self._trail_lim)
             )
-            if result is not None:
-                self._current_depth -= 1
-                return result
+            lit = var if self._polarity[var] else -var
+            self.stats.variable_assignments.value.append(lit)
+            self._log_step(
+                "branching",
+                f"Deciding {_literal_str(lit)} at level {len(self._trail_lim)}"
+            )
+            self._enqueue(lit, -1)
 
-        self._log_step(
-            "backtrack",
-            f"Both values for x{var} failed - backtracking",
-            formula,
-            assignments,
-            success=False
-        )
-        self.stats.increment("backtracks")
-        self._current_depth -= 1
-        return None
+    def _clause_str(self, index: int) -> str:
+        """Render a clause from the database"""
+        return _clause_str(self._clauses[index])
 
-    def _find_pure_literal(self, formula: Formula) -> Optional[Literal]:
-        """Find a pure literal in the formula"""
-        polarities = {}
-        for clause in formula.clauses:
-            for lit in clause.literals:
-                if lit.variable not in polarities:
-                    polarities[lit.variable] = lit.is_positive
-                elif polarities[lit.variable] != lit.is_positive:
-                    polarities[lit.variable] = None
-
-        for var, polarity in polarities.items():
-            if polarity is not None:
-                return Literal(var, polarity)
-        return None
 
-    def _apply_two_clause_rule(self, formula: Formula) -> Optional[Tuple[int, bool]]:
-        """Apply the two-clause rule if possible"""
-        # Find clauses with exactly two literals
-        two_lit_clauses = [c for c in formula.clauses if len(c.literals) == 2]
-        
-        for clause in two_lit_clauses:
-            lit1, lit2 = clause.literals
-            # Look for a complementary clause
-            for other_clause in two_lit_clauses:
-                if other_clause == clause:
-                    continue
-                # Check if we have (a ∨ b) ∧ (a ∨ ¬b) -> a must be true
-                if lit1.variable == other_clause.literals[0].variable:
-                    if lit2.variable == other_clause.literals[1].variable and \
-                      lit2.is_positive != other_clause.literals[1].is_positive:
-                        return lit1.variable, lit1.is_positive
-                # Check the other combination
-                elif lit1.variable == other_clause.literals[1].variable:
-                    if lit2.variable == other_clause.literals[0].variable and \
-                      lit2.is_positive != other_clause.literals[0].is_positive:
-                        return lit1.variable, lit1.is_positive
-                    
-        return None
+def _literal_str(lit: int) -> str:
+    """Render a signed integer literal the way Literal does"""
+    return f"x{lit}" if lit > 0 else f"¬x{-lit}"
+
+
+def _clause_str(lits: List[int]) -> str:
+    """Render a list of signed integer literals the way Clause does"""
+    return f"({' ∨ '.join(_literal_str(lit) for lit in lits)})"
+
+
+def _row_to_assignment(row: "np.ndarray") -> Dict[int, bool]:
+    """Convert one row of an assignment matrix to an assignment dict"""
+    return {var: bool(value) for var, value in enumerate(row.tolist(), start=1)}
+
+
+def _strongly_connected(graph: Dict[int, List[int]]) -> Dict[int, int]:
+    """
+    Tarjan's algorithm, iteratively. Maps each node to its component number;
+    components are numbered in reverse topological order, so an edge u → v
+    always has component[v] <= component[u].
+    """
+    order: Dict[int, int] = {}
+    low: Dict[int, int] = {}
+    component: Dict[int, int] = {}
+    stack: List[int] = []
+    count = 0
+    for root in graph:
+        if root in order:
+            continue
+        order[root] = low[root] = len(order)
+        stack.append(root)
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, edges = work[-1]
+            for succ in edges:
+                if succ not in order:
+                    order[succ] = low[succ] = len(order)
+                    stack.append(succ)
+                    work.append((succ, iter(graph[succ])))
+                    break
+                if succ not in component:  # still on the stack
+                    low[node] = min(low[node], order[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        component[member] = count
+                        if member == node:
+                            break
+                    count += 1
+    return component
+
+
+def _luby(i: int) -> int:
+    """i-th element (1-based) of the Luby restart sequence"""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
 
-    def _choose_next_variable(self, formula: Formula) -> int:
-        """Choose the next variable for branching"""
-        # Count variable frequencies
-        frequencies = {}
-        for clause in formula.clauses:
-            for lit in clause.literals:
-                frequencies[lit.variable] = frequencies.get(lit.variable, 0) + 1
-        
-        # Return the most frequent variable
-        return max(frequencies.items(), key=lambda x: x[1])[0]
-  
 class RandomSATSolver(SATSolver):
     """Random walk SAT solver implementation"""
-    def __init__(self, debug: bool = False, max_tries: int = 100):
-        super().__init__(debug)
+
+    STRATEGIES = ("walksat", "probsat", "sample")
+
+    def __init__(self, debug: bool = False, max_tries: int = 100,
+                 seed: Optional[int] = None, batch_size: int = 1024,
+                 strategy: str = "walksat", max_flips: int = 10000,
+                 noise: float = 0.5, cb: float = 2.3, eps: float = 1.0,
+                 preprocess: Union[bool, FormulaPreprocessor] = False,
+                 budget: Optional[SolveBudget] = None):
+        super().__init__(debug, preprocess, budget)
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Strategy must be one of: {', '.join(self.STRATEGIES)}")
         self.stats = create_solver_statistics("random")
         self.max_tries = max_tries
+        self.batch_size = batch_size
+        self.strategy = strategy
+        self.max_flips = max_flips
+        self.noise = noise
+        self.cb = cb
+        self.eps = eps
+        self.seed = seed
+        self._rng = None  # NumPy generator, created on first use by the sampling strategy
+        self._random = random.Random(seed)
         self._step_counter = 0
 
     def get_solving_steps(self) -> List[dict]:
         """Get the solution steps from statistics"""
-        return self.stats.stats["solution_steps"].value
+        return self.stats.stats["solution_steps"].value.to_list()
 
     def get_statistics(self) -> dict:
         """Get formatted statistics for output"""
-        return {
+        return self._with_preprocessing({
             "total_steps": self._step_counter,
             "max_depth": 0,  # Random solver doesn't use depth
             "unit_propagations": 0,
             "pure_literals": 0,
             "backtracks": 0,
-            "two_clause_rules": 0
-        }
+            "two_clause_rules": 0,
+            "strategy": self.strategy,
+            "total_flips": self.stats.stats["total_flips"].value,
+            "successful_flips": self.stats.stats["successful_flips"].value,
+            "restarts": self.stats.stats["restart_count"].value,
+            "local_minima": self.stats.stats["local_minima"].value,
+            "truncated_steps": self.stats.truncated_steps()
+        })
 
     def solve(self, formula: Formula) -> Optional[Dict[int, bool]]:
-        """Solve using random assignment strategy"""
+        """Solve using stochastic local search or random assignment sampling"""
         self.stats.reset()
         self._step_counter = 0
+        self._start_budget()
         
         self.stats.start_timer()
         try:
-            for _ in range(self.max_tries):
-                # Generate random assignment
-                assignment = {
-                    var: random.choice([True, False])
-                    for var in range(1, formula.num_variables + 1)
-                }
-                
-                if self.debug:
-                    self._log_step(
-                        "try",
-                        "Trying random assignment",
-                        formula,
-                        assignment
-                    )
-                
-                # Check if assignment satisfies formula
-                if formula.is_satisfied_by(assignment):
-                    if self.debug:
-                        self._log_step(
-                            "success",
-                            "Found satisfying assignment",
-                            formula,
-                            assignment
-                        )
-                    return assignment
-            
-            if self.debug:
+            formula = self._preprocess(formula)
+            formula_state = str(formula) if self.debug else ""
+            self.stats.stats["solution_steps"].value.bind(StaticState(formula_state))
+            try:
+                if self.strategy == "sample":
+                    result = self._sample(formula)
+                else:
+                    result = self._local_search(formula)
+            except BudgetExhausted as e:
+                self._stopped(e.reason)
+                self._log_step("stopped", f"Search stopped: {e.description}", success=False)
+                return None
+            result = self._reconstruct(result)
+
+            # Giving up proves nothing, so the status is UNKNOWN rather than UNSAT
+            self._finish(result, complete=False)
+            if result is not None:
+                self._log_step("success", "Found satisfying assignment", result)
+            else:
                 self._log_step(
                     "failure",
                     "Max tries reached without finding solution",
-                    formula,
                     {},
                     success=False
                 )
-            return None
+            return result
         finally:
             self.stats.stop_timer()
 
-    def _log_step(self, action_type: str, description: str, formula: Formula, 
-                 assignments: Dict[int, bool], success: bool = True):
+    def _sample(self, formula: Formula) -> Optional[Dict[int, bool]]:
+        """Draw independent random assignments and check them in batches"""
+        np = require_numpy()
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+        packed = formula.pack()
+        tried = 0
+        while tried < self.max_tries:
+            self._meter.check()
+            # Generate a batch of random assignments and check them in one pass
+            batch_size = min(self.batch_size, self.max_tries - tried)
+            candidates = self._rng.integers(
+                0, 2, size=(batch_size, formula.num_variables), dtype=np.uint8
+            ).astype(bool)
+            satisfied = np.flatnonzero(packed.evaluate_batch(candidates))
+            checked = satisfied[0] + 1 if satisfied.size else batch_size
+            
+            if self.debug:
+                for row in candidates[:checked]:
+                    self._trace_full_assignment(row.tolist())
+                    self._log_step(
+                        "try",
+                        "Trying random assignment"
+                    )
+            tried += checked
+            
+            if satisfied.size:
+                return _row_to_assignment(candidates[satisfied[0]])
+        return None
+
+    # Local search state: `_true_count[c]` is the number of true literals in
+    # clause c, `_critical[c]` the variable of its only true literal when that
+    # count is 1, `_break[v]` the number of clauses that flipping v would
+    # falsify and `_make[v]` the number of unsatisfied clauses that contain v.
+    # Unsatisfied clauses live in `_unsat` with positions in `_unsat_pos`.
+
+    def _local_search(self, formula: Formula) -> Optional[Dict[int, bool]]:
+        """WalkSAT or probSAT with restarts, flipping one variable at a time"""
+        if not self._load_clauses(formula):
+            return None
+        if not self._clauses:
+            return self._complete_assignment({}, formula.num_variables)
+
+        n = formula.num_variables
+        record_improvement = self.stats.stats["flip_improvements"].value.append
+        record_unsatisfied = self.stats.stats["unsatisfied_clauses"].value.append
+        meter = self._meter
+        for attempt in range(self.max_tries):
+            meter.check()
+            self._initialize_walk([self._random.random() < 0.5 for _ in range(n + 1)])
+            if attempt:
+                self.stats.increment("restart_count")
+                self._log_step("restart", f"Restart {attempt}: new random assignment")
+            record_unsatisfied(len(self._unsat))
+            if not self._unsat:
+                return self._assignment_dict()
+
+            for _ in range(self.max_flips):
+                clause = self._unsat[self._random.randrange(len(self._unsat))]
+                var = (self._pick_walksat(clause) if self.strategy == "walksat"
+                       else self._pick_probsat(clause))
+
+                improvement = self._make[var] - self._break[var]
+                self._flip(var)
+                self.stats.increment("total_flips")
+                meter.flip()
+                if improvement > 0:
+                    self.stats.increment("successful_flips")
+                record_improvement(improvement)
+                record_unsatisfied(len(self._unsat))
+                if self.debug:
+                    self._log_step(
+                        "flip",
+                        f"Flipped x{var} to {self._values[var]}, "
+                        f"{len(self._unsat)} clauses unsatisfied"
+                    )
+                if not self._unsat:
+                    return self._assignment_dict()
+        return None
+
+    def _load_clauses(self, formula: Formula) -> bool:
+        """Normalize clauses and build occurrence lists; return False on an empty clause"""
+        n = formula.num_variables
+        self._num_vars = n
+        self._clauses: List[List[int]] = []
+        for clause in formula.pack():
+            lits = list(dict.fromkeys(clause))
+            if not lits:
+                return False
+            if any(-lit in lits for lit in lits):
+                continue  # tautologies are always satisfied
+            self._clauses.append(lits)
+
+        self._occurrences: List[List[int]] = [[] for _ in range(2 * n + 1)]
+        for index, lits in enumerate(self._clauses):
+            for lit in lits:
+                self._occurrences[lit + n].append(index)
+        return True
+
+    def _initialize_walk(self, values: List[bool]) -> None:
+        """Set a full assignment and rebuild the incremental tables from scratch"""
+        n = self._num_vars
+        self._values = values
+        if self.debug:
+            self._trace_full_assignment(values[1:])
+        self._true_count = [0] * len(self._clauses)
+        self._critical = [0] * len(self._clauses)
+        self._break = [0] * (n + 1)
+        self._make = [0] * (n + 1)
+        self._unsat: List[int] = []
+        self._unsat_pos = [-1] * len(self._clauses)
+
+        for index, lits in enumerate(self._clauses):
+            true_lits = [lit for lit in lits if values[abs(lit)] == (lit > 0)]
+            self._true_count[index] = len(true_lits)
+            if not true_lits:
+                self._add_unsat(index)
+                for lit in lits:
+                    self._make[abs(lit)] += 1
+            elif len(true_lits) == 1:
+                self._critical[index] = abs(true_lits[0])
+                self._break[abs(true_lits[0])] += 1
+
+    def _flip(self, var: int) -> None:
+        """Flip a variable and update true counts, break/make tables and the unsat set"""
+        n = self._num_vars
+        values = self._values
+        true_count = self._true_count
+        falsified = var if values[var] else -var
+        values[var] = not values[var]
+        if self.debug:
+            self.stats.stats["solution_steps"].value.flip(var)
+
+        for index in self._occurrences[falsified + n]:
+            true_count[index] -= 1
+            if true_count[index] == 0:
+                self._break[var] -= 1
+                self._add_unsat(index)
+                for lit in self._clauses[index]:
+                    self._make[abs(lit)] += 1
+            elif true_count[index] == 1:
+                for lit in self._clauses[index]:
+                    if values[abs(lit)] == (lit > 0):
+                        self._critical[index] = abs(lit)
+                        self._break[abs(lit)] += 1
+                        break
+
+        for index in self._occurrences[-falsified + n]:
+            true_count[index] += 1
+            if true_count[index] == 1:
+                self._remove_unsat(index)
+                for lit in self._clauses[index]:
+                    self._make[abs(lit)] -= 1
+                self._critical[index] = var
+                self._break[var] += 1
+            elif true_count[index] == 2:
+                self._break[self._critical[index]] -= 1
+
+    def _add_unsat(self, index: int) -> None:
+        """Add a clause to the unsatisfied set"""
+        self._unsat_pos[index] = len(self._unsat)
+        self._unsat.append(index)
+
+    def _remove_unsat(self, index: int) -> None:
+        """Remove a clause from the unsatisfied set by swapping in the last entry"""
+        position = self._unsat_pos[index]
+        last = self._unsat.pop()
+        if last != index:
+            self._unsat[position] = last
+            self._unsat_pos[last] = position
+        self._unsat_pos[index] = -1
+
+    def _pick_walksat(self, index: int) -> int:
+        """WalkSAT/SKC: take a free flip if any, else a noisy minimum-break flip"""
+        variables = [abs(lit) for lit in self._clauses[index]]
+        breaks = [self._break[var] for var in variables]
+        best = min(breaks)
+        if best > 0:
+            if max(self._make[var] - self._break[var] for var in variables) <= 0:
+                self.stats.increment("local_minima")
+            if self._random.random() < self.noise:
+                return self._random.choice(variables)
+        return self._random.choice([var for var, b in zip(variables, breaks) if b == best])
+
+    def _pick_probsat(self, index: int) -> int:
+        """probSAT: sample a variable with probability proportional to (eps + break)^-cb"""
+        variables = [abs(lit) for lit in self._clauses[index]]
+        if max(self._make[var] - self._break[var] for var in variables) <= 0:
+            self.stats.increment("local_minima")
+        weights = [(self.eps + self._break[var]) ** -self.cb for var in variables]
+        return self._random.choices(variables, weights)[0]
+
+    def _assignment_dict(self) -> Dict[int, bool]:
+        """Current local search assignment as a dict"""
+        return {var: self._values[var] for var in range(1, self._num_vars + 1)}
+
+    def _log_step(self, action_type: str, description: str,
+                 assignments: Optional[Dict[int, bool]] = None, success: bool = True):
         """Log a solution step"""
         if self.debug:
             self._step_counter += 1
-            step = {
-                "step_number": self._step_counter,
-                "depth": 0,
-                "action_type": action_type,
-                "description": description,
-                "formula_state": str(formula),
-                "assignments": assignments.copy(),
-                "success": success
-            }
-            self.stats.stats["solution_steps"].value.append(step)
+            self.stats.stats["solution_steps"].value.record(
+                self._step_counter, 0, action_type, description, success,
+                assignments=assignments
+            )
 
 class ExhaustiveSATSolver(SATSolver):
     """Exhaustive search SAT solver implementation"""
-    def __init__(self, debug: bool = False):
-        super().__init__(debug)
+    def __init__(self, debug: bool = False, batch_size: int = 4096,
+                 preprocess: Union[bool, FormulaPreprocessor] = False,
+                 budget: Optional[SolveBudget] = None):
+        super().__init__(debug, preprocess, budget)
+        self.batch_size = batch_size
         self.stats = create_solver_statistics("exhaustive")
         self._step_counter = 0
 
     def get_solving_steps(self) -> List[dict]:
         """Get the solution steps from statistics"""
-        return self.stats.stats["solution_steps"].value
+        return self.stats.stats["solution_steps"].value.to_list()
 
     def get_statistics(self) -> dict:
         """Get formatted statistics for output"""
-        return {
+        return self._with_preprocessing({
             "total_steps": self._step_counter,
             "max_depth": 0,
             "unit_propagations": 0,
             "pure_literals": 0,
             "backtracks": 0,
-            "two_clause_rules": 0
-        }
+            "two_clause_rules": 0,
+            "truncated_steps": self.stats.truncated_steps()
+        })
 
     def solve(self, formula: Formula) -> Optional[Dict[int, bool]]:
         """Solve using exhaustive search"""
         self.stats.reset()
         self._step_counter = 0
+        meter = self._start_budget()
         
         self.stats.start_timer()
         try:
-            # Try all possible assignments
-            for i in range(2 ** formula.num_variables):
-                assignment = {}
-                for var in range(1, formula.num_variables + 1):
-                    assignment[var] = bool((i >> (var - 1)) & 1)
+            # Try all possible assignments, a block of them per vectorized check
+            np = require_numpy()
+            formula = self._preprocess(formula)
+            formula_state = str(formula) if self.debug else ""
+            self.stats.stats["solution_steps"].value.bind(StaticState(formula_state))
+            packed = formula.pack()
+            total = 2 ** formula.num_variables
+            bits = np.arange(formula.num_variables, dtype=np.int64)
+            for start in range(0, total, self.batch_size):
+                try:
+                    meter.check()
+                except BudgetExhausted as e:
+                    self._stopped(e.reason)
+                    self._log_step("stopped", f"Search stopped: {e.description}", success=False)
+                    return None
+                indices = np.arange(start, min(total, start + self.batch_size), dtype=np.int64)
+                candidates = ((indices[:, None] >> bits) & 1).astype(bool)
+                satisfied = np.flatnonzero(packed.evaluate_batch(candidates))
+                checked = satisfied[0] + 1 if satisfied.size else len(indices)
+                self.stats.stats["assignments_tested"].value += int(checked)
                 
                 if self.debug:
-                    self._log_step(
-                        "try",
-                        f"Trying assignment {i + 1}/{2 ** formula.num_variables}",
-                        formula,
-                        assignment
-                    )
+                    for offset in range(checked):
+                        self._trace_full_assignment(candidates[offset].tolist())
+                        self._log_step(
+                            "try",
+                            f"Trying assignment {start + offset + 1}/{total}"
+                        )
                 
-                if formula.is_satisfied_by(assignment):
+                if satisfied.size:
+                    assignment = self._reconstruct(_row_to_assignment(candidates[satisfied[0]]))
+                    self._finish(assignment)
                     if self.debug:
                         self._log_step(
                             "success",
                             "Found satisfying assignment",
-                            formula,
                             assignment
                         )
                     return assignment
             
+            self._finish(None)
             if self.debug:
                 self._log_step(
                     "failure",
                     "No solution found after exhaustive search",
-                    formula,
                     {},
                     success=False
                 )
@@ -431,18 +1546,63 @@ class ExhaustiveSATSolver(SATSolver):
         finally:
             self.stats.stop_timer()
 
-    def _log_step(self, action_type: str, description: str, formula: Formula, 
-                 assignments: Dict[int, bool], success: bool = True):
+    def _log_step(self, action_type: str, description: str,
+                 assignments: Optional[Dict[int, bool]] = None, success: bool = True):
         """Log a solution step"""
         if self.debug:
             self._step_counter += 1
-            step = {
-                "step_number": self._step_counter,
-                "depth": 0,
-                "action_type": action_type,
-                "description": description,
-                "formula_state": str(formula),
-                "assignments": assignments.copy(),
-                "success": success
-            }
-            self.stats.stats["solution_steps"].value.append(step)
\ No newline at end of file
+            self.stats.stats["solution_steps"].value.record(
+                self._step_counter, 0, action_type, description, success,
+                assignments=assignments
+            )
+
+
+class SolverRegistry(Mapping[str, Type[SATSolver]]):
+    """
+    Solver classes by name, each imported on first lookup. Names, membership
+    and select() read only the table, so a front end that never picks the
+    portfolio or cube solver never loads their modules.
+    """
+
+    def __init__(self, entries: Dict[str, Tuple[str, str]]):
+        # Name -> (module relative to this package, class name)
+        self._entries = dict(entries)
+        self._classes: Dict[str, Type[SATSolver]] = {}
+
+    def __getitem__(self, name: str) -> Type[SATSolver]:
+        solver_class = self._classes.get(name)
+        if solver_class is None:
+            module, class_name = self._entries[name]
+            solver_class = getattr(import_module(module, __package__), class_name)
+            self._classes[name] = solver_class
+        return solver_class
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def select(self, *names: str) -> "SolverRegistry":
+        """The named solvers, in the given order, still unresolved"""
+        unknown = [name for name in names if name not in self._entries]
+        if unknown:
+            raise ValueError(f"Unknown solvers: {', '.join(unknown)}")
+        return SolverRegistry({name: self._entries[name] for name in names})
+
+
+# Every solver by name; each front end selects the ones it offers
+SOLVERS = SolverRegistry({
+    "dpll": (".solver", "DPLLSolver"),
+    "cdcl": (".solver", "CDCLSolver"),
+    "random": (".solver", "RandomSATSolver"),
+    "exhaustive": (".solver", "ExhaustiveSATSolver"),
+    "portfolio": (".portfolio", "PortfolioSolver"),
+    "cube": (".cubes", "CubeAndConquerSolver"),
+})
+
+# Solvers whose None result proves the formula unsatisfiable
+COMPLETE_SOLVERS = ("dpll", "cdcl", "exhaustive")
@@ -1,9 +1,27 @@
-import statistics
+import random
 import time
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class StatisticType(Enum):
     """Types of statistics that can be tracked"""
@@ -14,6 +32,21 @@ class StatisticType(Enum):
     LIST = "list"
     STEP_LOG = "step_log"
 
+class StepLogLevel(Enum):
+    """How much of the solving process a step log keeps"""
+
+    OFF = "off"
+    SUMMARY = "summary"
+    DECISIONS = "decisions"
+    FULL = "full"
+
+
+# Action types kept at each step-log level below FULL
+SUMMARY_ACTIONS = frozenset({"start", "complete", "success", "failure"})
+DECISION_ACTIONS = SUMMARY_ACTIONS | {
+    "branching", "try_value", "backtrack", "restart", "split", "cube"
+}
+
 @dataclass
 class StepLogEntry:
     """Container for a single step in the solving process"""
@@ -25,6 +58,455 @@ class StepLogEntry:
     assignments: Dict[int, bool]
     success: bool = True
 
+class StepDelta(NamedTuple):
+    """What changed in the solver state between a logged step and the one before it"""
+
+    step_number: int
+    depth: int
+    action_type: str
+    description: str
+    success: bool
+    undo_to: int  # Length of the assignment trail kept from the previous step
+    assigned: Tuple[int, ...]  # Signed literals pushed after the undo point
+    satisfied: Tuple[Tuple[int, ...], ...]  # Clause ids satisfied by each assigned literal
+    shortened: Tuple[Tuple[int, ...], ...]  # Clause ids shortened by each assigned literal
+    flipped: Tuple[int, ...]  # Variables below the undo point toggled in place
+    assignments: Optional[Dict[int, bool]] = None  # Explicit assignments for this step
+    formula_state: Optional[str] = None  # Explicit formula state for this step
+
+
+class StaticState:
+    """Picklable render callback giving the same formula state for every trail"""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str = ""):
+        self.text = text
+
+    def __call__(self, trail: Sequence[int]) -> str:
+        return self.text
+
+    def __reduce__(self):
+        return (StaticState, (self.text,))
+
+
+class StepLog:
+    """
+    Delta-encoded log of solving steps.
+
+    Solvers report trail changes (assign, undo, flip) as they happen and call
+    record() at each logging point; only the changes since the previous step
+    are stored. Full step dicts in the shape the frontend expects are rebuilt
+    on demand, replaying from periodic trail checkpoints.
+
+    A policy set with configure() limits what is kept: a verbosity level,
+    probabilistic sampling and a cap keeping the first `head` and last `tail`
+    steps. Steps following a dropped one, and all steps in the tail ring, are
+    stored against an empty trail so they replay without their predecessors.
+    """
+
+    def __init__(self, checkpoint_interval: int = 64):
+        self.checkpoint_interval = checkpoint_interval
+        self._render_state: Callable[[Sequence[int]], str] = StaticState()
+        self._sink: Optional[Callable[[dict], None]] = None
+        self._retain = True
+        self.configure()
+
+    def configure(
+        self,
+        level: Union[StepLogLevel, str] = StepLogLevel.FULL,
+        head: Optional[int] = None,
+        tail: int = 0,
+        sample_rate: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Set the logging policy and clear the log.
+
+        With `head` set, only the first `head` and the last `tail` steps are
+        kept. Below a rate of 1.0, steps other than the start and end of a
+        solve are kept with probability `sample_rate`.
+        """
+        try:
+            level = StepLogLevel(level)
+        except ValueError:
+            raise ValueError(
+                "Step log level must be one of: "
+                + ", ".join(option.value for option in StepLogLevel)
+            )
+        if head is not None and head < 0:
+            raise ValueError("Step log head must be non-negative")
+        if tail < 0:
+            raise ValueError("Step log tail must be non-negative")
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError("Step log sample rate must be in (0, 1]")
+        self.level = level
+        self.head = head
+        self.tail = tail
+        self.sample_rate = sample_rate
+        self.seed = seed
+        self.clear()
+
+    def clear(self):
+        """Drop all steps and the tracked trail"""
+        self._deltas: List[StepDelta] = []
+        self._ring: Deque[StepDelta] = deque(maxlen=self.tail)
+        self._checkpoints: Dict[int, List[int]] = {}
+        self._trail: List[int] = []
+        self._effects: List[Tuple[Tuple[int, ...], Tuple[int, ...]]] = []
+        self._positions: Dict[int, int] = {}
+        self._low = 0
+        self._flipped: Set[int] = set()
+        self._gap = False
+        self._rng = random.Random(self.seed)
+        self.truncated = 0
+
+    def bind(self, render_state: Callable[[Sequence[int]], str]):
+        """Set how a formula state is rendered from an assignment trail"""
+        self._render_state = render_state
+
+    def __getstate__(self) -> dict:
+        # A sink is tied to an open stream, so it does not travel with the log
+        state = self.__dict__.copy()
+        state["_sink"] = None
+        return state
+
+    def stream(self, sink: Optional[Callable[[dict], None]], retain: bool = True):
+        """
+        Pass each full step dict to `sink` as soon as it is recorded. With
+        retain=False steps are not kept, so memory stays bounded by the trail.
+        """
+        self._sink = sink
+        self._retain = retain
+
+    def assign(self, lit: int, satisfied: Sequence[int] = (), shortened: Sequence[int] = ()):
+        """Push a signed literal onto the trail"""
+        self._positions[abs(lit)] = len(self._trail)
+        self._trail.append(lit)
+        self._effects.append((tuple(satisfied), tuple(shortened)))
+
+    def undo(self, length: int):
+        """Truncate the trail to `length` literals"""
+        if length < len(self._trail):
+            for lit in self._trail[length:]:
+                del self._positions[abs(lit)]
+            del self._trail[length:]
+            del self._effects[length:]
+            self._low = min(self._low, length)
+
+    def flip(self, variable: int):
+        """Toggle the value of an assigned variable in place"""
+        position = self._positions[variable]
+        self._trail[position] = -self._trail[position]
+        if position < self._low:
+            self._flipped ^= {variable}
+
+    def record(
+        self,
+        step_number: int,
+        depth: int,
+        action_type: str,
+        description: str,
+        success: bool = True,
+        assignments: Optional[Dict[int, bool]] = None,
+        formula_state: Optional[str] = None,
+    ):
+        """Close the current delta as a logged step"""
+        if not self._accepts(action_type):
+            self.truncated += 1
+            self._gap = True
+            self._low = len(self._trail)
+            self._flipped = set()
+            return
+
+        capped = self._retain and self.head is not None and len(self._deltas) >= self.head
+        low = 0 if self._gap or capped else self._low
+        effects = self._effects[low:]
+        delta = StepDelta(
+            step_number,
+            depth,
+            action_type,
+            description,
+            success,
+            low,
+            tuple(self._trail[low:]),
+            tuple(effect[0] for effect in effects),
+            tuple(effect[1] for effect in effects),
+            tuple(
+                sorted(v for v in self._flipped if self._positions.get(v, low) < low)
+            ),
+            assignments.copy() if assignments is not None else None,
+            formula_state,
+        )
+        if self._sink is not None:
+            self._sink(self._materialize(delta, self._trail))
+        if capped:
+            if len(self._ring) == self.tail:
+                self.truncated += 1
+            if self.tail:
+                self._ring.append(delta)
+        elif self._retain:
+            self._deltas.append(delta)
+            if len(self._deltas) % self.checkpoint_interval == 0:
+                self._checkpoints[len(self._deltas) - 1] = list(self._trail)
+        self._gap = False
+        self._low = len(self._trail)
+        self._flipped = set()
+
+    def _accepts(self, action_type: str) -> bool:
+        """Whether the policy keeps a step of this action type"""
+        if self.level is StepLogLevel.FULL:
+            kept = True
+        elif self.level is StepLogLevel.DECISIONS:
+            kept = action_type in DECISION_ACTIONS
+        elif self.level is StepLogLevel.SUMMARY:
+            kept = action_type in SUMMARY_ACTIONS
+        else:
+            return False
+        if kept and self.sample_rate < 1.0 and action_type not in SUMMARY_ACTIONS:
+            kept = self._rng.random() < self.sample_rate
+        return kept
+
+    def __len__(self) -> int:
+        return len(self._deltas) + len(self._ring)
+
+    def __iter__(self) -> Iterator[dict]:
+        trail: List[int] = []
+        for delta in self.deltas:
+            self._apply(trail, delta)
+            yield self._materialize(delta, trail)
+
+    @property
+    def deltas(self) -> List[StepDelta]:
+        """The recorded deltas, oldest first"""
+        return self._deltas + list(self._ring) if self._ring else self._deltas
+
+    def snapshot(self, index: int) -> dict:
+        """Rebuild the full step dict for one step"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("step index out of range")
+        if index >= len(self._deltas):
+            delta = self._ring[index - len(self._deltas)]
+            return self._materialize(delta, list(delta.assigned))
+        checkpoint = ((index + 1) // self.checkpoint_interval) * self.checkpoint_interval - 1
+        trail = list(self._checkpoints[checkpoint]) if checkpoint >= 0 else []
+        for delta in self._deltas[checkpoint + 1 : index + 1]:
+            self._apply(trail, delta)
+        return self._materialize(self._deltas[index], trail)
+
+    def to_list(self) -> List[dict]:
+        """Rebuild every step as the `steps` array the frontend expects"""
+        return list(self)
+
+    @staticmethod
+    def _apply(trail: List[int], delta: StepDelta):
+        """Advance a replayed trail by one delta"""
+        del trail[delta.undo_to :]
+        if delta.flipped:
+            positions = {abs(lit): i for i, lit in enumerate(trail)}
+            for variable in delta.flipped:
+                trail[positions[variable]] = -trail[positions[variable]]
+        trail.extend(delta.assigned)
+
+    def _materialize(self, delta: StepDelta, trail: List[int]) -> dict:
+        """Full step dict for a delta given the trail at that step"""
+        return {
+            "step_number": delta.step_number,
+            "depth": delta.depth,
+            "action_type": delta.action_type,
+            "description": delta.description,
+            "formula_state": (
+                delta.formula_state
+                if delta.formula_state is not None
+                else self._render_state(trail)
+            ),
+            "assignments": (
+                delta.assignments.copy()
+                if delta.assignments is not None
+                else {abs(lit): lit > 0 for lit in trail}
+            ),
+            "success": delta.success,
+        }
+
+
+class StatBuffer:
+    """
+    Typed, reusable storage for a LIST statistic.
+
+    mode="values" keeps every value in a growable array; its append is the
+    array's own append, so recording costs no Python-level call.
+    mode="counter" keeps a count per non-negative integer value, and
+    mode="histogram" a count per fixed-width bin, clamping values outside
+    [low, low + bin_width * num_bins) to the end bins. clear() keeps the
+    buffer object and zeroes counts in place, so references stay valid
+    across solver resets.
+    """
+
+    MODES = ("values", "counter", "histogram")
+
+    def __init__(
+        self,
+        typecode: str = "i",
+        mode: str = "values",
+        low: float = 0.0,
+        bin_width: float = 1.0,
+        num_bins: int = 64,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Mode must be one of: {', '.join(self.MODES)}")
+        if mode == "histogram" and (bin_width <= 0 or num_bins < 1):
+            raise ValueError("Histogram needs a positive bin width and at least one bin")
+        self.typecode = typecode
+        self.mode = mode
+        self.low = low
+        self.bin_width = bin_width
+        self._data = array(typecode)
+        self._counts = array("q", bytes(8 * num_bins) if mode == "histogram" else b"")
+        self._total = 0
+        if mode == "values":
+            self.append = self._data.append
+
+    def append(self, value):
+        """Record one value"""
+        if self.mode == "counter":
+            if value < 0:
+                raise ValueError("Counter statistics take non-negative integers")
+            if value >= len(self._counts):
+                self._counts.extend(array("q", bytes(8 * (value + 1 - len(self._counts)))))
+            self._counts[value] += 1
+        else:
+            index = int((value - self.low) // self.bin_width)
+            self._counts[min(max(index, 0), len(self._counts) - 1)] += 1
+        self._total += 1
+
+    def extend(self, values: Iterable):
+        if self.mode == "values":
+            self._data.extend(values)
+        else:
+            for value in values:
+                self.append(value)
+
+    def merge(self, other: "StatBuffer"):
+        """Add the values recorded by another buffer of the same mode"""
+        if other.mode != self.mode:
+            raise ValueError("Only buffers of the same mode can be merged")
+        if self.mode == "values":
+            self._data.extend(other._data)
+            return
+        if self.mode == "histogram" and (
+            other.low != self.low
+            or other.bin_width != self.bin_width
+            or len(other._counts) != len(self._counts)
+        ):
+            raise ValueError("Histograms must share their bins to be merged")
+        if len(other._counts) > len(self._counts):
+            self._counts.extend(array("q", bytes(8 * (len(other._counts) - len(self._counts)))))
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+        self._total += other._total
+
+    def clear(self):
+        """Forget all values, keeping the buffers"""
+        if self.mode != "values":
+            self._counts[:] = array("q", bytes(8 * len(self._counts)))
+            self._total = 0
+            return
+        try:
+            del self._data[:]
+        except BufferError:
+            # A NumPy view still holds the old buffer; leave it to the view
+            self._data = array(self.typecode)
+            self.append = self._data.append
+
+    def __len__(self) -> int:
+        return len(self._data) if self.mode == "values" else self._total
+
+    def __iter__(self) -> Iterator:
+        """Recorded values; counted modes yield each value (or bin start) count times"""
+        if self.mode == "values":
+            return iter(self._data)
+        return (value for value, count in self.counts().items() for _ in range(count))
+
+    def __getitem__(self, index):
+        if self.mode != "values":
+            raise TypeError(f"{self.mode} statistics are not indexable")
+        return self._data[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (StatBuffer, list, tuple, array)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"StatBuffer({self.mode}, {list(self)!r})"
+
+    def counts(self) -> Dict[float, int]:
+        """Value (or bin start) -> count for the counted modes"""
+        if self.mode == "values":
+            return dict(sorted(Counter(self._data).items()))
+        scale = self.bin_width if self.mode == "histogram" else 1
+        offset = self.low if self.mode == "histogram" else 0
+        return {
+            offset + index * scale: count
+            for index, count in enumerate(self._counts)
+            if count
+        }
+
+    def to_numpy(self) -> "np.ndarray":
+        """
+        Zero-copy NumPy view: the values, or the per-value/per-bin counts.
+        Release the view before the buffer grows again.
+        """
+        from .utils import require_numpy
+
+        np = require_numpy()
+        if self.mode == "values":
+            return np.frombuffer(self._data, dtype=np.dtype(self.typecode))
+        return np.frombuffer(self._counts, dtype=np.int64)
+
+
+class PhaseProfile:
+    """
+    Call counts and inclusive wall time per named solver phase.
+
+    Phases are measured by wrapping the methods that implement them, so a
+    solver that never enables profiling pays nothing.
+    """
+
+    def __init__(self):
+        self._phases: Dict[str, List[float]] = {}
+
+    def wrap(self, name: str, method: Callable) -> Callable:
+        """Return `method` timed under `name`"""
+        entry = self._phases.setdefault(name, [0, 0.0])
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                entry[0] += 1
+                entry[1] += clock() - start
+
+        return timed
+
+    def clear(self):
+        """Zero every phase in place; wrappers keep reporting into the same entries"""
+        for entry in self._phases.values():
+            entry[0] = 0
+            entry[1] = 0.0
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Phase -> calls and total milliseconds"""
+        return {
+            name: {"calls": int(calls), "time_ms": seconds * 1000}
+            for name, (calls, seconds) in self._phases.items()
+        }
+
+
 @dataclass
 class StatisticValue:
     """Container for a statistic with its type and value"""
@@ -34,10 +516,12 @@ class StatisticValue:
     description: str = ""
 
     def __post_init__(self):
-        if self.type == StatisticType.LIST and not isinstance(self.value, list):
-            self.value = []
+        if self.type == StatisticType.LIST and not isinstance(self.value, StatBuffer):
+            self.value = StatBuffer()
         elif self.type == StatisticType.COUNTER and not isinstance(self.value, int):
             self.value = 0
+        elif self.type == StatisticType.STEP_LOG and not isinstance(self.value, StepLog):
+            self.value = StepLog()
 
 
 @dataclass
@@ -71,6 +555,13 @@ class SolverStatistics:
 
     def __post_init__(self):
         self._start_time: Optional[float] = None
+        self.profile: Optional[PhaseProfile] = None
+
+    def enable_profiling(self) -> PhaseProfile:
+        """Start collecting per-phase timings; reset() zeroes them"""
+        if self.profile is None:
+            self.profile = PhaseProfile()
+        return self.profile
 
     def start_timer(self):
         """Start the solving timer"""
@@ -82,13 +573,13 @@ class SolverStatistics:
             self.solving_time_ms.value = (time.perf_counter() - self._start_time) * 1000
             self._start_time = None
 
-    def increment(self, stat_name: str):
+    def increment(self, stat_name: str, amount: int = 1):
         """Increment a counter statistic"""
         if (
             stat_name in self.stats
             and self.stats[stat_name].type == StatisticType.COUNTER
         ):
-            self.stats[stat_name].value += 1
+            self.stats[stat_name].value += amount
 
     def append(self, stat_name: str, value: any):
         """Append a value to a list statistic"""
@@ -100,17 +591,63 @@ class SolverStatistics:
         if stat_name in self.stats:
             self.stats[stat_name].value = value
 
+    def merge(self, other: "SolverStatistics"):
+        """
+        Fold in the statistics of a run over part of the same search, e.g. a
+        worker process: counters add up (max_* counters keep the maximum) and
+        lists are concatenated. Timers, ratios and step logs are left as they are.
+        """
+        self.successful_solves.value += other.successful_solves.value
+        self.failed_solves.value += other.failed_solves.value
+        self.variable_assignments.value.merge(other.variable_assignments.value)
+        for stat_name, theirs in other.stats.items():
+            mine = self.stats.get(stat_name)
+            if mine is None or mine.type != theirs.type:
+                continue
+            if mine.type == StatisticType.COUNTER:
+                if stat_name.startswith("max_"):
+                    mine.value = max(mine.value, theirs.value)
+                else:
+                    mine.value += theirs.value
+            elif mine.type == StatisticType.LIST:
+                mine.value.merge(theirs.value)
+
+    def configure_step_log(
+        self,
+        level: Union[StepLogLevel, str] = StepLogLevel.FULL,
+        head: Optional[int] = None,
+        tail: int = 0,
+        sample_rate: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        """Apply a logging policy to every step log; it survives reset()"""
+        for stat in self.stats.values():
+            if stat.type == StatisticType.STEP_LOG:
+                stat.value.configure(level, head, tail, sample_rate, seed)
+
+    def truncated_steps(self) -> int:
+        """Number of steps the step-log policy did not keep"""
+        return sum(
+            stat.value.truncated
+            for stat in self.stats.values()
+            if stat.type == StatisticType.STEP_LOG
+        )
+
     def reset(self):
         """Reset all statistics to their initial values"""
         self.solving_time_ms.value = 0
         self.successful_solves.value = 0
         self.failed_solves.value = 0
-        self.variable_assignments.value = []
+        self.variable_assignments.value.clear()
+        if self.profile is not None:
+            self.profile.clear()
         for stat in self.stats.values():
             if stat.type == StatisticType.COUNTER:
                 stat.value = 0
             elif stat.type == StatisticType.LIST:
-                stat.value = []
+                stat.value.clear()
+            elif stat.type == StatisticType.STEP_LOG:
+                stat.value.clear()
             elif stat.type == StatisticType.TIMER:
                 stat.value = 0
 
@@ -132,7 +669,13 @@ class DPLLStatistics(SolverStatistics):
                     StatisticType.COUNTER, 0, "Number of pure literals eliminated"
                 ),
                 "two_clause_rules": StatisticValue(
-                    StatisticType.COUNTER, 0, "Number of two-clause rules applied"
+                    StatisticType.COUNTER, 0, "Number of literals forced by binary implications"
+                ),
+                "equivalent_literals": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of variables merged into an equivalent literal"
+                ),
+                "two_sat_solves": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of residual 2-CNF formulas solved directly"
                 ),
                 "decision_depths": StatisticValue(
                     StatisticType.LIST, [], "Depths of decision tree branches"
@@ -141,7 +684,9 @@ class DPLLStatistics(SolverStatistics):
                     StatisticType.LIST, [], "Sizes of clauses after simplification"
                 ),
                 "variable_frequencies": StatisticValue(
-                    StatisticType.LIST, [], "Frequency of variable selections"
+                    StatisticType.LIST,
+                    StatBuffer(mode="counter"),
+                    "Frequency of variable selections",
                 ),
                             "solution_steps": StatisticValue(
                 StatisticType.STEP_LOG, 
@@ -165,6 +710,53 @@ class DPLLStatistics(SolverStatistics):
             )
             }
         )
+        # Branching heuristic and phase policy the solver was configured with
+        self.heuristic: Optional[str] = None
+        self.phase: Optional[str] = None
+
+
+class CDCLStatistics(SolverStatistics):
+    """Statistics specific to CDCL solver"""
+
+    def __init__(self):
+        super().__init__()
+        self.stats.update(
+            {
+                "decisions": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of branching decisions made"
+                ),
+                "propagations": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of literals implied by propagation"
+                ),
+                "conflicts": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of conflicts analyzed"
+                ),
+                "backjumps": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of non-chronological backjumps"
+                ),
+                "learned_clauses": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of clauses learned from conflicts"
+                ),
+                "deleted_clauses": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of learned clauses removed"
+                ),
+                "restarts": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of search restarts"
+                ),
+                "learned_clause_sizes": StatisticValue(
+                    StatisticType.LIST, [], "Sizes of learned clauses"
+                ),
+                "backjump_distances": StatisticValue(
+                    StatisticType.LIST, [], "Decision levels skipped by each backjump"
+                ),
+                "solution_steps": StatisticValue(
+                    StatisticType.STEP_LOG, [], "Detailed log of solution steps"
+                ),
+                "max_decision_depth": StatisticValue(
+                    StatisticType.COUNTER, 0, "Maximum decision level reached"
+                ),
+            }
+        )
 
 
 class RandomWalkStatistics(SolverStatistics):
@@ -192,6 +784,9 @@ class RandomWalkStatistics(SolverStatistics):
                 "flip_improvements": StatisticValue(
                     StatisticType.LIST, [], "Improvement in satisfied clauses per flip"
                 ),
+                "solution_steps": StatisticValue(
+                    StatisticType.STEP_LOG, [], "Detailed log of solution steps"
+                ),
             }
         )
 
@@ -218,70 +813,344 @@ class ExhaustiveStatistics(SolverStatistics):
                 "satisfying_depths": StatisticValue(
                     StatisticType.LIST, [], "Depths where solutions were found"
                 ),
+                "solution_steps": StatisticValue(
+                    StatisticType.STEP_LOG, [], "Detailed log of solution steps"
+                ),
             }
         )
 
 
+class PortfolioStatistics(SolverStatistics):
+    """
+    Statistics of a portfolio race. Members keep their own statistics in
+    their processes; the step-log policy is recorded here and applied to
+    every member.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.step_log_policy: Dict[str, object] = {}
+        self.stats.update(
+            {
+                "members_started": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of member solvers started"
+                ),
+                "members_cancelled": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of members cancelled after another won"
+                ),
+                "members_failed": StatisticValue(
+                    StatisticType.COUNTER, 0, "Number of members that raised or died"
+                ),
+            }
+        )
+
+    def configure_step_log(
+        self,
+        level: Union[StepLogLevel, str] = StepLogLevel.FULL,
+        head: Optional[int] = None,
+        tail: int = 0,
+        sample_rate: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        """Validate a step-log policy and keep it for the members"""
+        StepLog().configure(level, head, tail, sample_rate, seed)
+        self.step_log_policy = {
+            "level": level,
+            "head": head,
+            "tail": tail,
+            "sample_rate": sample_rate,
+            "seed": seed,
+        }
+
+
+@dataclass
+class RunningStats:
+    """Count, mean, variance (Welford), min and max of a stream of numbers"""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+    def add(self, value: float):
+        """Fold one value into the running moments"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "RunningStats"):
+        """Combine with moments computed elsewhere (Chan et al.)"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, 0 for fewer than two values"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return self.variance ** 0.5
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile estimate (merging t-digest).
+
+    Values are buffered and periodically compressed into weighted centroids
+    whose size is bounded by the quantile they cover, so the tails stay
+    precise and memory is O(compression). Small streams are kept exactly.
+    """
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = compression
+        self._centroids: List[Tuple[float, float]] = []  # (mean, weight), sorted
+        self._buffer: List[float] = []
+        self._total = 0.0
+        self._min = float("inf")
+        self._max = float("-inf")
+
+    def add(self, value: float):
+        self._buffer.append(value)
+        self._total += 1
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        if len(self._buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        """Fold another sketch into this one"""
+        if other._total == 0:
+            return
+        self._centroids = sorted(self._centroids + other._centroids)
+        self._buffer.extend(other._buffer)
+        self._total += other._total
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._compress()
+
+    def __len__(self) -> int:
+        return int(self._total)
+
+    def _compress(self):
+        """Merge buffered values into centroids within the size bound"""
+        items = sorted(self._centroids + [(value, 1.0) for value in self._buffer])
+        self._buffer = []
+        if not items:
+            return
+        merged: List[Tuple[float, float]] = []
+        mean, weight = items[0]
+        before = 0.0
+        for next_mean, next_weight in items[1:]:
+            proposed = weight + next_weight
+            q = (before + proposed / 2) / self._total
+            if proposed <= max(1.0, 4 * self._total * q * (1 - q) / self.compression):
+                mean += (next_mean - mean) * next_weight / proposed
+                weight = proposed
+            else:
+                merged.append((mean, weight))
+                before += weight
+                mean, weight = next_mean, next_weight
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated q-quantile, interpolating between centroid centers"""
+        if self._total == 0:
+            return None
+        if self._buffer:
+            self._compress()
+        centroids = self._centroids
+        if len(centroids) == 1:
+            return centroids[0][0]
+        target = q * self._total
+        cumulative = 0.0
+        previous_center, previous_mean = 0.0, self._min
+        for mean, weight in centroids:
+            center = cumulative + weight / 2
+            if target <= center:
+                if center == previous_center:
+                    return mean
+                fraction = (target - previous_center) / (center - previous_center)
+                return previous_mean + fraction * (mean - previous_mean)
+            cumulative += weight
+            previous_center, previous_mean = center, mean
+        if cumulative == previous_center:
+            return self._max
+        fraction = (target - previous_center) / (cumulative - previous_center)
+        return previous_mean + fraction * (self._max - previous_mean)
+
+
+@dataclass
+class OnlineAggregate:
+    """Moments, quantiles and an optional fixed-width histogram of one statistic"""
+
+    moments: RunningStats = field(default_factory=RunningStats)
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    bin_width: Optional[float] = None
+    histogram: Counter = field(default_factory=Counter)
+
+    def add(self, value: float):
+        self.moments.add(value)
+        self.sketch.add(value)
+        if self.bin_width is not None:
+            self.histogram[int(value // self.bin_width)] += 1
+
+    def add_many(self, values: Iterable[float]):
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "OnlineAggregate"):
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        self.histogram.update(other.histogram)
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.sketch.quantile(q)
+
+    def bins(self) -> Dict[float, int]:
+        """Histogram as lower bin edge -> count"""
+        if self.bin_width is None:
+            return {}
+        return {
+            index * self.bin_width: count for index, count in sorted(self.histogram.items())
+        }
+
+
+@dataclass
+class SolverAggregate:
+    """Everything StatisticsAnalyzer keeps about one solver, independent of run count"""
+
+    total_runs: int = 0
+    successes: int = 0
+    attempts: int = 0
+    solving_time: OnlineAggregate = field(default_factory=OnlineAggregate)
+    counters: Dict[str, OnlineAggregate] = field(default_factory=dict)
+    lists: Dict[str, OnlineAggregate] = field(default_factory=dict)
+
+    def add(self, stats: SolverStatistics):
+        """Fold one run's statistics into the aggregate"""
+        self.total_runs += 1
+        self.successes += stats.successful_solves.value
+        self.attempts += stats.successful_solves.value + stats.failed_solves.value
+        self.solving_time.add(stats.solving_time_ms.value)
+        for stat_name, stat_value in stats.stats.items():
+            if stat_value.type == StatisticType.COUNTER:
+                aggregate = self.counters.get(stat_name)
+                if aggregate is None:
+                    aggregate = self.counters[stat_name] = OnlineAggregate()
+                aggregate.add(stat_value.value)
+            elif stat_value.type == StatisticType.LIST:
+                aggregate = self.lists.get(stat_name)
+                if aggregate is None:
+                    aggregate = self.lists[stat_name] = OnlineAggregate(bin_width=1.0)
+                aggregate.add_many(stat_value.value)
+
+    def merge(self, other: "SolverAggregate"):
+        """Combine with an aggregate built elsewhere, e.g. in a worker process"""
+        self.total_runs += other.total_runs
+        self.successes += other.successes
+        self.attempts += other.attempts
+        self.solving_time.merge(other.solving_time)
+        for mine, theirs, bin_width in (
+            (self.counters, other.counters, None),
+            (self.lists, other.lists, 1.0),
+        ):
+            for stat_name, aggregate in theirs.items():
+                mine.setdefault(stat_name, OnlineAggregate(bin_width=bin_width)).merge(aggregate)
+
+
 class StatisticsAnalyzer:
-    """Analyzer for solver statistics"""
+    """Analyzer for solver statistics, aggregating each run as it is added"""
 
     def __init__(self):
-        self.results: Dict[str, List[SolverStatistics]] = defaultdict(list)
+        self.aggregates: Dict[str, SolverAggregate] = defaultdict(SolverAggregate)
+
+    @property
+    def results(self) -> Dict[str, List[SolverStatistics]]:
+        """Removed: runs are no longer kept, read their aggregates instead"""
+        raise AttributeError(
+            "StatisticsAnalyzer.results was removed because runs are folded in as they are "
+            "added; use StatisticsAnalyzer.aggregates, get_summary or get_histogram instead"
+        )
 
     def add_result(self, solver_name: str, stats: SolverStatistics):
         """Add a solver's statistics to the results"""
-        self.results[solver_name].append(stats)
+        self.aggregates[solver_name].add(stats)
+
+    def merge(self, other: "StatisticsAnalyzer"):
+        """Fold in another analyzer's aggregates, e.g. one per worker"""
+        for solver_name, aggregate in other.aggregates.items():
+            self.aggregates[solver_name].merge(aggregate)
 
     def get_summary(self, solver_name: str) -> Dict[str, any]:
         """Generate summary statistics for a solver"""
-        stats_list = self.results[solver_name]
-        if not stats_list:
+        aggregate = self.aggregates.get(solver_name)
+        if aggregate is None or aggregate.total_runs == 0:
             return {}
 
         summary = {
-            "total_runs": len(stats_list),
-            "success_rate": self._calculate_success_rate(stats_list),
-            "avg_solving_time": statistics.mean(
-                s.solving_time_ms.value for s in stats_list
-            ),
-            "median_solving_time": statistics.median(
-                s.solving_time_ms.value for s in stats_list
+            "total_runs": aggregate.total_runs,
+            "success_rate": (
+                aggregate.successes / aggregate.attempts if aggregate.attempts > 0 else 0
             ),
+            "avg_solving_time": aggregate.solving_time.moments.mean,
+            "median_solving_time": aggregate.solving_time.quantile(0.5),
+            "std_solving_time": aggregate.solving_time.moments.stddev,
+            "p95_solving_time": aggregate.solving_time.quantile(0.95),
         }
 
         # Add solver-specific statistics
-        first_stats = stats_list[0]
-        for stat_name, stat_value in first_stats.stats.items():
-            if stat_value.type == StatisticType.COUNTER:
-                summary[f"avg_{stat_name}"] = statistics.mean(
-                    s.stats[stat_name].value for s in stats_list
-                )
-            elif stat_value.type == StatisticType.LIST:
-                # For list statistics, we'll calculate some basic statistics
-                all_values = [v for s in stats_list for v in s.stats[stat_name].value]
-                if all_values:
-                    summary[f"{stat_name}_avg"] = statistics.mean(all_values)
-                    summary[f"{stat_name}_max"] = max(all_values)
-                    summary[f"{stat_name}_min"] = min(all_values)
+        for stat_name, counter in aggregate.counters.items():
+            summary[f"avg_{stat_name}"] = counter.moments.mean
+        for stat_name, values in aggregate.lists.items():
+            # For list statistics, we'll calculate some basic statistics
+            if values.moments.count:
+                summary[f"{stat_name}_avg"] = values.moments.mean
+                summary[f"{stat_name}_max"] = values.moments.maximum
+                summary[f"{stat_name}_min"] = values.moments.minimum
+                summary[f"{stat_name}_median"] = values.quantile(0.5)
 
         return summary
 
-    def _calculate_success_rate(self, stats_list: List[SolverStatistics]) -> float:
-        """Calculate the success rate from a list of statistics"""
-        total_successes = sum(s.successful_solves.value for s in stats_list)
-        total_attempts = sum(
-            s.successful_solves.value + s.failed_solves.value for s in stats_list
-        )
-        return total_successes / total_attempts if total_attempts > 0 else 0
+    def get_histogram(self, solver_name: str, stat_name: str) -> Dict[float, int]:
+        """Value histogram of a LIST statistic across all runs"""
+        aggregate = self.aggregates.get(solver_name)
+        if aggregate is None or stat_name not in aggregate.lists:
+            return {}
+        return aggregate.lists[stat_name].bins()
 
 
 def create_solver_statistics(solver_type: str) -> SolverStatistics:
     """Factory function to create appropriate statistics object"""
     if solver_type.lower() == "dpll":
         return DPLLStatistics()
+    elif solver_type.lower() == "cdcl":
+        return CDCLStatistics()
     elif solver_type.lower() == "random":
         return RandomWalkStatistics()
     elif solver_type.lower() == "exhaustive":
         return ExhaustiveStatistics()
+    elif solver_type.lower() == "portfolio":
+        return PortfolioStatistics()
     else:
         return SolverStatistics()
\ No newline at end of file
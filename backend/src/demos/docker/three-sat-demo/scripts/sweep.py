@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Adaptive phase-transition sweep for random 3-SAT.
+
+Instances for each clause/variable ratio are generated and solved in worker
+processes, from a seed only, so no formula is kept or shipped. Each ratio is
+sampled in batches until the Wilson confidence interval of its SAT
+probability is narrow enough or its sample budget runs out; batches are
+scheduled most-uncertain ratio first, so samples concentrate around the
+transition. Workers aggregate run statistics locally and the aggregates are
+merged into a StatisticsAnalyzer as batches finish.
+
+    python -m scripts.sweep --variables 20 --ratios 3.0 6.0 13
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .solver import COMPLETE_SOLVERS, SOLVERS as ALL_SOLVERS
+from .stats import SolverStatistics, StatisticsAnalyzer
+from .utils import FormulaError, RandomFormulaGenerator, phase_transition_ratios
+
+# Complete solvers only: local search gives up without proving UNSAT, which
+# would count as UNSAT and bias the SAT-probability estimate
+SOLVERS = ALL_SOLVERS.select(*COMPLETE_SOLVERS)
+
+# Search effort of one run, comparable across instances of the same solver
+COST_METRICS: Dict[str, Callable[[SolverStatistics], float]] = {
+    "dpll": lambda stats: len(stats.stats["variable_frequencies"].value),
+    "cdcl": lambda stats: stats.stats["decisions"].value,
+    "exhaustive": lambda stats: stats.stats["assignments_tested"].value,
+}
+
+
+def solve_instance(
+    solver_name: str, num_variables: int, num_clauses: int, seed: int,
+    options: Optional[Dict[str, Any]] = None,
+) -> Tuple[bool, float, SolverStatistics]:
+    """Generate one seeded instance and solve it"""
+    formula = RandomFormulaGenerator().generate(num_variables, num_clauses, seed)
+    solver = SOLVERS[solver_name](debug=False, **(options or {}))
+    solution = solver.solve(formula)
+    return solution is not None, COST_METRICS[solver_name](solver.stats), solver.stats
+
+
+def solve_instances(
+    solver_name: str, num_variables: int, num_clauses: int, seeds: List[int], key: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Tuple[bool, float]], StatisticsAnalyzer]:
+    """
+    Solve a chunk of seeded instances; the unit of work sent to a worker
+    process. Statistics come back already aggregated under `key`.
+    """
+    outcomes = []
+    analyzer = StatisticsAnalyzer()
+    for seed in seeds:
+        satisfiable, cost, stats = solve_instance(
+            solver_name, num_variables, num_clauses, seed, options
+        )
+        outcomes.append((satisfiable, cost))
+        analyzer.add_result(key, stats)
+    return outcomes, analyzer
+
+
+def wilson_interval(successes: int, trials: int, z: float) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion"""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    half = z * ((p * (1 - p) / trials + z * z / (4 * trials * trials)) ** 0.5) / denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+@dataclass
+class RatioPoint:
+    """Running tallies for one clause/variable ratio"""
+
+    ratio: float
+    num_clauses: int
+    satisfiable: int = 0
+    samples: int = 0
+    costs: List[float] = field(default_factory=list)
+    ci_low: float = 0.0
+    ci_high: float = 1.0
+    done: bool = False
+
+    @property
+    def sat_probability(self) -> float:
+        return self.satisfiable / self.samples if self.samples else 0.0
+
+    @property
+    def median_cost(self) -> Optional[float]:
+        if not self.costs:
+            return None
+        ordered = sorted(self.costs)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return float(ordered[middle])
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    def uncertainty(self) -> float:
+        return self.ci_high - self.ci_low
+
+
+class PhaseTransitionSweep:
+    """Adaptive, parallel SAT-probability sweep over clause/variable ratios"""
+
+    def __init__(
+        self,
+        num_variables: int,
+        ratio_range: Tuple[float, float] = (3.0, 6.0),
+        num_ratios: int = 13,
+        solver: str = "dpll",
+        min_samples: int = 20,
+        max_samples: int = 400,
+        batch_size: int = 20,
+        ci_width: float = 0.1,
+        confidence: float = 0.95,
+        workers: Optional[int] = None,
+        seed: int = 0,
+        solver_options: Optional[Dict[str, Any]] = None,
+    ):
+        if solver not in SOLVERS:
+            raise ValueError(f"Solver must be one of: {', '.join(SOLVERS)}")
+        solver_options = dict(solver_options or {})
+        try:
+            SOLVERS[solver](debug=False, **solver_options)
+        except TypeError as e:
+            raise ValueError(f"Invalid solver options: {str(e)}")
+        if not 1 <= min_samples <= max_samples:
+            raise ValueError("Sample bounds must satisfy 1 <= min_samples <= max_samples")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if not 0.0 < ci_width <= 1.0:
+            raise ValueError("ci_width must be in (0, 1]")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError("confidence must be in (0, 1)")
+        if workers is not None and workers < 0:
+            raise ValueError("workers must be non-negative")
+
+        import statistics
+
+        self.num_variables = num_variables
+        self.ratios = phase_transition_ratios(ratio_range, num_ratios)
+        self.solver = solver
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.batch_size = batch_size
+        self.ci_width = ci_width
+        self.confidence = confidence
+        self.workers = workers
+        self.seed = seed
+        self.solver_options = solver_options
+        self._z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+        self._pool_size = workers or os.cpu_count() or 1
+
+    def run(self, analyzer: Optional[StatisticsAnalyzer] = None) -> Dict[str, Any]:
+        """Run the sweep, feeding every run into `analyzer`, and return the curves"""
+        points = [
+            RatioPoint(ratio, int(self.num_variables * ratio)) for ratio in self.ratios
+        ]
+        executor = ProcessPoolExecutor(self.workers) if self.workers != 0 else None
+        pending: Dict[int, Set[Future]] = {}
+        try:
+            for index in self._schedule(points, pending):
+                pending[index] = self._submit(executor, index, points[index])
+            while pending:
+                waiting = set().union(*pending.values())
+                finished, _ = wait(waiting, return_when=FIRST_COMPLETED)
+                for index in list(pending):
+                    batch = pending[index]
+                    if batch - finished:
+                        continue
+                    del pending[index]
+                    self._collect(points[index], batch, analyzer)
+                for index in self._schedule(points, pending):
+                    pending[index] = self._submit(executor, index, points[index])
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return self._curves(points)
+
+    def _schedule(self, points: List[RatioPoint], pending: Dict[int, Set[Future]]) -> List[int]:
+        """Ratios that need another batch, most uncertain first"""
+        ready = [
+            index
+            for index, point in enumerate(points)
+            if not point.done and index not in pending
+        ]
+        return sorted(ready, key=lambda index: -points[index].uncertainty())
+
+    def _submit(self, executor: Optional[ProcessPoolExecutor], index: int, point: RatioPoint) -> Set[Future]:
+        """Queue the next batch for a ratio; seeds depend only on its position"""
+        wanted = self.min_samples if point.samples == 0 else self.batch_size
+        count = min(wanted, self.max_samples - point.samples)
+        seeds = [
+            random.Random(f"{self.seed}:{index}:{sample}").getrandbits(63)
+            for sample in range(point.samples, point.samples + count)
+        ]
+        # One chunk per worker keeps pickling and scheduling overhead per batch small
+        chunk = -(-count // (self._pool_size if executor is not None else 1))
+        batch = set()
+        for start in range(0, count, chunk):
+            args = (
+                self.solver,
+                self.num_variables,
+                point.num_clauses,
+                seeds[start : start + chunk],
+                f"{self.solver}@{point.ratio:g}",
+                self.solver_options,
+            )
+            if executor is None:
+                future: Future = Future()
+                future.set_result(solve_instances(*args))
+            else:
+                future = executor.submit(solve_instances, *args)
+            batch.add(future)
+        return batch
+
+    def _collect(self, point: RatioPoint, batch: Set[Future], analyzer: Optional[StatisticsAnalyzer]):
+        """Fold a finished batch into a ratio's tallies and decide whether it is done"""
+        for future in batch:
+            outcomes, chunk_analyzer = future.result()
+            for satisfiable, cost in outcomes:
+                point.samples += 1
+                point.satisfiable += satisfiable
+                point.costs.append(cost)
+            if analyzer is not None:
+                analyzer.merge(chunk_analyzer)
+        point.ci_low, point.ci_high = wilson_interval(point.satisfiable, point.samples, self._z)
+        point.done = (
+            point.samples >= self.max_samples or point.uncertainty() <= self.ci_width
+        )
+
+    def _curves(self, points: List[RatioPoint]) -> Dict[str, Any]:
+        """SAT-probability and median-cost curves in ratio order"""
+        return {
+            "num_variables": self.num_variables,
+            "solver": self.solver,
+            "solver_options": self.solver_options,
+            "confidence": self.confidence,
+            "ratio": [point.ratio for point in points],
+            "samples": [point.samples for point in points],
+            "sat_probability": [point.sat_probability for point in points],
+            "ci_low": [point.ci_low for point in points],
+            "ci_high": [point.ci_high for point in points],
+            "median_cost": [point.median_cost for point in points],
+        }
+
+
+def main() -> None:
+    """Run a sweep from the command line and print the curves as JSON"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--variables", type=int, default=20)
+    parser.add_argument("--ratios", type=float, nargs=3, default=[3.0, 6.0, 13],
+                        metavar=("MIN", "MAX", "COUNT"))
+    parser.add_argument("--solver", default="dpll", choices=sorted(SOLVERS))
+    parser.add_argument("--min-samples", type=int, default=20)
+    parser.add_argument("--max-samples", type=int, default=400)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--ci-width", type=float, default=0.1)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--workers", type=int, default=None, help="0 runs in-process")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--heuristic", help="dpll branching heuristic")
+    parser.add_argument("--phase", help="dpll phase selection")
+    parser.add_argument("--preprocess", action="store_true", help="shrink each formula before search")
+    args = parser.parse_args()
+    solver_options = {
+        name: value
+        for name, value in (("heuristic", args.heuristic), ("phase", args.phase))
+        if value is not None
+    }
+    if args.preprocess:
+        solver_options["preprocess"] = True
+
+    try:
+        sweep = PhaseTransitionSweep(
+            args.variables,
+            (args.ratios[0], args.ratios[1]),
+            int(args.ratios[2]),
+            solver=args.solver,
+            min_samples=args.min_samples,
+            max_samples=args.max_samples,
+            batch_size=args.batch_size,
+            ci_width=args.ci_width,
+            confidence=args.confidence,
+            workers=args.workers,
+            seed=args.seed,
+            solver_options=solver_options,
+        )
+        curves = sweep.run(StatisticsAnalyzer())
+    except (ValueError, FormulaError) as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(curves, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,27 @@
+import hashlib
 import random
+from array import array
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from numbers import Real
-from typing import Dict, Iterator, List, Optional, Set, Tuple, Union, cast
-
-import numpy as np
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class FormulaError(Exception):
@@ -33,11 +49,30 @@ NumericType = Union[int, float]
 Assignment = Dict[int, bool]
 VariableSet = Set[int]
 
+# Upper bound on literal evaluations held in memory at once by batch evaluation
+BATCH_EVALUATION_CELLS = 1 << 22
+
+
+def require_numpy() -> Any:
+    """
+    Import NumPy on first use. Only batch evaluation and array export need it,
+    so the solvers and the CLI start without paying for the import.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for batch evaluation; install it with 'pip install numpy'"
+        ) from e
+    return numpy
+
 
 @dataclass(frozen=True)
 class Literal:
     """Immutable representation of a literal in a Boolean formula"""
 
+    __slots__ = ("variable", "is_positive")
+
     variable: int
     is_positive: bool
 
@@ -57,9 +92,16 @@ class Literal:
     def __str__(self) -> str:
         return f"x{self.variable}" if self.is_positive else f"¬x{self.variable}"
 
+    def __reduce__(self):
+        return (Literal, (self.variable, self.is_positive))
+
     def negate(self) -> "Literal":
-        """Return a new literal with opposite polarity"""
-        return Literal(self.variable, not self.is_positive)
+        """Return the literal with opposite polarity"""
+        return _intern_literal(-self.to_int())
+
+    def to_int(self) -> int:
+        """Return the DIMACS-style signed integer for this literal"""
+        return self.variable if self.is_positive else -self.variable
 
     @property
     def polarity(self) -> LiteralPolarity:
@@ -69,6 +111,20 @@ class Literal:
         )
 
 
+_LITERAL_CACHE: Dict[int, Literal] = {}
+
+
+def _intern_literal(lit: int) -> Literal:
+    """Return the shared Literal for a signed integer, skipping validation"""
+    literal = _LITERAL_CACHE.get(lit)
+    if literal is None:
+        literal = object.__new__(Literal)
+        object.__setattr__(literal, "variable", abs(lit))
+        object.__setattr__(literal, "is_positive", lit > 0)
+        _LITERAL_CACHE[lit] = literal
+    return literal
+
+
 @dataclass
 class Clause:
     """Representation of a clause in a Boolean formula"""
@@ -85,6 +141,13 @@ class Clause:
                     f"Each literal must be a Literal instance, got {type(literal)}"
                 )
 
+    @classmethod
+    def _trusted(cls, literals: List[Literal]) -> "Clause":
+        """Build a clause from literals known to be valid, skipping validation"""
+        clause = object.__new__(cls)
+        clause.literals = literals
+        return clause
+
     def __str__(self) -> str:
         return f"({' ∨ '.join(str(lit) for lit in self.literals)})"
 
@@ -149,6 +212,14 @@ class Formula:
                 f"Formula contains variable(s) beyond declared number: {max(all_vars)} > {self.num_variables}"
             )
 
+    @classmethod
+    def _trusted(cls, clauses: List[Clause], num_variables: int) -> "Formula":
+        """Build a formula from clauses known to be valid, skipping validation"""
+        formula = object.__new__(cls)
+        formula.clauses = clauses
+        formula.num_variables = num_variables
+        return formula
+
     def __str__(self) -> str:
         return (
             f"Formula with {self.num_variables} variables:\n"
@@ -183,6 +254,313 @@ class Formula:
             return None
         return all(cast(bool, result) for result in results)
 
+    def is_satisfied_by(self, assignment: Assignment) -> bool:
+        """Check whether an assignment satisfies every clause"""
+        return self.evaluate(assignment) is True
+
+    def evaluate_batch(self, assignments: "np.ndarray") -> "np.ndarray":
+        """
+        Evaluate a (k, num_variables) boolean matrix of complete assignments,
+        where column j holds variable j + 1. Returns k booleans.
+        """
+        return self.pack().evaluate_batch(assignments)
+
+    def clause_satisfaction(self, assignments: "np.ndarray") -> "np.ndarray":
+        """Per-clause satisfaction matrix (k, num_clauses) for a batch of assignments"""
+        return self.pack().clause_satisfaction(assignments)
+
+    def pack(self) -> "PackedFormula":
+        """Return the compact array-backed representation of this formula"""
+        return PackedFormula.from_formula(self)
+
+    def canonical(self) -> "CanonicalForm":
+        """
+        Order-independent form: the variable count and the sorted clauses,
+        each a sorted tuple of signed literals. Duplicates are kept.
+        """
+        return _canonical(
+            self.num_variables,
+            ((lit.to_int() for lit in clause.literals) for clause in self.clauses),
+        )
+
+    def canonical_hash(self) -> str:
+        """Stable SHA-256 hex digest of the canonical form"""
+        return _canonical_hash(self.canonical())
+
+
+CanonicalForm = Tuple[int, Tuple[Tuple[int, ...], ...]]
+
+
+def _literal_order(lit: int) -> Tuple[int, int]:
+    """Sort key placing x before ¬x and lower variables first"""
+    return (abs(lit), lit < 0)
+
+
+def _canonical(num_variables: int, clauses: Iterable[Iterable[int]]) -> CanonicalForm:
+    """Sort literals within each clause, then sort the clauses"""
+    return (
+        num_variables,
+        tuple(sorted(tuple(sorted(clause, key=_literal_order)) for clause in clauses)),
+    )
+
+
+def _canonical_hash(form: CanonicalForm) -> str:
+    """SHA-256 of the canonical form written as DIMACS text"""
+    num_variables, clauses = form
+    text = f"p cnf {num_variables} {len(clauses)}\n" + "".join(
+        " ".join(map(str, clause)) + " 0\n" for clause in clauses
+    )
+    return hashlib.sha256(text.encode("ascii")).hexdigest()
+
+
+class PackedFormula:
+    """
+    Compact CNF representation: every literal is a signed int in one flat
+    array, and clause i spans literals[offsets[i]:offsets[i + 1]].
+    """
+
+    __slots__ = ("literals", "offsets", "num_variables")
+
+    def __init__(
+        self,
+        literals: Iterable[int],
+        offsets: Iterable[int],
+        num_variables: int,
+    ) -> None:
+        """Build a packed formula from raw buffers, validating them"""
+        try:
+            self.literals: array = array("i", literals)
+            self.offsets: array = array("i", offsets)
+        except (TypeError, OverflowError) as e:
+            raise FormulaError(f"Invalid packed formula buffers: {str(e)}")
+        self.num_variables: int = num_variables
+        self._validate()
+
+    @classmethod
+    def _trusted(
+        cls, literals: array, offsets: array, num_variables: int
+    ) -> "PackedFormula":
+        """Wrap buffers known to be valid, skipping validation and copies"""
+        packed = object.__new__(cls)
+        packed.literals = literals
+        packed.offsets = offsets
+        packed.num_variables = num_variables
+        return packed
+
+    @classmethod
+    def from_formula(cls, formula: Formula) -> "PackedFormula":
+        """Pack an already validated Formula"""
+        if not isinstance(formula, Formula):
+            raise FormulaError(f"Expected Formula instance, got {type(formula)}")
+        literals = array("i")
+        offsets = array("i", [0])
+        for clause in formula.clauses:
+            literals.extend(lit.to_int() for lit in clause.literals)
+            offsets.append(len(literals))
+        return cls._trusted(literals, offsets, formula.num_variables)
+
+    @classmethod
+    def from_clauses(
+        cls, clauses: Iterable[Sequence[int]], num_variables: Optional[int] = None
+    ) -> "PackedFormula":
+        """Pack clauses given as sequences of signed ints (DIMACS convention)"""
+        literals = array("i")
+        offsets = array("i", [0])
+        try:
+            for clause in clauses:
+                literals.extend(clause)
+                offsets.append(len(literals))
+        except (TypeError, OverflowError) as e:
+            raise FormulaError(f"Clauses must contain integer literals: {str(e)}")
+        if num_variables is None:
+            num_variables = max((abs(lit) for lit in literals), default=1)
+        packed = cls._trusted(literals, offsets, num_variables)
+        packed._validate()
+        return packed
+
+    def _validate(self) -> None:
+        """Check buffer consistency and literal ranges"""
+        if not isinstance(self.num_variables, int) or self.num_variables < 1:
+            raise FormulaError(
+                f"Number of variables must be a positive integer, got {self.num_variables}"
+            )
+        offsets = self.offsets
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(self.literals):
+            raise FormulaError("Clause offsets must start at 0 and end at the literal count")
+        if any(offsets[i] > offsets[i + 1] for i in range(len(offsets) - 1)):
+            raise FormulaError("Clause offsets must be non-decreasing")
+        for lit in self.literals:
+            if lit == 0:
+                raise FormulaError("Literal 0 is not a valid literal")
+            if abs(lit) > self.num_variables:
+                raise FormulaError(
+                    f"Formula contains variable(s) beyond declared number: {abs(lit)} > {self.num_variables}"
+                )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[List[int]]:
+        literals = self.literals
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield literals[offsets[i] : offsets[i + 1]].tolist()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedFormula):
+            return NotImplemented
+        return (
+            self.num_variables == other.num_variables
+            and self.offsets == other.offsets
+            and self.literals == other.literals
+        )
+
+    def __str__(self) -> str:
+        clauses = (
+            f"({' ∨ '.join(str(_intern_literal(lit)) for lit in clause)})"
+            for clause in self
+        )
+        return f"Formula with {self.num_variables} variables:\n{' ∧ '.join(clauses)}"
+
+    def __reduce__(self):
+        return (
+            PackedFormula._trusted,
+            (self.literals, self.offsets, self.num_variables),
+        )
+
+    @property
+    def num_literals(self) -> int:
+        """Total number of literal occurrences"""
+        return len(self.literals)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the literal and offset buffers in bytes"""
+        return (
+            len(self.literals) * self.literals.itemsize
+            + len(self.offsets) * self.offsets.itemsize
+        )
+
+    def clause(self, index: int) -> List[int]:
+        """Return the literals of one clause as signed ints"""
+        return self.literals[self.offsets[index] : self.offsets[index + 1]].tolist()
+
+    def is_satisfied_by(self, assignment: Assignment) -> bool:
+        """Check whether an assignment satisfies every clause"""
+        literals = self.literals
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            for lit in literals[offsets[i] : offsets[i + 1]]:
+                if assignment.get(abs(lit)) == (lit > 0):
+                    break
+            else:
+                return False
+        return True
+
+    def canonical(self) -> CanonicalForm:
+        """Order-independent form, equal to that of the unpacked formula"""
+        return _canonical(self.num_variables, self)
+
+    def canonical_hash(self) -> str:
+        """Stable SHA-256 hex digest of the canonical form"""
+        return _canonical_hash(self.canonical())
+
+    def pack(self) -> "PackedFormula":
+        """Return self, so solvers can accept either representation"""
+        return self
+
+    def render_residual(self, assigned: Sequence[int]) -> str:
+        """
+        Render the formula simplified by the assigned literals, exactly as
+        str(FormulaSimplifier.simplify_formula(...)) would.
+        """
+        values = {abs(lit): lit > 0 for lit in assigned}
+        parts: List[str] = []
+        for clause in self:
+            free: List[int] = []
+            for lit in clause:
+                value = values.get(abs(lit))
+                if value is None:
+                    free.append(lit)
+                elif value == (lit > 0):
+                    break
+            else:
+                if not free and values:
+                    parts = ["()"]
+                    break
+                parts.append(
+                    f"({' ∨ '.join(str(_intern_literal(lit)) for lit in free)})"
+                )
+        return f"Formula with {self.num_variables} variables:\n{' ∧ '.join(parts)}"
+
+    def to_formula(self) -> Formula:
+        """Expand into the object representation, sharing interned literals"""
+        return Formula._trusted(
+            [
+                Clause._trusted([_intern_literal(lit) for lit in clause])
+                for clause in self
+            ],
+            self.num_variables,
+        )
+
+    def to_numpy(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Zero-copy views of the literal and offset buffers as NumPy arrays"""
+        np = require_numpy()
+        return (
+            np.frombuffer(self.literals, dtype=np.intc),
+            np.frombuffer(self.offsets, dtype=np.intc),
+        )
+
+    def evaluate_batch(self, assignments: "np.ndarray") -> "np.ndarray":
+        """
+        Evaluate a (k, num_variables) boolean matrix of complete assignments,
+        where column j holds variable j + 1. Returns k booleans.
+        """
+        np = require_numpy()
+        matrix = self._assignment_matrix(assignments)
+        result = np.empty(matrix.shape[0], dtype=bool)
+        for start, stop in self._row_chunks(matrix.shape[0]):
+            result[start:stop] = self._satisfied_clauses(matrix[start:stop]).all(axis=1)
+        return result
+
+    def clause_satisfaction(self, assignments: "np.ndarray") -> "np.ndarray":
+        """Per-clause satisfaction matrix (k, num_clauses) for a batch of assignments"""
+        np = require_numpy()
+        matrix = self._assignment_matrix(assignments)
+        result = np.empty((matrix.shape[0], len(self)), dtype=bool)
+        for start, stop in self._row_chunks(matrix.shape[0]):
+            result[start:stop] = self._satisfied_clauses(matrix[start:stop])
+        return result
+
+    def _assignment_matrix(self, assignments: "np.ndarray") -> "np.ndarray":
+        """Validate and coerce a batch of assignments to a boolean matrix"""
+        np = require_numpy()
+        matrix = np.asarray(assignments)
+        if matrix.ndim != 2 or matrix.shape[1] != self.num_variables:
+            raise FormulaError(
+                f"Assignments must have shape (k, {self.num_variables}), got {matrix.shape}"
+            )
+        return matrix.astype(bool, copy=False)
+
+    def _row_chunks(self, rows: int) -> Iterator[Tuple[int, int]]:
+        """Split rows so each chunk evaluates at most BATCH_EVALUATION_CELLS literals"""
+        step = max(1, BATCH_EVALUATION_CELLS // max(1, len(self.literals)))
+        for start in range(0, rows, step):
+            yield start, min(rows, start + step)
+
+    def _satisfied_clauses(self, matrix: "np.ndarray") -> "np.ndarray":
+        """Clause satisfaction for one chunk of assignment rows"""
+        np = require_numpy()
+        literals, offsets = self.to_numpy()
+        satisfied = np.zeros((matrix.shape[0], len(self)), dtype=bool)
+        non_empty = np.flatnonzero(offsets[1:] > offsets[:-1])
+        if non_empty.size:
+            literal_true = matrix[:, np.abs(literals) - 1] == (literals > 0)
+            satisfied[:, non_empty] = np.logical_or.reduceat(
+                literal_true, offsets[non_empty], axis=1
+            )
+        return satisfied
+
 
 class FormulaSimplifier:
     """Utility class for formula simplification operations"""
@@ -218,10 +596,10 @@ class FormulaSimplifier:
                 if new_clause is None:  # Clause is satisfied
                     continue
                 if not new_clause.literals:  # Empty clause (contradiction)
-                    return Formula([Clause()], formula.num_variables)
+                    return Formula._trusted([Clause._trusted([])], formula.num_variables)
                 new_clauses.append(new_clause)
 
-            return Formula(new_clauses, formula.num_variables)
+            return Formula._trusted(new_clauses, formula.num_variables)
         except Exception as e:
             raise FormulaError(f"Error during formula simplification: {str(e)}")
 
@@ -238,7 +616,263 @@ class FormulaSimplifier:
                     return None  # Clause is satisfied
             else:
                 new_literals.append(lit)
-        return Clause(new_literals)
+        return Clause._trusted(new_literals)
+
+
+class FormulaPreprocessor:
+    """
+    Shrink a formula before search with a pipeline of passes, each of which
+    preserves satisfiability:
+
+    - "dedup": drop tautologies and duplicate clauses
+    - "subsumption": drop every clause that contains another clause
+    - "strengthening": self-subsuming resolution; (a ∨ b) turns
+      (¬a ∨ b ∨ c) into (b ∨ c)
+    - "elimination": bounded variable elimination; replace the clauses of a
+      variable by their resolvents when that does not grow the formula
+
+    Passes run in the given order and the pipeline repeats while it still
+    changes the formula. Remaining variables are renumbered 1..k unless
+    renumber is False. What was eliminated is recorded, so reconstruct()
+    turns a model of the result into a model of the input formula.
+    """
+
+    PASSES = ("dedup", "subsumption", "strengthening", "elimination")
+
+    def __init__(
+        self,
+        passes: Sequence[str] = PASSES,
+        rounds: int = 3,
+        max_occurrences: int = 16,
+        max_resolvent_size: int = 16,
+        clause_growth: int = 0,
+        renumber: bool = True,
+    ) -> None:
+        unknown = [name for name in passes if name not in self.PASSES]
+        if unknown:
+            raise ValueError(
+                f"Unknown preprocessing pass {unknown[0]!r}; choose from {', '.join(self.PASSES)}"
+            )
+        if rounds < 1:
+            raise ValueError("Preprocessing rounds must be positive")
+        self.passes = tuple(passes)
+        self.rounds = rounds
+        self.max_occurrences = max_occurrences
+        self.max_resolvent_size = max_resolvent_size
+        self.clause_growth = clause_growth
+        self.renumber = renumber
+        self.report: Dict[str, int] = {}
+        self._num_variables = 0
+        self._original: List[int] = []
+        self._eliminated: List[Tuple[int, List[List[int]]]] = []
+
+    def preprocess(
+        self, formula: Union[Formula, PackedFormula]
+    ) -> Union[Formula, PackedFormula]:
+        """Run the passes and return a smaller formula of the same type"""
+        packed = formula.pack()
+        self._load(packed)
+        self.report = {
+            "variables_before": len(self._variables()),
+            "clauses_before": len(packed),
+            "tautologies": 0,
+            "duplicate_clauses": 0,
+            "subsumed": 0,
+            "strengthened": 0,
+            "eliminated_variables": 0,
+            "resolvents": 0,
+        }
+        for _ in range(self.rounds):
+            changed = False
+            for name in self.passes:
+                changed = getattr(self, f"_{name}")() or changed
+                if self._unsat:
+                    break
+            if not changed or self._unsat:
+                break
+
+        clauses = (
+            [[]] if self._unsat else [lits for lits in self._lits if lits is not None]
+        )
+        variables = sorted({abs(lit) for lits in clauses for lit in lits})
+        if self.renumber:
+            self._original = [0] + variables
+            number = {var: new for new, var in enumerate(variables, start=1)}
+            clauses = [
+                [number[lit] if lit > 0 else -number[-lit] for lit in lits] for lits in clauses
+            ]
+            num_variables = max(1, len(variables))
+        else:
+            self._original = list(range(packed.num_variables + 1))
+            num_variables = packed.num_variables
+        self.report["variables_after"] = len(variables)
+        self.report["clauses_after"] = len(clauses)
+
+        if isinstance(formula, PackedFormula):
+            return PackedFormula.from_clauses(clauses, num_variables)
+        return Formula._trusted(
+            [Clause._trusted([_intern_literal(lit) for lit in lits]) for lits in clauses],
+            num_variables,
+        )
+
+    def reconstruct(self, model: Assignment) -> Dict[int, bool]:
+        """Extend a model of the last preprocessed formula to the input formula"""
+        original = self._original
+        values = {original[var]: value for var, value in model.items() if 0 < var < len(original)}
+        # Undo eliminations last to first: make x true only if a clause needs it
+        for var, clauses in reversed(self._eliminated):
+            values[var] = any(
+                var in lits
+                and not any(values.get(abs(lit), True) == (lit > 0) for lit in lits if lit != var)
+                for lits in clauses
+            )
+        return {var: values.get(var, True) for var in range(1, self._num_variables + 1)}
+
+    # Clause store: literal lists keep their input order; removed clauses are None
+
+    def _load(self, packed: PackedFormula) -> None:
+        self._num_variables = packed.num_variables
+        self._eliminated = []
+        self._unsat = False
+        self._lits: List[Optional[List[int]]] = []
+        self._sets: List[Optional[frozenset]] = []
+        self._occurrences: Dict[int, Set[int]] = defaultdict(set)
+        for lits in packed:
+            # Repeated literals are dropped as the clause is stored
+            self._add(list(dict.fromkeys(lits)))
+
+    def _add(self, lits: List[int]) -> int:
+        index = len(self._lits)
+        self._lits.append(lits)
+        self._sets.append(frozenset(lits))
+        for lit in lits:
+            self._occurrences[lit].add(index)
+        if not lits:
+            self._unsat = True
+        return index
+
+    def _remove(self, index: int) -> None:
+        for lit in self._lits[index]:
+            self._occurrences[lit].discard(index)
+        self._lits[index] = None
+        self._sets[index] = None
+
+    def _alive(self) -> List[int]:
+        return [index for index, lits in enumerate(self._lits) if lits is not None]
+
+    def _variables(self) -> Set[int]:
+        return {abs(lit) for lit, indices in self._occurrences.items() if indices}
+
+    # Passes: each returns whether it changed the formula
+
+    def _dedup(self) -> bool:
+        seen: Set[frozenset] = set()
+        changed = False
+        for index in self._alive():
+            clause = self._sets[index]
+            if any(-lit in clause for lit in clause):
+                self.report["tautologies"] += 1
+            elif clause in seen:
+                self.report["duplicate_clauses"] += 1
+            else:
+                seen.add(clause)
+                continue
+            self._remove(index)
+            changed = True
+        return changed
+
+    def _subsumption(self) -> bool:
+        changed = False
+        for index in sorted(self._alive(), key=lambda i: len(self._lits[i])):
+            clause = self._sets[index]
+            if clause is None or not clause:
+                continue
+            # Any clause containing this one also contains its rarest literal
+            rarest = min(clause, key=lambda lit: len(self._occurrences[lit]))
+            for other in list(self._occurrences[rarest]):
+                if other != index and clause <= self._sets[other]:
+                    self._remove(other)
+                    self.report["subsumed"] += 1
+                    changed = True
+        return changed
+
+    def _strengthening(self) -> bool:
+        changed = False
+        for index in sorted(self._alive(), key=lambda i: len(self._lits[i])):
+            for lit in list(self._lits[index] or ()):
+                clause = self._sets[index]
+                if clause is None or lit not in clause:
+                    break
+                if -lit in clause:
+                    continue
+                rest = clause - {lit}
+                for other in list(self._occurrences[-lit]):
+                    target = self._sets[other]
+                    if other == index or len(target) < len(clause) or not rest <= target:
+                        continue
+                    # Resolving on lit gives target without ¬lit, which subsumes target
+                    self._occurrences[-lit].discard(other)
+                    self._lits[other] = [kept for kept in self._lits[other] if kept != -lit]
+                    self._sets[other] = target - {-lit}
+                    self.report["strengthened"] += 1
+                    changed = True
+                    if not self._lits[other]:
+                        self._unsat = True
+                        return True
+        return changed
+
+    def _elimination(self) -> bool:
+        changed = False
+        occurrences = self._occurrences
+        candidates = sorted(
+            self._variables(),
+            key=lambda var: (len(occurrences[var]) * len(occurrences[-var]), var),
+        )
+        for var in candidates:
+            # Without the dedup pass a tautology may hold both x and ¬x; it just goes
+            tautologies = occurrences[var] & occurrences[-var]
+            positive = sorted(occurrences[var] - tautologies)
+            negative = sorted(occurrences[-var] - tautologies)
+            if not positive and not negative:
+                continue
+            if len(positive) > self.max_occurrences or len(negative) > self.max_occurrences:
+                continue
+            resolvents = self._resolvents(var, positive, negative)
+            if resolvents is None:
+                continue
+            if len(resolvents) > len(positive) + len(negative) + self.clause_growth:
+                continue
+
+            self._eliminated.append((var, [list(self._lits[i]) for i in positive + negative]))
+            for index in positive + negative + sorted(tautologies):
+                self._remove(index)
+            for lits in resolvents:
+                self._add(lits)
+            self.report["eliminated_variables"] += 1
+            self.report["resolvents"] += len(resolvents)
+            changed = True
+            if self._unsat:
+                return True
+        return changed
+
+    def _resolvents(
+        self, var: int, positive: List[int], negative: List[int]
+    ) -> Optional[List[List[int]]]:
+        """Non-tautological resolvents on var, or None if one is too long"""
+        resolvents: Dict[frozenset, List[int]] = {}
+        for p in positive:
+            left = [lit for lit in self._lits[p] if lit != var]
+            for n in negative:
+                merged = dict.fromkeys(left)
+                for lit in self._lits[n]:
+                    if lit != -var:
+                        merged[lit] = None
+                if any(-lit in merged for lit in merged):
+                    continue
+                if len(merged) > self.max_resolvent_size:
+                    return None
+                resolvents.setdefault(frozenset(merged), list(merged))
+        return list(resolvents.values())
 
 
 class RandomFormulaGenerator:
@@ -248,8 +882,13 @@ class RandomFormulaGenerator:
         """Initialize generator with optional seed"""
         self.rng: random.Random = random.Random(seed)
 
-    def generate(self, num_variables: int, num_clauses: int) -> Formula:
-        """Generate random 3SAT formula with given parameters"""
+    def generate(
+        self, num_variables: int, num_clauses: int, seed: Optional[int] = None
+    ) -> Formula:
+        """
+        Generate random 3SAT formula with given parameters. A seed makes this
+        one request reproducible without touching the generator's own stream.
+        """
         if not isinstance(num_variables, int) or num_variables < 3:
             raise FormulaError(
                 f"Number of variables must be an integer ≥ 3, got {num_variables}"
@@ -259,21 +898,20 @@ class RandomFormulaGenerator:
                 f"Number of clauses must be a positive integer, got {num_clauses}"
             )
 
+        rng = self.rng if seed is None else random.Random(seed)
         try:
             clauses: List[Clause] = []
             for _ in range(num_clauses):
                 # Select 3 distinct variables
-                vars_selected: List[int] = self.rng.sample(
-                    range(1, num_variables + 1), 3
-                )
+                vars_selected: List[int] = rng.sample(range(1, num_variables + 1), 3)
                 # Randomly decide polarity for each variable
                 literals: List[Literal] = [
-                    Literal(var, self.rng.choice([True, False]))
+                    _intern_literal(var if rng.choice([True, False]) else -var)
                     for var in vars_selected
                 ]
-                clauses.append(Clause(literals))
+                clauses.append(Clause._trusted(literals))
 
-            return Formula(clauses, num_variables)
+            return Formula._trusted(clauses, num_variables)
         except Exception as e:
             raise FormulaError(f"Error generating formula: {str(e)}")
 
@@ -285,37 +923,61 @@ class RandomFormulaGenerator:
         formulas_per_ratio: int,
     ) -> Dict[float, List[Formula]]:
         """Generate multiple formulas around the phase transition point"""
+        formulas: Dict[float, List[Formula]] = defaultdict(list)
+        for ratio, formula in self.iter_phase_transition_formulas(
+            num_variables, ratio_range, num_ratios, formulas_per_ratio
+        ):
+            formulas[ratio].append(formula)
+        return formulas
+
+    def iter_phase_transition_formulas(
+        self,
+        num_variables: int,
+        ratio_range: Tuple[float, float],
+        num_ratios: int,
+        formulas_per_ratio: int,
+    ) -> Iterator[Tuple[float, Formula]]:
+        """Yield (ratio, formula) pairs one at a time, in the same order and stream"""
         if not isinstance(num_variables, int) or num_variables < 3:
             raise FormulaError(
                 f"Number of variables must be an integer ≥ 3, got {num_variables}"
             )
-        if not isinstance(ratio_range, tuple) or len(ratio_range) != 2:
-            raise FormulaError("ratio_range must be a tuple of (min, max)")
-        if not all(isinstance(r, Real) for r in ratio_range):
-            raise FormulaError("Ratio values must be numeric")
-        if ratio_range[0] >= ratio_range[1]:
-            raise FormulaError(
-                f"Invalid ratio range: {ratio_range[0]} >= {ratio_range[1]}"
-            )
-        if not isinstance(num_ratios, int) or num_ratios < 1:
-            raise FormulaError(
-                f"num_ratios must be a positive integer, got {num_ratios}"
-            )
+        ratios = phase_transition_ratios(ratio_range, num_ratios)
         if not isinstance(formulas_per_ratio, int) or formulas_per_ratio < 1:
             raise FormulaError(
                 f"formulas_per_ratio must be a positive integer, got {formulas_per_ratio}"
             )
 
-        try:
-            ratios: np.ndarray = np.linspace(ratio_range[0], ratio_range[1], num_ratios)
-            formulas: Dict[float, List[Formula]] = defaultdict(list)
-
-            for ratio in ratios:
-                num_clauses = int(num_variables * ratio)
-                for _ in range(formulas_per_ratio):
+        for ratio in ratios:
+            num_clauses = int(num_variables * ratio)
+            for _ in range(formulas_per_ratio):
+                try:
                     formula = self.generate(num_variables, num_clauses)
-                    formulas[float(ratio)].append(formula)
-
-            return formulas
-        except Exception as e:
-            raise FormulaError(f"Error generating phase transition formulas: {str(e)}")
\ No newline at end of file
+                except Exception as e:
+                    raise FormulaError(
+                        f"Error generating phase transition formulas: {str(e)}"
+                    )
+                yield ratio, formula
+
+
+def phase_transition_ratios(ratio_range: Tuple[float, float], num_ratios: int) -> List[float]:
+    """Validate a clause/variable ratio range and split it into evenly spaced ratios"""
+    if not isinstance(ratio_range, tuple) or len(ratio_range) != 2:
+        raise FormulaError("ratio_range must be a tuple of (min, max)")
+    if not all(isinstance(r, Real) for r in ratio_range):
+        raise FormulaError("Ratio values must be numeric")
+    if ratio_range[0] >= ratio_range[1]:
+        raise FormulaError(f"Invalid ratio range: {ratio_range[0]} >= {ratio_range[1]}")
+    if not isinstance(num_ratios, int) or num_ratios < 1:
+        raise FormulaError(f"num_ratios must be a positive integer, got {num_ratios}")
+    return _linspace(ratio_range[0], ratio_range[1], num_ratios)
+
+
+def _linspace(start: float, stop: float, num: int) -> List[float]:
+    """Evenly spaced values over [start, stop], matching numpy.linspace"""
+    if num == 1:
+        return [float(start)]
+    step = (stop - start) / (num - 1)
+    values = [start + i * step for i in range(num)]
+    values[-1] = stop
+    return [float(value) for value in values]
@@ -0,0 +1,43 @@
+import itertools
+import json
+import random
+from typing import Dict, Iterator, Optional, Sequence
+
+from scripts import coldstart
+from scripts.utils import Formula, PackedFormula, RandomFormulaGenerator
+
+
+def random_formulas(count: int, num_variables: int, ratios=(3.0, 4.26, 5.5),
+                    seed: int = 0) -> Iterator[Formula]:
+    """Seeded random 3-CNFs spread across the phase transition"""
+    generator = RandomFormulaGenerator(seed)
+    for index in range(count):
+        ratio = ratios[index % len(ratios)]
+        yield generator.generate(num_variables, int(num_variables * ratio))
+
+
+def mixed_width_formulas(count: int, num_variables: int, widths: Sequence[int],
+                         seed: int = 0) -> Iterator[Formula]:
+    """Seeded random CNFs with the given clause widths, e.g. pure 2-CNF"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        clauses = []
+        for _ in range(rng.randint(num_variables, 3 * num_variables)):
+            variables = rng.sample(range(1, num_variables + 1), rng.choice(widths))
+            clauses.append([var if rng.random() < 0.5 else -var for var in variables])
+        yield PackedFormula.from_clauses(clauses, num_variables).to_formula()
+
+
+def brute_force_model(formula: Formula) -> Optional[Dict[int, bool]]:
+    """A model found by trying every assignment, or None"""
+    for values in itertools.product((False, True), repeat=formula.num_variables):
+        assignment = dict(enumerate(values, start=1))
+        if formula.evaluate(assignment):
+            return assignment
+    return None
+
+
+def loaded_after(code: str, modules) -> list:
+    """Modules among `modules` that a fresh interpreter has loaded after running `code`"""
+    probe = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {list(modules)!r} if m in sys.modules]))"
+    return json.loads(coldstart._run(["-c", probe]).stdout)
@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import pytest
+
+from scripts.aio import AsyncSolverPool
+from scripts.budget import CancellationToken, SolveBudget, SolveStatus
+from scripts.utils import RandomFormulaGenerator
+from tests.helpers import random_formulas
+
+# 250 variables at the phase transition: runs until stopped
+HARD = RandomFormulaGenerator().generate(250, 1065, 5)
+# Ends a solve whose cancellation was lost, so the test fails instead of hanging
+BACKSTOP = 30.0
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_solve_reports_status_and_a_verified_model(workers):
+    formulas = list(random_formulas(4, 12, seed=1))
+
+    async def main():
+        async with AsyncSolverPool(max_workers=workers) as pool:
+            return [await pool.solve(formula, "cdcl") for formula in formulas]
+
+    for formula, result in zip(formulas, run(main())):
+        assert result.status in (SolveStatus.SAT, SolveStatus.UNSAT)
+        assert result.satisfiable is (result.assignment is not None)
+        if result.satisfiable:
+            assert formula.evaluate(result.assignment)
+        assert result.statistics["total_steps"] >= 0 and result.time_ms > 0
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_timeout_yields_unknown(workers):
+    async def main():
+        async with AsyncSolverPool(max_workers=workers) as pool:
+            return await pool.solve(HARD, "dpll", timeout=0.1)
+
+    result = run(main())
+    assert (result.status, result.stop_reason) == (SolveStatus.UNKNOWN, "timeout")
+    assert result.assignment is None and not result.satisfiable
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_cancelling_the_task_stops_the_solve_and_frees_its_slot(workers):
+    easy = next(random_formulas(1, 10, ratios=(3.0,)))
+
+    async def main():
+        async with AsyncSolverPool(max_workers=workers, max_concurrency=1) as pool:
+            task = asyncio.ensure_future(pool.solve(HARD, "dpll", timeout=BACKSTOP))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # With one slot, this solve can only start once the stopped one has ended
+            started = time.perf_counter()
+            result = await asyncio.wait_for(pool.solve(easy, "dpll"), timeout=10)
+            return result, time.perf_counter() - started, len(pool._free)
+
+    result, elapsed, free = run(main())
+    assert result.status is SolveStatus.SAT
+    assert elapsed < 5 and free == 1
+
+
+def test_solve_many_reads_input_only_as_solves_finish():
+    pulled = []
+    yielded = []
+
+    def formulas():
+        for index, formula in enumerate(random_formulas(12, 10, seed=2)):
+            pulled.append(index)
+            # Never more than max_pending solves are in flight
+            assert len(pulled) - len(yielded) <= 3
+            yield formula
+
+    async def main():
+        async with AsyncSolverPool(max_workers=0, max_concurrency=2) as pool:
+            async for index, result in pool.solve_many(formulas(), "dpll", max_pending=3):
+                yielded.append(index)
+                assert result.status in (SolveStatus.SAT, SolveStatus.UNSAT)
+
+    run(main())
+    assert sorted(yielded) == list(range(12))
+
+
+def test_closing_solve_many_early_cancels_the_rest():
+    async def formulas():
+        yield next(random_formulas(1, 10, ratios=(3.0,)))
+        for _ in range(3):
+            yield HARD
+
+    async def main():
+        async with AsyncSolverPool(max_workers=0, max_concurrency=4) as pool:
+            results = pool.solve_many(formulas(), "dpll", timeout=BACKSTOP)
+            index, result = await results.__anext__()
+            await asyncio.wait_for(results.aclose(), timeout=10)
+            # The stopped threads hand their slots back once they are done
+            for _ in range(100):
+                if len(pool._free) == pool.max_concurrency:
+                    break
+                await asyncio.sleep(0.05)
+            return index, result, len(pool._free)
+
+    index, result, free = run(main())
+    assert index == 0 and result.status is SolveStatus.SAT
+    assert free == 4
+
+
+def test_invalid_requests_are_rejected():
+    async def main():
+        pool = AsyncSolverPool(max_workers=0)
+        with pytest.raises(ValueError, match="Solver must be one of"):
+            await pool.solve(HARD, "walksat")
+        with pytest.raises(ValueError, match="token"):
+            await pool.solve(HARD, budget=SolveBudget(token=CancellationToken()))
+        with pytest.raises(ValueError, match="timeout"):
+            await pool.solve(HARD, timeout=-1)
+        with pytest.raises(ValueError, match="max_pending"):
+            async for _ in pool.solve_many([HARD], max_pending=0):
+                pass
+        pool.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            await pool.solve(HARD)
+
+    run(main())
+    with pytest.raises(ValueError):
+        AsyncSolverPool(max_workers=-1)
+    with pytest.raises(ValueError):
+        AsyncSolverPool(max_concurrency=0)
@@ -0,0 +1,79 @@
+import json
+import sys
+
+import pytest
+
+from scripts import benchmark
+
+
+def cell(time_ms, time_mad_ms=0.1, peak_kib=10.0, steps=100):
+    return {"time_ms": time_ms, "time_mad_ms": time_mad_ms, "peak_kib": peak_kib, "steps": steps}
+
+
+def report(**cells):
+    return {"results": cells}
+
+
+def test_compare_flags_growth_beyond_threshold_and_spread():
+    baseline = report(a=cell(10.0), b=cell(10.0, steps=100))
+    current = report(a=cell(20.0), b=cell(10.0, steps=120), new=cell(1.0))
+    regressions = benchmark.compare(current, baseline, 0.1)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("a time_ms: 10.000 -> 20.000")
+    assert regressions[1].startswith("b steps: 100.000 -> 120.000")
+
+
+def test_compare_ignores_timing_changes_within_the_spread():
+    baseline = report(a=cell(2.0, time_mad_ms=0.2))
+    assert benchmark.compare(report(a=cell(3.0, time_mad_ms=0.2)), baseline, 0.1) == []
+    # The same growth is real once the runs are tight
+    tight = report(a=cell(2.0, time_mad_ms=0.01))
+    assert benchmark.compare(report(a=cell(3.0, time_mad_ms=0.01)), tight, 0.1)
+    # Steps are deterministic, so the spread never excuses them
+    grown = report(a=cell(2.0, time_mad_ms=0.2, steps=200))
+    assert benchmark.compare(grown, baseline, 0.1) == ["a steps: 100.000 -> 200.000 (+100.0%)"]
+
+
+def test_run_benchmarks_reports_median_spread_and_steps():
+    grid = dict(cases=["dpll", "exhaustive"], variables=[8, 20], ratios=[4.26], seeds=[0, 1], repeat=3)
+    first = benchmark.run_benchmarks(**grid)
+    assert first["grid"]["repeat"] == 3
+    # Exhaustive search skips the larger instance
+    assert sorted(first["results"]) == [
+        "dpll[n=20,ratio=4.26]", "dpll[n=8,ratio=4.26]", "exhaustive[n=8,ratio=4.26]",
+    ]
+    for metrics in first["results"].values():
+        assert metrics["time_ms"] > 0 and metrics["time_mad_ms"] >= 0
+        assert metrics["peak_kib"] > 0 and metrics["steps"] > 0
+
+    second = benchmark.run_benchmarks(**grid)
+    assert {name: metrics["steps"] for name, metrics in first["results"].items()} == {
+        name: metrics["steps"] for name, metrics in second["results"].items()
+    }
+    with pytest.raises(ValueError, match="Unknown benchmark case"):
+        benchmark.run_benchmarks(cases=["bogus"])
+    with pytest.raises(ValueError, match="repeat"):
+        benchmark.run_benchmarks(repeat=0)
+
+
+def test_cli_compare_exits_nonzero_on_regression(tmp_path, monkeypatch):
+    def run(*args):
+        monkeypatch.setattr(sys, "argv", [
+            "benchmark", "--cases", "dpll", "--variables", "10", "--ratios", "4.26",
+            "--seeds", "0", "--repeat", "1", *args,
+        ])
+        benchmark.main()
+
+    baseline = tmp_path / "baseline.json"
+    run("--output", str(baseline))
+    stored = json.loads(baseline.read_text())
+    assert list(stored["results"]) == ["dpll[n=10,ratio=4.26]"]
+
+    # Halving the stored steps makes the current run a regression
+    stored["results"]["dpll[n=10,ratio=4.26]"]["steps"] //= 2
+    baseline.write_text(json.dumps(stored))
+    with pytest.raises(SystemExit) as exit_info:
+        run("--compare", str(baseline), "--output", str(tmp_path / "current.json"))
+    assert exit_info.value.code == 1
+    current = json.loads((tmp_path / "current.json").read_text())
+    assert current["regressions"] and "steps" in current["regressions"][0]
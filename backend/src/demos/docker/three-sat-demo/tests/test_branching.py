@@ -0,0 +1,65 @@
+import pytest
+
+from scripts.branching import HEURISTICS, MOMSHeuristic, create_heuristic
+from scripts.solver import DPLLSolver
+from scripts.utils import PackedFormula
+from tests.helpers import mixed_width_formulas, random_formulas
+
+FORMULAS = (
+    list(random_formulas(6, 30, seed=3))
+    + list(mixed_width_formulas(6, 25, (2, 3, 4, 6), seed=3))
+)
+
+
+@pytest.mark.parametrize("heuristic", sorted(HEURISTICS))
+def test_selection_is_the_best_scoring_free_variable(heuristic):
+    decisions = 0
+    for formula in FORMULAS:
+        solver = DPLLSolver(heuristic=heuristic)
+        chosen = solver.heuristic
+        select = chosen.select
+
+        def checked():
+            nonlocal decisions
+            var = select()
+            free = [
+                v for v in range(1, formula.num_variables + 1)
+                if solver._values[v] is None and (solver._positive[v] or solver._negative[v])
+            ]
+            # The lowest-numbered variable wins ties, as a full scan would pick it
+            best = max(chosen.score(v) for v in free)
+            assert var == min(v for v in free if chosen.score(v) == best)
+            decisions += 1
+            return var
+
+        chosen.select = checked
+        solver.solve(formula)
+    assert decisions > 20
+
+
+def test_moms_keeps_tables_only_for_occurring_sizes():
+    # One long clause beside a 3-CNF: only sizes 3 and 40 are tracked up front
+    clauses = [list(range(1, 41))] + [list(clause) for clause in next(random_formulas(1, 40)).pack()]
+    heuristic = MOMSHeuristic()
+    solver = DPLLSolver(heuristic=heuristic)
+    formula = PackedFormula.from_clauses(clauses, 40)
+    solver._load(formula)
+    assert sorted(heuristic._size_count) == [3, 40]
+    assert heuristic._size_count[40] == 1 and len(heuristic._size_pos[40]) == 40
+    assert solver.solve(formula) is not None
+    # Sizes disappear again as their last clause is satisfied or shrinks
+    solver._load(formula)
+    solver._assign(1)
+    assert 40 not in heuristic._size_count and 40 not in heuristic._heaps
+
+
+def test_create_heuristic_validates_names_and_phases():
+    assert create_heuristic("moms", "saved").phase == "saved"
+    instance = create_heuristic("vsids")
+    assert create_heuristic(instance) is instance
+    with pytest.raises(ValueError, match="Heuristic must be one of"):
+        create_heuristic("bogus")
+    with pytest.raises(ValueError, match="Phase must be one of"):
+        create_heuristic("moms", "sideways")
+    with pytest.raises(ValueError, match="instance"):
+        create_heuristic(instance, "positive")
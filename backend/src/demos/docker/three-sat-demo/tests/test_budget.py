@@ -0,0 +1,83 @@
+import time
+
+import pytest
+
+from scripts.budget import BudgetMeter, CancellationToken, SolveBudget, SolveStatus
+from scripts.cubes import CubeAndConquerSolver
+from scripts.portfolio import PortfolioSolver
+from scripts.solver import CDCLSolver, DPLLSolver, RandomSATSolver
+from scripts.utils import PackedFormula, RandomFormulaGenerator
+
+# 250 variables at the phase transition: no solver here finishes within these budgets
+HARD = RandomFormulaGenerator().generate(250, 1065, 5)
+UNSAT = PackedFormula.from_clauses(
+    [[-1, 2], [-2, 3], [-3, 1], [1, 2, 3], [-1, -2, -3]], 3
+).to_formula()
+
+
+@pytest.mark.parametrize("limits", [
+    {"timeout": 0}, {"timeout": True}, {"timeout": "1"},
+    {"max_decisions": -1}, {"max_backtracks": 1.5}, {"max_flips": False},
+    {"token": object()},
+])
+def test_invalid_limits_are_rejected(limits):
+    with pytest.raises(ValueError):
+        SolveBudget(**limits)
+
+
+def test_meter_counts_against_its_limits():
+    meter = BudgetMeter(SolveBudget(max_decisions=2, timeout=60))
+    meter.decision()
+    meter.decision()
+    with pytest.raises(Exception, match="decision limit"):
+        meter.decision()
+    handed = meter.handoff()
+    assert handed.max_decisions == 2 and 0 < handed.timeout <= 60
+
+
+@pytest.mark.parametrize("solver_class", [DPLLSolver, CDCLSolver])
+def test_count_limit_stops_with_unknown_and_keeps_the_log(solver_class):
+    solver = solver_class(debug=True, budget=SolveBudget(max_decisions=3))
+    assert solver.solve(HARD) is None
+    assert solver.status is SolveStatus.UNKNOWN
+    assert solver.stop_reason == "decisions"
+    steps = solver.get_solving_steps()
+    assert steps[-1]["action_type"] == "stopped"
+    assert solver.get_statistics()["total_steps"] == len(steps)
+
+    # The budget binds each solve, so the next one starts with a fresh count
+    solver.budget = None
+    model = solver.solve(RandomFormulaGenerator().generate(10, 30, 1))
+    assert solver.status is (SolveStatus.SAT if model is not None else SolveStatus.UNSAT)
+    assert solver.stop_reason is None
+
+
+@pytest.mark.parametrize("solver_class", [DPLLSolver, CDCLSolver])
+def test_cancelled_token_stops_the_search(solver_class):
+    token = CancellationToken()
+    token.cancel()
+    solver = solver_class(budget=SolveBudget(token=token))
+    assert solver.solve(HARD) is None
+    assert (solver.status, solver.stop_reason) == (SolveStatus.UNKNOWN, "cancelled")
+
+
+def test_local_search_that_gives_up_is_unknown():
+    solver = RandomSATSolver(seed=0, max_tries=2, max_flips=50)
+    assert solver.solve(UNSAT) is None
+    assert (solver.status, solver.stop_reason) == (SolveStatus.UNKNOWN, "max_tries")
+    limited = RandomSATSolver(seed=0, budget=SolveBudget(max_flips=10))
+    assert limited.solve(UNSAT) is None
+    assert limited.stop_reason == "flips"
+
+
+@pytest.mark.parametrize("make_solver", [
+    lambda budget: CubeAndConquerSolver(workers=0, depth=2, budget=budget),
+    lambda budget: CubeAndConquerSolver(workers=2, depth=2, budget=budget),
+    lambda budget: PortfolioSolver([("dpll", {}), ("cdcl", {})], budget=budget),
+])
+def test_timeout_bounds_the_whole_parallel_run(make_solver):
+    solver = make_solver(SolveBudget(timeout=0.2))
+    started = time.perf_counter()
+    assert solver.solve(HARD) is None
+    assert time.perf_counter() - started < 5
+    assert (solver.status, solver.stop_reason) == (SolveStatus.UNKNOWN, "timeout")
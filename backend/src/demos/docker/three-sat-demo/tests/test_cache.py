@@ -0,0 +1,114 @@
+import json
+import os
+
+import pytest
+
+from scripts import entrypoint
+from scripts.cache import ResultCache, cache_key
+from scripts.budget import SolveBudget
+from scripts.solver import CDCLSolver
+from scripts.utils import PackedFormula
+from tests.helpers import random_formulas
+
+CLAUSES = [[1, -2, 3], [-1, 2], [2, 3, -4]]
+
+
+def shuffled(clauses):
+    return [list(reversed(clause)) for clause in reversed(clauses)]
+
+
+def test_canonical_hash_ignores_clause_and_literal_order():
+    formula = PackedFormula.from_clauses(CLAUSES, 4)
+    reordered = PackedFormula.from_clauses(shuffled(CLAUSES), 4)
+    assert formula.canonical_hash() == reordered.canonical_hash()
+    assert formula.canonical_hash() == formula.to_formula().canonical_hash()
+    assert formula.canonical_hash() != PackedFormula.from_clauses(CLAUSES, 5).canonical_hash()
+    assert cache_key(formula, "dpll") == cache_key(reordered, "dpll")
+    assert cache_key(formula, "dpll") != cache_key(formula, "cdcl")
+    assert cache_key(formula, "dpll") != cache_key(formula, "dpll", {"debug": False})
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", {"value": 1})
+    cache.put("b", {"value": 2})
+    assert cache.get("a") == {"value": 1}
+    cache.put("c", {"value": 3})
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    # Callers get copies, so editing a result does not edit the cache
+    cache.get("a")["value"] = 9
+    assert cache.get("a") == {"value": 1}
+
+
+def test_disk_tier_survives_restarts_and_evicts_by_size(tmp_path):
+    cache = ResultCache(directory=tmp_path)
+    cache.put("old", {"payload": "x" * 100})
+    os.utime(tmp_path / "old.json", (1, 1))
+    cache.put("new", {"payload": "y" * 100})
+
+    restarted = ResultCache(max_entries=0, directory=tmp_path)
+    assert restarted.get("old") == {"payload": "x" * 100}
+    assert restarted.stats()["disk_hits"] == 1
+
+    size = (tmp_path / "new.json").stat().st_size
+    small = ResultCache(max_entries=0, directory=tmp_path, max_bytes=2 * size)
+    os.utime(tmp_path / "old.json", (1, 1))
+    small.put("newest", {"payload": "z" * 100})
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["new", "newest"]
+
+
+@pytest.mark.parametrize("max_entries, max_bytes", [(-1, 0), (1, -1)])
+def test_negative_bounds_are_rejected(max_entries, max_bytes):
+    with pytest.raises(ValueError):
+        ResultCache(max_entries=max_entries, max_bytes=max_bytes)
+
+
+def test_cache_hit_for_a_reordered_formula_reports_the_current_text():
+    formula = next(random_formulas(1, 8, ratios=(3.0,), seed=1))
+    reordered = PackedFormula.from_clauses(
+        shuffled(list(formula.pack())), formula.num_variables
+    ).to_formula()
+    cache = ResultCache()
+    key = cache_key(formula, "cdcl")
+    first = json.loads(json.dumps(
+        entrypoint.cached_solve(formula, CDCLSolver(debug=True), key, cache)
+    ))
+    assert first["solving_process"]["steps"]
+
+    again = entrypoint.cached_solve(formula, CDCLSolver(debug=True), key, cache)
+    assert again == first
+    hit = entrypoint.cached_solve(reordered, CDCLSolver(debug=True), key, cache)
+    assert cache.stats()["hits"] == 2
+    assert hit["formula"] == str(reordered) != first["formula"]
+    assert hit["solving_process"]["steps"] == []
+    assert hit["assignment"] == first["assignment"]
+
+
+def test_cache_hit_from_another_source_reports_the_current_one():
+    formula = PackedFormula.from_clauses(CLAUSES, 4)
+    cache = ResultCache()
+    key = cache_key(formula, "cdcl", {})
+    first = entrypoint.cached_solve(formula, CDCLSolver(debug=True), key, cache, "a.cnf")
+    assert first["solving_process"]["steps"]
+
+    again = entrypoint.cached_solve(formula, CDCLSolver(debug=True), key, cache, "a.cnf")
+    assert again["source"] == "a.cnf" and again["solving_process"]["steps"]
+    hit = entrypoint.cached_solve(formula, CDCLSolver(debug=True), key, cache, "b.cnf")
+    assert list(hit)[0] == "source" and hit["source"] == "b.cnf"
+    assert hit["solving_process"]["steps"] == []
+
+
+def test_stopped_results_are_not_cached():
+    cache = ResultCache()
+    formula = next(random_formulas(1, 60, ratios=(4.26,)))
+    key = cache_key(formula, "cdcl")
+    stopped = entrypoint.cached_solve(
+        formula, CDCLSolver(budget=SolveBudget(max_decisions=0)), key, cache
+    )
+    assert stopped["status"] == "unknown"
+    assert cache.get(key) is None
+    solved = entrypoint.cached_solve(formula, CDCLSolver(), key, cache)
+    assert solved["status"] in ("sat", "unsat")
+    assert cache.get(key)["status"] == solved["status"]
@@ -0,0 +1,27 @@
+from scripts.solver import CDCLSolver
+from tests.helpers import random_formulas
+
+
+def test_cdcl_records_each_decision():
+    formula = next(random_formulas(1, 30, ratios=(4.26,), seed=3))
+    solver = CDCLSolver()
+    solver.solve(formula)
+    decisions = solver.stats.stats["decisions"].value
+    assert decisions > 0
+    assert len(solver.stats.variable_assignments.value) == decisions
+    assert all(1 <= abs(lit) <= 30 for lit in solver.stats.variable_assignments.value)
+
+    # A second solve starts a fresh history
+    solver.solve(formula)
+    assert len(solver.stats.variable_assignments.value) == solver.stats.stats["decisions"].value
+
+
+def test_cdcl_learns_and_backjumps_on_hard_instances():
+    solver = CDCLSolver()
+    for formula in random_formulas(5, 40, ratios=(4.26,), seed=8):
+        solver.solve(formula)
+        statistics = solver.get_statistics()
+        if statistics["conflicts"]:
+            assert statistics["learned_clauses"] > 0
+            return
+    raise AssertionError("No instance produced a conflict")
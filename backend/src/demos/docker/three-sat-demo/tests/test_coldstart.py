@@ -0,0 +1,30 @@
+from scripts import coldstart
+from tests.helpers import loaded_after
+
+REPORT = {"import_ms": 40.0, "first_solve_ms": 90.0, "eagerly_loaded": []}
+
+
+def test_check_passes_within_budget():
+    assert coldstart.check(REPORT, 50.0, 100.0) == []
+
+
+def test_check_flags_each_violation():
+    report = {**REPORT, "import_ms": 60.0, "first_solve_ms": 120.0, "eagerly_loaded": ["numpy"]}
+    failures = coldstart.check(report, 50.0, 100.0)
+    assert len(failures) == 3
+    assert "numpy" in failures[2]
+
+
+def test_cli_path_leaves_heavy_modules_unloaded():
+    code = (
+        "from scripts.entrypoint import SOLVERS, generate_formula, solve_formula\n"
+        "for name in ('dpll', 'cdcl'):\n"
+        "    solve_formula(generate_formula(5, 4.2, 0), SOLVERS[name](debug=True))"
+    )
+    assert loaded_after(code, coldstart.LAZY_MODULES + ("scripts.portfolio", "scripts.cubes")) == []
+
+
+def test_package_exports_load_on_first_access():
+    submodules = ["scripts.solver", "scripts.stats", "scripts.utils"]
+    assert loaded_after("import scripts", submodules) == []
+    assert loaded_after("import scripts; scripts.Formula", submodules) == ["scripts.utils"]
@@ -0,0 +1,61 @@
+import pytest
+
+from scripts.cubes import CubeAndConquerSolver
+from scripts.utils import FormulaError, RandomFormulaGenerator
+from tests.helpers import random_formulas
+
+
+def test_workers_give_the_in_process_answers():
+    for formula in random_formulas(6, 12, seed=3):
+        expected = CubeAndConquerSolver(workers=0, depth=2).solve(formula)
+        solver = CubeAndConquerSolver(workers=2, depth=2)
+        model = solver.solve(formula)
+        assert (model is None) == (expected is None)
+        if model is not None:
+            assert formula.evaluate(model)
+        cubes = solver.get_statistics()["cubes"]
+        assert cubes["workers"] == 2
+        assert cubes["generated"] >= cubes["solved"] + cubes["split"]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_debug_logs_split_and_cube_outcomes(workers):
+    formula = next(random_formulas(1, 40, ratios=(4.25,), seed=2))
+    solver = CubeAndConquerSolver(debug=True, workers=workers, depth=3)
+    solver.solve(formula)
+    steps = solver.get_solving_steps()
+    statistics = solver.get_statistics()
+    actions = [step["action_type"] for step in steps]
+    assert statistics["total_steps"] == len(steps)
+    assert actions[:2] == ["start", "split"]
+    assert actions[-1] == "complete"
+    assert actions.count("cube") >= 1
+    assert statistics["max_depth"] > 0
+
+
+def test_without_debug_nothing_is_logged():
+    solver = CubeAndConquerSolver(workers=0, depth=3)
+    solver.solve(next(random_formulas(1, 40, ratios=(4.25,), seed=2)))
+    assert solver.get_solving_steps() == []
+    assert solver.get_statistics()["total_steps"] == 0
+
+
+def test_failed_conquer_stops_the_timer(monkeypatch):
+    def fail(self, formula, cubes):
+        raise FormulaError("worker returned a bad model")
+
+    monkeypatch.setattr(CubeAndConquerSolver, "_conquer_sequentially", fail)
+    solver = CubeAndConquerSolver(workers=0, depth=2)
+    with pytest.raises(FormulaError):
+        solver.solve(RandomFormulaGenerator().generate(60, 256, 5))
+    assert solver.stats._start_time is None
+    assert solver.stats.solving_time_ms.value > 0
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError, match="workers"):
+        CubeAndConquerSolver(workers=-1)
+    with pytest.raises(ValueError, match="depth"):
+        CubeAndConquerSolver(depth=-1)
+    with pytest.raises(ValueError, match="heuristic"):
+        CubeAndConquerSolver(heuristic=object())
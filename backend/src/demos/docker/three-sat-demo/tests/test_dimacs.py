@@ -0,0 +1,86 @@
+import io
+import json
+import sys
+
+import pytest
+
+from scripts import entrypoint
+from scripts.dimacs import read_dimacs, write_dimacs
+from scripts.utils import FormulaError, PackedFormula
+from tests.helpers import mixed_width_formulas, random_formulas
+
+
+def clauses_of(formula):
+    return [list(clause) for clause in formula.pack()]
+
+
+@pytest.mark.parametrize("suffix", [".cnf", ".cnf.gz", ".cnf.bz2", ".cnf.xz"])
+def test_round_trip_through_files(tmp_path, suffix):
+    for index, formula in enumerate(random_formulas(5, 12, seed=1)):
+        path = tmp_path / f"formula{index}{suffix}"
+        write_dimacs(formula, str(path), comments=["seeded", "round trip"])
+        read = read_dimacs(str(path))
+        assert read.num_variables == formula.num_variables
+        assert clauses_of(read) == clauses_of(formula)
+
+
+def test_round_trip_through_streams():
+    for formula in mixed_width_formulas(20, 8, (1, 2, 3), seed=4):
+        text = io.StringIO()
+        write_dimacs(formula, text)
+        read = read_dimacs(io.BytesIO(text.getvalue().encode("ascii")))
+        assert clauses_of(read) == clauses_of(formula)
+        assert read.canonical_hash() == formula.canonical_hash()
+
+
+def test_reader_accepts_split_clauses_comments_and_trailer():
+    text = "c header\np cnf 3 3\n1 -2\n 0 2 3 0\nc between\n-1 -3 0\n%\n0\n"
+    read = read_dimacs(io.StringIO(text))
+    assert clauses_of(read) == [[1, -2], [2, 3], [-1, -3]]
+
+
+def test_reader_accepts_missing_final_zero():
+    read = read_dimacs(io.StringIO("p cnf 2 2\n1 2 0\n-1 -2"))
+    assert clauses_of(read) == [[1, 2], [-1, -2]]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("1 2 0\n", "Line 1: clause before the problem line"),
+    ("p cnf 2 1\np cnf 2 1\n1 2 0\n", "Line 2: duplicate problem line"),
+    ("p cnf 2 1\n1 x 0\n", "Line 2: literals must be integers"),
+    ("p cnf 2 1\n1 3 0\n", "Line 2: variable 3 exceeds the declared 2"),
+    ("p cnf 2 1\n1 0 3 0\n", "Line 2: variable 3 exceeds the declared 2"),
+    ("p cnf 2 2\n1 2 0\n", "declares 2 clauses, found 1"),
+    ("p dnf 2 1\n1 2 0\n", "Line 1: expected 'p cnf"),
+    # Counts and literals past 32 bits fail cleanly rather than overflowing the buffers
+    ("p cnf 9999999999 1\n5000000000 0\n", "Line 1: 9999999999 variables exceed"),
+    ("p cnf 3 1\n-5000000000 0\n", "Line 2: variable 5000000000 exceeds the declared 3"),
+])
+def test_reader_rejects_malformed_input(text, message):
+    with pytest.raises(FormulaError, match=message):
+        read_dimacs(io.StringIO(text))
+
+
+def test_largest_variable_count_is_accepted():
+    read = read_dimacs(io.StringIO(f"p cnf {2 ** 31 - 1} 1\n{2 ** 31 - 1} -1 0\n"))
+    assert clauses_of(read) == [[2 ** 31 - 1, -1]]
+
+
+def test_empty_formula_round_trips():
+    formula = PackedFormula.from_clauses([], 3)
+    text = io.StringIO()
+    write_dimacs(formula, text)
+    assert len(read_dimacs(io.StringIO(text.getvalue()))) == 0
+
+
+def test_entrypoint_solves_a_cnf_file(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "instance.cnf"
+    path.write_text("p cnf 3 2\n1 -2 0\n2 3 0\n")
+    monkeypatch.delenv(entrypoint.CACHE_DIR_ENV, raising=False)
+    monkeypatch.setattr(sys, "argv", ["entrypoint", f"--cnf={path}", "cdcl"])
+    entrypoint.main()
+    result = json.loads(capsys.readouterr().out)
+    assert result["source"] == str(path) and "formula" not in result
+    assert result["satisfiable"] and result["num_clauses"] == 2
+    # Steps are only recorded on request for instances read from files
+    assert result["solving_process"]["steps"] == []
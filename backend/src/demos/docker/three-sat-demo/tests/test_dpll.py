@@ -0,0 +1,93 @@
+import io
+import json
+import random
+
+from scripts import entrypoint
+from scripts.cache import ResultCache
+from scripts.solver import DPLLSolver
+from scripts.utils import PackedFormula, RandomFormulaGenerator
+from tests.helpers import random_formulas
+
+
+def test_profiling_reports_each_phase_without_changing_the_search():
+    formula = RandomFormulaGenerator().generate(20, 85, 4)
+    plain, profiled = DPLLSolver(), DPLLSolver(profile=True)
+    assert profiled.solve(formula) == plain.solve(formula)
+
+    statistics = profiled.get_statistics()
+    assert statistics["total_steps"] == plain.get_statistics()["total_steps"]
+    assert statistics["solving_time_ms"] > 0
+    phases = statistics["phases"]
+    assert set(phases) == {name for name, _ in DPLLSolver.PROFILED_PHASES}
+    assert phases["choose_variable"]["calls"] > 0
+    assert phases["assign"]["calls"] >= phases["undo"]["calls"]
+    assert all(phase["time_ms"] >= 0 for phase in phases.values())
+
+    # Timings start over on every solve, and an unprofiled solver installs no wrappers
+    profiled.solve(formula)
+    assert profiled.get_statistics()["phases"]["assign"]["calls"] == phases["assign"]["calls"]
+    assert "phases" not in plain.get_statistics()
+    assert "_assign" not in vars(plain)
+
+
+def test_requests_enable_profiling_through_options():
+    request = {"n": 5, "ratio": 4.0, "seed": 1, "solver": "dpll", "options": {"profile": True}}
+    output = io.StringIO()
+    entrypoint.serve(io.StringIO(json.dumps(request) + "\n"), output, ResultCache(max_entries=0))
+    statistics = json.loads(output.getvalue())["solving_process"]["statistics"]
+    assert "unit_clause_search" in statistics["phases"]
+
+
+def test_equivalent_literals_counts_each_merged_variable_once():
+    # x1 ≡ x2 ≡ x3 by binary clauses, beside a 3-CNF that needs a search
+    chain = [[-1, 2], [1, -2], [-2, 3], [2, -3]]
+    for formula in random_formulas(3, 30, ratios=(6.0,), seed=5):
+        body = [[lit + 3 if lit > 0 else lit - 3 for lit in clause] for clause in formula.pack()]
+        solver = DPLLSolver()
+        merged = set()
+        find_classes = solver._equivalence_classes
+
+        def record(component):
+            classes = find_classes(component)
+            merged.update(classes)
+            return classes
+
+        solver._equivalence_classes = record
+        solver.solve(PackedFormula.from_clauses(chain + body, 33))
+        assert {2, 3} <= merged
+        assert solver.stats.stats["equivalent_literals"].value == len(merged)
+
+
+def test_literal_counts_follow_assignments_and_undo():
+    formula = RandomFormulaGenerator().generate(15, 64, 3)
+    solver = DPLLSolver()
+    solver._load(formula)
+    rng = random.Random(0)
+
+    def recount():
+        positive, negative = [0] * 16, [0] * 16
+        for lits in solver._clauses:
+            if not any(solver._values[abs(lit)] is (lit > 0) for lit in lits):
+                for lit in lits:
+                    (positive if lit > 0 else negative)[abs(lit)] += 1
+        assert solver._positive == positive and solver._negative == negative
+        return positive, negative
+
+    initial = recount()
+    marks = []
+    for _ in range(300):
+        positive, negative = recount()
+        free = [var for var in range(1, 16) if solver._values[var] is None]
+        if free and (not marks or rng.random() < 0.6):
+            # Branching takes the most frequent free variable, the lowest on ties
+            var = solver._choose_next_variable()
+            assert var == max(free, key=lambda var: (positive[var] + negative[var], -var))
+            marks.append(len(solver._trail))
+            solver._assign(var if rng.random() < 0.5 else -var)
+        else:
+            # Backjump as far as a random earlier branching node
+            depth = rng.randrange(len(marks))
+            solver._undo(marks[depth])
+            del marks[depth:]
+    solver._undo(0)
+    assert recount() == initial
@@ -0,0 +1,112 @@
+import io
+import json
+import sys
+
+import pytest
+
+from scripts import entrypoint
+from scripts.budget import SolveBudget
+from scripts.dimacs import write_dimacs
+from scripts.solver import CDCLSolver
+from scripts.utils import RandomFormulaGenerator
+
+
+def serve_lines(*lines):
+    output = io.StringIO()
+    entrypoint.serve(io.StringIO("".join(line + "\n" for line in lines)), output)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def run_cli(monkeypatch, capsys, *argv):
+    monkeypatch.setattr(sys, "argv", ["entrypoint", *argv])
+    monkeypatch.delenv("THREE_SAT_CACHE_DIR", raising=False)
+    entrypoint.main()
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.fixture
+def hard_cnf(tmp_path):
+    path = tmp_path / "hard.cnf"
+    write_dimacs(RandomFormulaGenerator().generate(250, 1065, 5), str(path))
+    return str(path)
+
+
+def test_serve_answers_each_line_and_echoes_ids():
+    request = {"id": "a", "n": 5, "ratio": 4.2, "seed": 3, "solver": "cdcl"}
+    first, default, again = serve_lines(
+        json.dumps(request), "", json.dumps({"id": 7, "n": 4, "ratio": 3.0}), json.dumps(request)
+    )
+    assert first["id"] == "a" and default["id"] == 7
+    assert first["num_variables"] == 5
+    assert first["satisfiable"] is (first["assignment"] is not None)
+    # A seeded request is reproducible, and the reused solver starts from a clean log
+    first.pop("solving_process")
+    steps = again.pop("solving_process")["steps"]
+    assert again == first
+    assert steps[0]["step_number"] == 1
+
+
+def test_serve_reports_errors_per_line_and_keeps_going():
+    responses = serve_lines(
+        "{not json",
+        json.dumps([1, 2]),
+        json.dumps({"id": 1, "n": 9, "ratio": 3.0}),
+        json.dumps({"id": 2, "n": 4, "ratio": 3.0, "seed": "x"}),
+        json.dumps({"id": 3, "n": 4, "ratio": 3.0, "options": {"bogus": 1}}),
+        json.dumps({"id": 4, "n": 4, "ratio": 3.0, "solver": "sat4j"}),
+        json.dumps({"id": 5, "n": 4, "ratio": 3.0}),
+    )
+    assert len(responses) == 7
+    assert all("error" in response for response in responses[:6])
+    assert "id" not in responses[0] and "id" not in responses[1]
+    assert [response.get("id") for response in responses[2:]] == [1, 2, 3, 4, 5]
+    assert "Invalid solver options" in responses[4]["error"]
+    assert "error" not in responses[6]
+
+
+def test_serve_applies_a_budget_per_request():
+    request = {"n": 5, "ratio": 4.2, "seed": 3, "solver": "cdcl"}
+    limited, unlimited, invalid = serve_lines(
+        json.dumps({**request, "budget": {"max_decisions": 0}}),
+        json.dumps(request),
+        json.dumps({**request, "budget": {"max_decisions": -1}}),
+    )
+    assert limited["status"] == "unknown" and limited["stop_reason"] == "decisions"
+    assert limited["satisfiable"] is None
+    # The reused solver does not keep the previous request's budget
+    assert unlimited["status"] in ("sat", "unsat") and unlimited["stop_reason"] is None
+    assert "max_decisions" in invalid["error"]
+
+
+@pytest.mark.parametrize("solver", ["dpll", "cdcl"])
+@pytest.mark.parametrize("limit", ["--timeout=0.05", "--max-decisions=1"])
+def test_stopped_solve_is_never_reported_unsatisfiable(monkeypatch, capsys, hard_cnf, solver, limit):
+    result = run_cli(monkeypatch, capsys, f"--cnf={hard_cnf}", solver, limit)
+    if result["status"] == "unknown":
+        assert result["satisfiable"] is None
+        assert result["stop_reason"] in ("timeout", "decisions")
+    else:
+        assert result["satisfiable"] is (result["status"] == "sat")
+
+
+def test_invalid_budget_option_is_rejected(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["entrypoint", "4", "4.2", "--max-flips=lots"])
+    with pytest.raises(SystemExit):
+        entrypoint.main()
+    assert "--max-flips must be an integer" in capsys.readouterr().err
+
+
+def test_stream_result_reports_unknown():
+    solver = CDCLSolver(budget=SolveBudget(max_decisions=1))
+    output = io.StringIO()
+    entrypoint.stream_output(RandomFormulaGenerator().generate(250, 1065, 5), solver, output)
+    result = json.loads(output.getvalue().splitlines()[-1])
+    assert result["type"] == "result"
+    assert result["status"] == "unknown"
+    assert result["satisfiable"] is None
+
+
+def test_demo_result_keeps_boolean_satisfiable(monkeypatch, capsys):
+    result = run_cli(monkeypatch, capsys, "4", "4.2", "dpll", "--seed=3")
+    assert result["status"] in ("sat", "unsat")
+    assert result["satisfiable"] is (result["status"] == "sat")
@@ -0,0 +1,72 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from scripts.solver import CDCLSolver
+from scripts import utils
+from scripts.utils import FormulaError, PackedFormula
+from tests.helpers import random_formulas
+
+
+def test_packing_round_trips():
+    for formula in random_formulas(20, 12, seed=1):
+        packed = formula.pack()
+        assert len(packed) == len(formula)
+        assert packed.num_literals == 3 * len(formula)
+        assert list(packed) == [[lit.to_int() for lit in clause] for clause in formula]
+        assert str(packed) == str(formula)
+        assert packed.to_formula() == formula
+        assert PackedFormula.from_clauses(packed, formula.num_variables) == packed
+        assert pickle.loads(pickle.dumps(packed)) == packed
+
+
+def test_numpy_views_share_the_buffers():
+    packed = PackedFormula.from_clauses([[1, -2], [3]], 3)
+    literals, offsets = packed.to_numpy()
+    assert literals.tolist() == [1, -2, 3]
+    assert offsets.tolist() == [0, 2, 3]
+    packed.literals[0] = -1
+    assert literals[0] == -1
+    assert packed.nbytes == literals.nbytes + offsets.nbytes
+
+
+@pytest.mark.parametrize("clauses, num_variables", [
+    ([[1, 0]], 2),
+    ([[1, 3]], 2),
+    ([[1, "x"]], 2),
+    ([[1]], 0),
+])
+def test_untrusted_clauses_are_validated(clauses, num_variables):
+    with pytest.raises(FormulaError):
+        PackedFormula.from_clauses(clauses, num_variables)
+
+
+def test_solvers_accept_either_representation():
+    for formula in random_formulas(10, 20, seed=2):
+        assert (CDCLSolver().solve(formula) is None) == (CDCLSolver().solve(formula.pack()) is None)
+
+
+@pytest.mark.parametrize("cells", [1 << 22, 7])
+def test_batch_evaluation_matches_scalar_evaluation(monkeypatch, cells):
+    # A tiny cell budget forces one row per chunk
+    monkeypatch.setattr(utils, "BATCH_EVALUATION_CELLS", cells)
+    rng = np.random.default_rng(4)
+    formulas = list(random_formulas(10, 8, seed=4))
+    formulas.append(PackedFormula.from_clauses([[1, -2], [], [3]], 8))
+    for formula in formulas:
+        matrix = rng.random((50, 8)) < 0.5
+        rows = [dict(enumerate(row.tolist(), start=1)) for row in matrix]
+        scalar = formula.pack().to_formula()
+        assert formula.evaluate_batch(matrix).tolist() == [
+            scalar.is_satisfied_by(row) for row in rows
+        ]
+        per_clause = formula.pack().clause_satisfaction(matrix)
+        assert per_clause.shape == (50, len(formula))
+        assert per_clause.all(axis=1).tolist() == formula.evaluate_batch(matrix).tolist()
+
+
+def test_batch_evaluation_rejects_the_wrong_shape():
+    formula = next(random_formulas(1, 8))
+    with pytest.raises(FormulaError):
+        formula.evaluate_batch(np.zeros((4, 7), dtype=bool))
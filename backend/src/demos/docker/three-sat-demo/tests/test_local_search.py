@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from scripts.solver import RandomSATSolver
+from tests.helpers import random_formulas
+
+
+def walk_tables(solver: RandomSATSolver):
+    return (solver._true_count, solver._break, solver._make, sorted(solver._unsat))
+
+
+def test_flips_keep_the_incremental_tables_exact():
+    rng = random.Random(0)
+    for formula in random_formulas(5, 30, seed=6):
+        solver = RandomSATSolver(seed=0)
+        solver._load_clauses(formula)
+        solver._initialize_walk([rng.random() < 0.5 for _ in range(31)])
+        for _ in range(200):
+            solver._flip(rng.randrange(1, 31))
+        rebuilt = RandomSATSolver(seed=0)
+        rebuilt._load_clauses(formula)
+        rebuilt._initialize_walk(list(solver._values))
+        assert walk_tables(solver) == walk_tables(rebuilt)
+
+
+@pytest.mark.parametrize("strategy", ["walksat", "probsat"])
+def test_local_search_solves_underconstrained_instances(strategy):
+    for formula in random_formulas(5, 60, ratios=(3.0,), seed=7):
+        solver = RandomSATSolver(seed=1, strategy=strategy)
+        model = solver.solve(formula)
+        assert model is not None and formula.is_satisfied_by(model)
+        statistics = solver.get_statistics()
+        assert statistics["strategy"] == strategy
+        assert statistics["successful_flips"] <= statistics["total_flips"]
+
+
+def test_seeded_walks_repeat():
+    formula = next(random_formulas(1, 60, ratios=(4.0,), seed=8))
+    first, second = RandomSATSolver(seed=5), RandomSATSolver(seed=5)
+    assert first.solve(formula) == second.solve(formula)
+    assert first.get_statistics() == second.get_statistics()
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        RandomSATSolver(strategy="gsat")
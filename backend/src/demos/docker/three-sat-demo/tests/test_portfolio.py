@@ -0,0 +1,66 @@
+import pytest
+
+from scripts.portfolio import PortfolioSolver
+from scripts.utils import FormulaError, PackedFormula, RandomFormulaGenerator
+
+# x1..x3 all equal and not all equal: unsatisfiable, but only a complete solver can tell
+UNSAT = PackedFormula.from_clauses(
+    [[-1, 2], [-2, 3], [-3, 1], [1, 2, 3], [-1, -2, -3]], 3
+)
+WALK = ("random", {"seed": 0, "max_tries": 1, "max_flips": 20})
+
+
+def test_first_definitive_answer_wins_and_members_report():
+    formula = RandomFormulaGenerator().generate(30, 90, 1)
+    solver = PortfolioSolver([("cdcl", {}), ("dpll", {"heuristic": "vsids"}), WALK], debug=True)
+    model = solver.solve(formula)
+    assert formula.is_satisfied_by(model)
+
+    statistics = solver.get_statistics()
+    members = statistics["members"]
+    assert [member["name"] for member in members] == [
+        "cdcl", "dpll[heuristic=vsids]", "random[seed=0,max_tries=1,max_flips=20]",
+    ]
+    winner = next(member for member in members if member["name"] == statistics["winner"])
+    assert winner["status"] == "sat"
+    assert all(member["status"] in ("sat", "unknown", "cancelled") for member in members)
+    assert solver.get_solving_steps()
+
+
+def test_local_search_giving_up_does_not_end_the_race():
+    solver = PortfolioSolver([WALK, ("dpll", {})])
+    assert solver.solve(UNSAT) is None
+    statistics = solver.get_statistics()
+    assert statistics["winner"] == "dpll"
+    assert statistics["members"][0]["status"] == "unknown"
+
+
+def test_winning_steps_are_replayed_to_a_stream():
+    solver = PortfolioSolver([("dpll", {})], debug=True)
+    streamed = []
+    solver.stream_steps(streamed.append)
+    solver.solve(UNSAT)
+    assert streamed and streamed[-1]["action_type"] == "complete"
+    assert solver.get_solving_steps() == []
+
+
+@pytest.mark.parametrize("members, message", [
+    ([], "at least one member"),
+    (["bogus"], "Portfolio solver must be one of"),
+    ([("dpll", {"sideways": True})], "Invalid options for dpll"),
+])
+def test_invalid_members_are_rejected(members, message):
+    with pytest.raises(ValueError, match=message):
+        PortfolioSolver(members)
+
+
+def test_failed_solve_stops_the_timer(monkeypatch):
+    solver = PortfolioSolver([("dpll", {})])
+
+    def fail(formula):
+        raise FormulaError("preprocessing failed")
+
+    monkeypatch.setattr(solver, "_preprocess", fail)
+    with pytest.raises(FormulaError):
+        solver.solve(UNSAT)
+    assert solver.stats._start_time is None
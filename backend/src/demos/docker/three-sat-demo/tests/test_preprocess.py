@@ -0,0 +1,78 @@
+import pytest
+
+from scripts.solver import CDCLSolver, DPLLSolver
+from scripts.utils import Formula, FormulaPreprocessor, PackedFormula
+from tests.helpers import random_formulas
+
+
+def preprocess(clauses, num_variables, **options):
+    preprocessor = FormulaPreprocessor(**options)
+    reduced = preprocessor.preprocess(PackedFormula.from_clauses(clauses, num_variables))
+    return preprocessor, reduced
+
+
+def sorted_clauses(formula):
+    return sorted(sorted(lits) for lits in formula)
+
+
+def test_dedup_drops_tautologies_duplicates_and_repeated_literals():
+    preprocessor, reduced = preprocess(
+        [[1, -1, 2], [2, 3], [3, 2], [1, 1, 3]], 3, passes=("dedup",), renumber=False
+    )
+    assert sorted_clauses(reduced) == [[1, 3], [2, 3]]
+    assert preprocessor.report["tautologies"] == 1
+    assert preprocessor.report["duplicate_clauses"] == 1
+
+
+def test_subsumption_and_strengthening():
+    preprocessor, reduced = preprocess(
+        [[1, 2], [1, 2, 3], [-1, 2, 4]], 4, passes=("subsumption",), renumber=False
+    )
+    assert sorted_clauses(reduced) == [[-1, 2, 4], [1, 2]]
+    assert preprocessor.report["subsumed"] == 1
+
+    # (1 ∨ 2) strengthens (¬1 ∨ 2 ∨ 4) to (2 ∨ 4)
+    preprocessor, reduced = preprocess(
+        [[1, 2], [-1, 2, 4]], 4, passes=("strengthening",), renumber=False
+    )
+    assert sorted_clauses(reduced) == [[1, 2], [2, 4]]
+    assert preprocessor.report["strengthened"] == 1
+
+    # Strengthening down to the empty clause proves unsatisfiability
+    _, reduced = preprocess([[1], [-1]], 1, passes=("strengthening",))
+    assert sorted_clauses(reduced) == [[]]
+
+
+@pytest.mark.parametrize("renumber", [True, False])
+def test_elimination_models_reconstruct_to_models_of_the_input(renumber):
+    eliminated = 0
+    for formula in random_formulas(30, 12, ratios=(2.0, 3.0), seed=9):
+        preprocessor = FormulaPreprocessor(renumber=renumber)
+        reduced = preprocessor.preprocess(formula)
+        assert isinstance(reduced, Formula) and len(reduced) <= len(formula)
+        report = preprocessor.report
+        eliminated += report["eliminated_variables"]
+        if renumber:
+            assert reduced.get_all_variables() == set(range(1, report["variables_after"] + 1))
+        else:
+            assert reduced.num_variables == formula.num_variables
+        model = CDCLSolver().solve(reduced)
+        assert model is not None
+        assert formula.is_satisfied_by(preprocessor.reconstruct(model))
+    assert eliminated > 0
+
+
+def test_solvers_report_preprocessing():
+    formula = next(random_formulas(1, 12, ratios=(2.0,)))
+    solver = DPLLSolver(preprocess=FormulaPreprocessor(passes=("dedup", "elimination")))
+    assert formula.is_satisfied_by(solver.solve(formula))
+    report = solver.get_statistics()["preprocessing"]
+    assert report["clauses_before"] == len(formula)
+    assert "preprocessing" not in DPLLSolver().get_statistics()
+
+
+def test_preprocessor_rejects_unknown_passes_and_rounds():
+    with pytest.raises(ValueError, match="Unknown preprocessing pass 'bogus'"):
+        FormulaPreprocessor(passes=("dedup", "bogus"))
+    with pytest.raises(ValueError, match="rounds"):
+        FormulaPreprocessor(rounds=0)
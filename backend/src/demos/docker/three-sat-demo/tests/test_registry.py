@@ -0,0 +1,33 @@
+import pytest
+
+from scripts import entrypoint, portfolio, sweep
+from scripts.solver import COMPLETE_SOLVERS, SOLVERS
+from tests.helpers import loaded_after
+
+
+def test_importing_the_entrypoint_loads_no_optional_solver():
+    modules = ("scripts.portfolio", "scripts.cubes", "scripts.aio")
+    assert loaded_after("import scripts.entrypoint", modules) == []
+    # Names and membership come from the table alone
+    code = "from scripts.entrypoint import SOLVERS\nassert 'cube' in SOLVERS and len(list(SOLVERS)) == 4"
+    assert loaded_after(code, modules) == []
+    code = "from scripts.entrypoint import SOLVERS\nSOLVERS['cube']"
+    assert loaded_after(code, modules) == ["scripts.cubes"]
+
+
+def test_front_ends_select_from_one_registry():
+    assert list(entrypoint.SOLVERS) == ["dpll", "cdcl", "portfolio", "cube"]
+    assert list(portfolio.SOLVERS) == ["dpll", "cdcl", "random", "exhaustive"]
+    assert list(sweep.SOLVERS) == list(COMPLETE_SOLVERS)
+    for front_end in (entrypoint, portfolio, sweep):
+        for name in front_end.SOLVERS:
+            assert front_end.SOLVERS[name] is SOLVERS[name]
+    assert SOLVERS["cube"].__name__ == "CubeAndConquerSolver"
+
+
+def test_unknown_solvers_are_rejected():
+    with pytest.raises(ValueError, match="walksat"):
+        SOLVERS.select("dpll", "walksat")
+    assert "walksat" not in SOLVERS
+    with pytest.raises(KeyError):
+        SOLVERS["walksat"]
@@ -0,0 +1,76 @@
+"""Every solver against brute force on one seeded corpus"""
+import pytest
+
+from scripts.branching import HEURISTICS, PHASES
+from scripts.budget import SolveStatus
+from scripts.cubes import CubeAndConquerSolver
+from scripts.portfolio import PortfolioSolver
+from scripts.solver import CDCLSolver, DPLLSolver, ExhaustiveSATSolver, RandomSATSolver
+from scripts.utils import FormulaPreprocessor
+from tests.helpers import brute_force_model, mixed_width_formulas, random_formulas
+
+CORPUS = [
+    (formula, brute_force_model(formula) is not None)
+    for num_variables in (5, 10)
+    for formula in random_formulas(60, num_variables, seed=num_variables)
+] + [
+    # Unit and binary clauses drive DPLL's implication graph and 2-SAT shortcut
+    (formula, brute_force_model(formula) is not None)
+    for widths in ((2,), (1, 2), (2, 3), (1, 2, 3))
+    for formula in mixed_width_formulas(40, 10, widths, seed=sum(widths))
+]
+
+SOLVERS = {
+    "cdcl": CDCLSolver,
+    # Frequent restarts and reductions exercise the learnt-clause bookkeeping
+    "cdcl-restarts": lambda: CDCLSolver(restart_base=2, learnt_ratio=0.05),
+    # In-process conquering; the worker processes are covered in test_cubes
+    "cube": lambda: CubeAndConquerSolver(workers=0, depth=2),
+    "dpll": DPLLSolver,
+    "exhaustive": ExhaustiveSATSolver,
+    # Preprocessing must keep satisfiability, and reconstructed models must satisfy the input
+    "cdcl-preprocess": lambda: CDCLSolver(preprocess=True),
+    "dpll-preprocess": lambda: DPLLSolver(preprocess=True),
+    "exhaustive-eliminate": lambda: ExhaustiveSATSolver(
+        preprocess=FormulaPreprocessor(passes=("elimination",), renumber=False)
+    ),
+    "dpll-subsume": lambda: DPLLSolver(
+        preprocess=FormulaPreprocessor(passes=("subsumption", "strengthening"))
+    ),
+    # Either member may win the race; a walk that gives up must not end it
+    "portfolio": lambda: PortfolioSolver(
+        [("cdcl", {}), ("random", {"seed": 0, "max_tries": 2, "max_flips": 200})]
+    ),
+    # Local search only gives up on these small instances when they are unsatisfiable
+    "walksat": lambda: RandomSATSolver(seed=0, max_tries=3, max_flips=1000),
+    "probsat": lambda: RandomSATSolver(seed=0, strategy="probsat", max_tries=3, max_flips=1000),
+}
+# Each branching heuristic with its default phase, and each phase on the default heuristic
+SOLVERS.update(
+    (f"dpll-{name}", lambda name=name: DPLLSolver(heuristic=name))
+    for name in HEURISTICS if name != "frequency"
+)
+SOLVERS.update(
+    (f"dpll-{phase}", lambda phase=phase: DPLLSolver(phase=phase))
+    for phase in PHASES if phase != "positive"
+)
+
+
+# Incomplete solvers cannot prove unsatisfiability
+LOCAL_SEARCH = {"walksat", "probsat"}
+
+
+@pytest.mark.parametrize("solver_name", sorted(SOLVERS))
+def test_solver_agrees_with_brute_force(solver_name):
+    for formula, satisfiable in CORPUS:
+        solver = SOLVERS[solver_name]()
+        model = solver.solve(formula)
+        assert (model is not None) == satisfiable, formula
+        if model is not None:
+            assert formula.evaluate(model), formula
+        if satisfiable:
+            assert solver.status is SolveStatus.SAT, formula
+        elif solver_name in LOCAL_SEARCH:
+            assert solver.status is SolveStatus.UNKNOWN, formula
+        else:
+            assert solver.status is SolveStatus.UNSAT, formula
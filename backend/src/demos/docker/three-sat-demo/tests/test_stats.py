@@ -0,0 +1,125 @@
+import random
+import statistics
+
+import pytest
+
+from scripts.solver import CDCLSolver
+from scripts.stats import PhaseProfile, QuantileSketch, RunningStats, StatBuffer, StatisticsAnalyzer
+from tests.helpers import random_formulas
+
+VALUES = [random.Random(0).lognormvariate(0, 1) for _ in range(5000)]
+
+
+def test_running_stats_match_the_statistics_module():
+    left, right = RunningStats(), RunningStats()
+    for value in VALUES[:1200]:
+        left.add(value)
+    for value in VALUES[1200:]:
+        right.add(value)
+    left.merge(right)
+    assert left.count == len(VALUES)
+    assert left.mean == pytest.approx(statistics.fmean(VALUES))
+    assert left.stddev == pytest.approx(statistics.stdev(VALUES))
+    assert (left.minimum, left.maximum) == (min(VALUES), max(VALUES))
+
+
+def test_quantile_sketch_is_exact_for_small_streams_and_close_for_large_ones():
+    small = QuantileSketch()
+    for value in [5.0, 1.0, 3.0]:
+        small.add(value)
+    assert small.quantile(0.5) == 3.0
+
+    sketch, other = QuantileSketch(), QuantileSketch()
+    for index, value in enumerate(VALUES):
+        (sketch if index % 2 else other).add(value)
+    sketch.merge(other)
+    ordered = sorted(VALUES)
+    for q in (0.05, 0.5, 0.95, 0.99):
+        exact = ordered[int(q * len(ordered))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.05)
+    assert len(sketch) == len(VALUES)
+
+
+def test_analyzer_summarizes_and_merges_runs():
+    whole, first, second = StatisticsAnalyzer(), StatisticsAnalyzer(), StatisticsAnalyzer()
+    for index, formula in enumerate(random_formulas(8, 20, seed=2)):
+        solver = CDCLSolver()
+        solver.solve(formula)
+        whole.add_result("cdcl", solver.stats)
+        (first if index % 2 else second).add_result("cdcl", solver.stats)
+    first.merge(second)
+    summary, merged = whole.get_summary("cdcl"), first.get_summary("cdcl")
+    assert summary["total_runs"] == merged["total_runs"] == 8
+    assert merged["avg_decisions"] == pytest.approx(summary["avg_decisions"])
+    assert whole.get_summary("dpll") == {}
+    histogram = whole.get_histogram("cdcl", "learned_clause_sizes")
+    assert sum(histogram.values()) == whole.aggregates["cdcl"].lists["learned_clause_sizes"].moments.count
+
+
+def test_removed_results_points_to_aggregates():
+    with pytest.raises(AttributeError, match="aggregates"):
+        StatisticsAnalyzer().results
+
+
+def test_stat_buffer_modes_count_the_same_values():
+    values = [3, 0, 7, 3, 3, 12, 1]
+    plain, counter = StatBuffer(), StatBuffer(mode="counter")
+    histogram = StatBuffer(mode="histogram", low=0.0, bin_width=4.0, num_bins=2)
+    for buffer in (plain, counter, histogram):
+        buffer.extend(values)
+        assert len(buffer) == len(values)
+    assert plain == values and plain[2] == 7
+    assert counter.counts() == plain.counts() == {0: 1, 1: 1, 3: 3, 7: 1, 12: 1}
+    # 7 and 12 fall past the last bin and are clamped into it
+    assert histogram.counts() == {0.0: 5, 4.0: 2}
+    assert sorted(counter) == sorted(values)
+    with pytest.raises(TypeError):
+        counter[0]
+    with pytest.raises(ValueError):
+        counter.append(-1)
+
+
+def test_stat_buffer_clears_in_place():
+    buffer = StatBuffer()
+    append = buffer.append
+    append(4)
+    view = buffer.to_numpy()
+    assert view.tolist() == [4]
+    del view
+    buffer.clear()
+    append(5)
+    assert buffer == [5]
+
+    counter = StatBuffer(mode="counter")
+    counter.extend([2, 2, 9])
+    counts = counter.to_numpy()
+    counter.clear()
+    assert len(counter) == 0 and counts.sum() == 0
+
+
+def test_solver_statistics_reuse_their_buffers_across_solves():
+    solver = CDCLSolver()
+    buffer = solver.stats.stats["learned_clause_sizes"].value
+    for formula in random_formulas(3, 30, ratios=(4.26,), seed=5):
+        solver.solve(formula)
+        assert solver.stats.stats["learned_clause_sizes"].value is buffer
+        assert len(buffer) == solver.stats.stats["learned_clauses"].value
+
+
+def test_phase_profile_counts_calls_even_when_they_raise():
+    profile = PhaseProfile()
+    double = profile.wrap("double", lambda value: 2 * value)
+    fail = profile.wrap("fail", lambda: 1 / 0)
+    assert [double(value) for value in range(3)] == [0, 2, 4]
+    with pytest.raises(ZeroDivisionError):
+        fail()
+    report = profile.report()
+    assert report["double"]["calls"] == 3 and report["fail"]["calls"] == 1
+    assert report["double"]["time_ms"] >= 0
+
+    # Clearing keeps the wrappers attached to the same entries
+    profile.clear()
+    double(1)
+    report = profile.report()
+    assert report["double"]["calls"] == 1
+    assert report["fail"] == {"calls": 0, "time_ms": 0.0}
@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from scripts.solver import DPLLSolver
+from scripts.stats import DECISION_ACTIONS, SUMMARY_ACTIONS, StepLog
+from scripts.utils import FormulaSimplifier
+from tests.helpers import random_formulas
+
+ACTIONS = ["branching", "unit_propagation", "backtrack", "pure_literal"]
+
+
+def render(trail):
+    return " ".join(map(str, trail))
+
+
+def drive(log: StepLog, num_steps: int = 200, seed: int = 2):
+    """Record a random run of assigns, undos and flips; return every step as it should replay"""
+    rng = random.Random(seed)
+    log.bind(render)
+    trail, expected = [], []
+    for step in range(1, num_steps + 1):
+        operation = rng.random()
+        if operation < 0.5:
+            var = rng.choice([v for v in range(1, 30) if v not in {abs(lit) for lit in trail}])
+            lit = var if rng.random() < 0.5 else -var
+            log.assign(lit, satisfied=[step], shortened=[step + 1])
+            trail.append(lit)
+        elif operation < 0.7:
+            length = rng.randrange(len(trail) + 1)
+            log.undo(length)
+            del trail[length:]
+        elif trail:
+            position = rng.randrange(len(trail))
+            log.flip(abs(trail[position]))
+            trail[position] = -trail[position]
+        action = "start" if step == 1 else "complete" if step == num_steps else rng.choice(ACTIONS)
+        explicit = {1: True} if step % 17 == 0 else None
+        log.record(step, len(trail), action, f"step {step}", assignments=explicit)
+        expected.append({
+            "step_number": step,
+            "depth": len(trail),
+            "action_type": action,
+            "description": f"step {step}",
+            "formula_state": render(trail),
+            "assignments": explicit or {abs(lit): lit > 0 for lit in trail},
+            "success": True,
+        })
+    return expected
+
+
+def test_replay_and_snapshots_match_the_recorded_trail():
+    log = StepLog(checkpoint_interval=4)
+    expected = drive(log)
+    steps = log.to_list()
+    assert steps == expected
+    for index in random.Random(0).sample(range(len(steps)), 40) + [len(steps) - 1]:
+        assert log.snapshot(index) == steps[index]
+    assert log.snapshot(-1) == steps[-1]
+
+
+@pytest.mark.parametrize("level, kept_actions", [
+    ("summary", SUMMARY_ACTIONS),
+    ("decisions", DECISION_ACTIONS),
+    ("off", frozenset()),
+])
+def test_levels_keep_their_action_types(level, kept_actions):
+    log = StepLog(checkpoint_interval=4)
+    log.configure(level=level)
+    expected = [step for step in drive(log) if step["action_type"] in kept_actions]
+    assert log.to_list() == expected
+    assert log.truncated == 200 - len(expected)
+
+
+def test_head_and_tail_cap_the_log():
+    log = StepLog(checkpoint_interval=4)
+    log.configure(head=5, tail=3)
+    expected = drive(log)
+    assert log.to_list() == expected[:5] + expected[-3:]
+    assert log.truncated == 200 - 8
+
+
+def test_sampling_is_seeded_and_keeps_the_ends():
+    def sampled():
+        log = StepLog(checkpoint_interval=4)
+        log.configure(sample_rate=0.3, seed=1)
+        expected = {step["step_number"]: step for step in drive(log)}
+        steps = log.to_list()
+        assert all(step == expected[step["step_number"]] for step in steps)
+        return [step["step_number"] for step in steps]
+
+    kept = sampled()
+    assert kept == sampled()
+    assert kept[0] == 1 and kept[-1] == 200
+    assert 20 < len(kept) < 120
+
+
+@pytest.mark.parametrize("policy", [{"level": "all"}, {"head": -1}, {"sample_rate": 0.0}])
+def test_invalid_policies_are_rejected(policy):
+    with pytest.raises(ValueError):
+        StepLog().configure(**policy)
+
+
+def test_policy_survives_solver_resets():
+    solver = DPLLSolver(debug=True)
+    solver.stats.configure_step_log(level="summary")
+    for formula in random_formulas(2, 8, ratios=(4.26,), seed=4):
+        solver.solve(formula)
+        actions = [step["action_type"] for step in solver.get_solving_steps()]
+        assert set(actions) <= SUMMARY_ACTIONS and actions[0] == "start"
+        assert solver.get_statistics()["truncated_steps"] > 0
+
+
+def test_residual_rendering_matches_the_simplifier():
+    rng = random.Random(3)
+    for formula in random_formulas(20, 10, seed=3):
+        packed = formula.pack()
+        variables = rng.sample(range(1, 11), rng.randrange(11))
+        trail = [var if rng.random() < 0.5 else -var for var in variables]
+        simplified = FormulaSimplifier.simplify_formula(formula, {abs(l): l > 0 for l in trail})
+        assert packed.render_residual(trail) == str(simplified)
+
+
+def test_dpll_steps_show_the_residual_formula():
+    formula = next(random_formulas(1, 8, ratios=(4.26,), seed=4))
+    solver = DPLLSolver(debug=True)
+    solver.solve(formula)
+    steps = solver.get_solving_steps()
+    assert steps
+    for step in steps[1:-1]:
+        simplified = FormulaSimplifier.simplify_formula(formula, step["assignments"])
+        assert step["formula_state"] == str(simplified)
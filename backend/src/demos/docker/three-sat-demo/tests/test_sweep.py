@@ -0,0 +1,33 @@
+import pytest
+
+from scripts.sweep import COST_METRICS, SOLVERS, PhaseTransitionSweep, wilson_interval
+
+
+def test_sweep_offers_only_complete_solvers():
+    assert "random" not in SOLVERS
+    assert set(COST_METRICS) == set(SOLVERS)
+    with pytest.raises(ValueError, match="Solver must be one of"):
+        PhaseTransitionSweep(10, solver="random")
+
+
+@pytest.mark.parametrize("successes, trials", [(0, 10), (3, 10), (10, 10), (250, 400)])
+def test_wilson_interval_brackets_the_estimate(successes, trials):
+    low, high = wilson_interval(successes, trials, 1.96)
+    assert 0.0 <= low <= successes / trials + 1e-12
+    assert successes / trials - 1e-12 <= high <= 1.0
+    assert wilson_interval(0, 0, 1.96) == (0.0, 1.0)
+
+
+def test_sweep_curve_is_seeded_and_falls_across_the_transition():
+    def sweep(workers):
+        return PhaseTransitionSweep(
+            10, (2.0, 8.0), 3, solver="cdcl", min_samples=10, max_samples=40,
+            batch_size=10, ci_width=0.3, workers=workers, seed=1,
+        ).run()
+
+    curves = sweep(0)
+    assert curves == sweep(2)
+    assert all(10 <= samples <= 40 for samples in curves["samples"])
+    assert curves["sat_probability"][0] >= 0.9 >= 0.1 >= curves["sat_probability"][-1]
+    for low, p, high in zip(curves["ci_low"], curves["sat_probability"], curves["ci_high"]):
+        assert low - 1e-12 <= p <= high + 1e-12
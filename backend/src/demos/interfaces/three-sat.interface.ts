@@ -24,7 +24,7 @@ export interface SolvingStatistics {
 
 export interface ThreeSatResult {
   formula: string;
-  satisfiable: boolean;
+  satisfiable: boolean | null;
   assignment: Record<string, boolean> | null;
   num_variables: number;
   num_clauses: number;
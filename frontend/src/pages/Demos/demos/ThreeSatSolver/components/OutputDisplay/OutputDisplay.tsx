@@ -1,7 +1,15 @@
 import React from 'react';
 
 import { motion } from 'framer-motion';
-import { AlertCircle, CheckCircle, Info, Loader2, Terminal, XCircle } from 'lucide-react';
+import {
+  AlertCircle,
+  CheckCircle,
+  HelpCircle,
+  Info,
+  Loader2,
+  Terminal,
+  XCircle,
+} from 'lucide-react';
 
 import { defaultTransition } from '@/utils/animations/transitions';
 import { fadeIn, fadeInUp } from '@/utils/animations/variants';
@@ -17,7 +25,10 @@ interface OutputDisplayProps {
 }
 
 export const OutputDisplay: React.FC<OutputDisplayProps> = ({ output, error, isLoading }) => {
-  const renderStatusIcon = (satisfiable: boolean) => {
+  const renderStatusIcon = (satisfiable: boolean | null) => {
+    if (satisfiable === null) {
+      return <HelpCircle className="status-icon unknown" size={24} />;
+    }
     return satisfiable ? (
       <CheckCircle className="status-icon success" size={24} />
     ) : (
@@ -25,23 +36,36 @@ export const OutputDisplay: React.FC<OutputDisplayProps> = ({ output, error, isL
     );
   };
 
+  const renderStatusText = (satisfiable: boolean | null) => {
+    if (satisfiable === null) {
+      return (
+        <>
+          <h4>Unknown (budget exhausted)</h4>
+          <p>The solver stopped before proving the formula either way</p>
+        </>
+      );
+    }
+    return (
+      <>
+        <h4>{satisfiable ? 'Formula is Satisfiable' : 'Formula is Unsatisfiable'}</h4>
+        <p>{satisfiable ? 'A valid assignment has been found' : 'No valid assignment exists'}</p>
+      </>
+    );
+  };
+
   const renderOutput = () => {
     if (!output) return null;
 
     const { formula, satisfiable, assignment, num_variables, num_clauses, solving_process } =
       output;
+    const status = satisfiable === null ? 'unknown' : satisfiable ? 'success' : 'error';
 
     return (
       <motion.div className="output-content" variants={fadeInUp} transition={defaultTransition}>
         {/* Status Banner */}
-        <div className={`status-banner ${satisfiable ? 'success' : 'error'}`}>
+        <div className={`status-banner ${status}`}>
           {renderStatusIcon(satisfiable)}
-          <div className="status-text">
-            <h4>{satisfiable ? 'Formula is Satisfiable' : 'Formula is Unsatisfiable'}</h4>
-            <p>
-              {satisfiable ? 'A valid assignment has been found' : 'No valid assignment exists'}
-            </p>
-          </div>
+          <div className="status-text">{renderStatusText(satisfiable)}</div>
         </div>
 
         {/* Formula Statistics */}
@@ -62,8 +62,8 @@ export interface SolvingProcess {
 export interface SolverOutput {
   /** The generated 3-SAT formula */
   formula: string;
-  /** Whether the formula is satisfiable */
-  satisfiable: boolean;
+  /** Whether the formula is satisfiable (null if the solver stopped without an answer) */
+  satisfiable: boolean | null;
   /** Variable assignments that satisfy the formula (null if unsatisfiable) */
   assignment: Record<string, boolean> | null;
   /** Number of variables in the formula */